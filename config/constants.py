@@ -13,6 +13,7 @@ XSUSHI = "0x8798249c2e607446efb7ad49ec89dd1865ff4272"
 MSTABLE_VOTER_PROXY = "0x10D96b1Fd46Ce7cE092aA905274B8eD9d4585A6E"
 MTA = "0xa3bed4e1c75d00fa6f4e5e6922db7261b5e9acd2"
 REGISTRY_V2 = "0xdc602965F3e5f1e7BAf2446d5564b407d5113A06"
+MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
 
 ETH_BADGER = "0x3472A5A71965499acd81997a54BBA8D852C6E53d"
@@ -272,6 +273,12 @@ NODE_URL_SECRET_NAMES = {
     Network.Fantom: [{"name": "chainstack/ftm-url", "key": "NODE_URL"}],
 }
 
+# Public rpcs added to the node pool next to the nodes in NODE_URL_SECRET_NAMES
+PUBLIC_NODE_URLS = {
+    Network.Arbitrum: ["https://arb1.arbitrum.io/rpc"],
+    Network.Fantom: ["https://rpc.ftm.tools/"],
+}
+
 ABI_DIRS = {
     Network.Ethereum: "eth",
     Network.Polygon: "poly",
@@ -1,6 +1,5 @@
 import sys
 
-from web3 import Web3
 from web3 import contract
 
 from config.constants import MULTICHAIN_CONFIG
@@ -9,7 +8,9 @@ from src.aws import get_secret
 from src.earner import Earner
 from src.json_logger import exception_logging
 from src.json_logger import logger
+from src.rpc_metrics import set_job
 from src.settings.earn_settings import ARB_EARN_SETTINGS
+from src.utils import get_healthy_node
 from src.web3_utils import get_strategies_and_vaults
 
 sys.excepthook = exception_logging
@@ -24,10 +25,9 @@ def safe_earn(earner: Earner, vault: contract, strategy: contract, strategy_name
 
 
 if __name__ == "__main__":
+    set_job("arbitrum_earn")
     for chain in [Network.Arbitrum]:
-        # node_url = get_secret("alchemy/arbitrum-node-url", "ARBITRUM_NODE_URL")
-        node_url = "https://arb1.arbitrum.io/rpc"
-        node = Web3(Web3.HTTPProvider(node_url))
+        node = get_healthy_node(chain)
 
         strategies, vaults = get_strategies_and_vaults(node, chain)
 
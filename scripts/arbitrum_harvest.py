@@ -2,7 +2,6 @@ import sys
 import time
 
 from hexbytes import HexBytes
-from web3 import Web3
 from web3 import contract
 
 from config.constants import MULTICHAIN_CONFIG
@@ -11,7 +10,9 @@ from src.aws import get_secret
 from src.general_harvester import GeneralHarvester
 from src.json_logger import exception_logging
 from src.json_logger import logger
+from src.rpc_metrics import set_job
 from src.settings.harvest_settings import ARB_HARVEST_SETTINGS
+from src.utils import get_healthy_node
 from src.web3_utils import get_strategies_and_vaults
 
 sys.excepthook = exception_logging
@@ -45,16 +46,15 @@ def safe_harvest(
 
 
 if __name__ == "__main__":
+    set_job("arbitrum_harvest")
     # Load secrets
     keeper_key = get_secret("keepers/rebaser/keeper-pk", "KEEPER_KEY")
     keeper_address = get_secret("keepers/rebaser/keeper-address", "KEEPER_ADDRESS")
-    # node_url = get_secret("alchemy/arbitrum-node-url", "ARBITRUM_NODE_URL")
-    node_url = "https://arb1.arbitrum.io/rpc"
     discord_url = get_secret(
         "keepers/harvester/arbitrum/info-webhook", "DISCORD_WEBHOOK_URL"
     )
 
-    web3 = Web3(Web3.HTTPProvider(node_url))
+    web3 = get_healthy_node(Network.Arbitrum)
 
     harvester = GeneralHarvester(
         web3=web3,
@@ -8,6 +8,7 @@ from src.aws import get_secret
 from src.general_harvester import GeneralHarvester
 from src.json_logger import exception_logging
 from src.json_logger import logger
+from src.rpc_metrics import set_job
 from src.utils import get_abi
 from src.utils import get_healthy_node
 
@@ -27,6 +28,7 @@ def safe_harvest(harvester, strategy_name, strategy) -> str:
 
 
 if __name__ == "__main__":
+    set_job("arbitrum_manual_harvest")
     # Load secrets
     keeper_key = get_secret("keepers/rebaser/keeper-pk", "KEEPER_KEY")
     keeper_address = get_secret("keepers/rebaser/keeper-address", "KEEPER_ADDRESS")
@@ -10,6 +10,7 @@ from src.aws import get_secret
 from src.earner import Earner
 from src.json_logger import exception_logging
 from src.json_logger import logger
+from src.rpc_metrics import set_job
 from src.utils import get_abi
 from src.utils import get_healthy_node
 
@@ -17,6 +18,7 @@ sys.excepthook = exception_logging
 
 
 if __name__ == "__main__":
+    set_job("earn_locked_cvx")
     chain = Network.Ethereum
     web3 = get_healthy_node(chain)
 
@@ -1,12 +1,15 @@
 import sys
 
 from config.constants import MULTICHAIN_CONFIG
+from config.constants import NODE_URL_SECRET_NAMES
 from config.enums import Network
 from src.aws import get_secret
+from src.aws import prefetch_secrets
 from src.data_classes.contract import Contract
 from src.earner import Earner
 from src.json_logger import exception_logging
 from src.json_logger import logger
+from src.rpc_metrics import set_job
 from src.settings.earn_settings import ETH_EARN_SETTINGS
 from src.tx_utils import get_latest_base_fee
 from src.utils import get_healthy_node
@@ -24,9 +27,21 @@ def safe_earn(earner: Earner, vault: Contract, strategy: Contract):
 
 
 if __name__ == "__main__":
+    set_job("eth_earn")
+    prefetch_secrets(
+        [node["name"] for node in NODE_URL_SECRET_NAMES[Network.Ethereum]]
+        + [
+            "keepers/rebaser/keeper-pk",
+            "keepers/rebaser/keeper-address",
+            "keepers/info-webhook",
+            "keepers/alerts-webhook",
+        ]
+    )
     node = get_healthy_node(Network.Ethereum)
 
-    strategies, vaults = get_strategies_and_vaults(node, Network.Ethereum)
+    strategies, vaults = get_strategies_and_vaults(
+        node, Network.Ethereum, use_multicall=True
+    )
 
     keeper_key = get_secret("keepers/rebaser/keeper-pk", "KEEPER_KEY")
     keeper_address = get_secret("keepers/rebaser/keeper-address", "KEEPER_ADDRESS")
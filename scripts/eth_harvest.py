@@ -1,6 +1,9 @@
+import os
 import sys
-import time
+from typing import List
 
+from eth_account.account import Account
+from flashbots import flashbot
 from web3 import Web3
 from web3 import contract
 
@@ -9,15 +12,18 @@ from config.constants import ETH_KEEPER_ACL
 from config.constants import GWEI_150
 from config.constants import GWEI_80
 from config.constants import MULTICHAIN_CONFIG
-from config.constants import SECONDS_PER_BLOCK
 from config.enums import Network
 from src.aws import get_secret
+from src.aws import prefetch_secrets
 from src.data_classes.contract import Contract
 from src.general_harvester import GeneralHarvester
+from src.harvest_pipeline import HarvestPipeline
 from src.json_logger import exception_logging
 from src.json_logger import logger
 from src.misc_utils import hours
 from src.misc_utils import seconds_to_blocks
+from src.rpc_metrics import instrument
+from src.rpc_metrics import set_job
 from src.settings.harvest_settings import ETH_HARVEST_SETTINGS
 from src.tx_utils import get_latest_base_fee
 from src.utils import get_abi
@@ -28,14 +34,14 @@ HOURS_24 = hours(24)
 HOURS_72 = hours(72)
 HOURS_96 = hours(96)
 HOURS_120 = hours(120)
-
-BLOCKS_TO_SLEEP = 2
+# Send harvests as flashbots bundles, signed with the flashbots signer secret
+USE_FLASHBOTS = os.getenv("USE_FLASHBOTS", "false").lower() == "true"
 
 rewards_manager_strategies = {}
 sys.excepthook = exception_logging
 
 
-def conditional_harvest(harvester: GeneralHarvester, strategy: Contract) -> str:
+def is_harvest_due(harvester: GeneralHarvester, strategy: Contract) -> bool:
     latest_base_fee = get_latest_base_fee(harvester.web3)
     logger.info(f"Checking harvests for {strategy.name} {strategy.address}")
 
@@ -43,16 +49,36 @@ def conditional_harvest(harvester: GeneralHarvester, strategy: Contract) -> str:
         strategy.contract, HOURS_96
     ) and latest_base_fee < int(GWEI_80):
         logger.info(f"Been longer than 96 hours and base fee < 80 for {strategy.name}")
-        res = safe_harvest(harvester, strategy)
-        logger.info(res)
+        return True
     elif harvester.is_time_to_harvest(strategy.contract) and latest_base_fee < int(
         GWEI_150
     ):
         logger.info(
             f"Been longer than 120 hours harvest no matter what for {strategy.name}"
         )
-        res = safe_harvest(harvester, strategy)
-        logger.info(res)
+        return True
+    return False
+
+
+def get_strategies_to_harvest(web3: Web3) -> List[Contract]:
+    strategies, vaults = get_strategies_and_vaults(
+        web3, Network.Ethereum, use_multicall=True
+    )
+
+    to_harvest = {
+        vault.address: strategy for strategy, vault in zip(strategies, vaults)
+    }
+
+    return [
+        to_harvest[vault_address]
+        for vault_address in to_harvest.keys()
+        if (
+            # Restitution vaults (rembadger) don't have underlying strategy, waste of gas
+            vault_address not in ETH_HARVEST_SETTINGS.restitution_vaults
+            # Rewards manager vaults have to be handled separately
+            and vault_address not in ETH_HARVEST_SETTINGS.rewards_manager_vaults
+        )
+    ]
 
 
 def conditional_harvest_rewards_manager(
@@ -81,23 +107,32 @@ def conditional_harvest_rewards_manager(
             logger.error(f"Error running {strategy_name} harvest: {e}")
 
 
-def safe_harvest(harvester: GeneralHarvester, strategy: Contract) -> str:
-    logger.info(f"+-----Harvesting {strategy.name} {strategy.address}-----+")
-
-    try:
-        harvester.harvest(strategy.contract, strategy_name=strategy.name)
-        return "Success!"
-    except Exception as e:
-        logger.error(f"Error running {strategy.name} harvest: {e}")
-
-
 if __name__ == "__main__":
+    set_job("eth_harvest")
+    prefetch_secrets(
+        [
+            "keepers/rebaser/keeper-pk",
+            "keepers/rebaser/keeper-address",
+            "keepers/info-webhook",
+            "keepers/alerts-webhook",
+            "keepers/etherscan",
+        ]
+        + (["keepers/flashbots/test-signer"] if USE_FLASHBOTS else [])
+    )
     keeper_key = get_secret("keepers/rebaser/keeper-pk", "KEEPER_KEY")
     keeper_address = get_secret("keepers/rebaser/keeper-address", "KEEPER_ADDRESS")
     node_url = "https://rpc.flashbots.net"
     discord_url = get_secret("keepers/info-webhook", "DISCORD_WEBHOOK_URL")
 
-    web3 = Web3(Web3.HTTPProvider(node_url))
+    web3 = instrument(Web3(Web3.HTTPProvider(node_url)))
+    if USE_FLASHBOTS:
+        # Account which signifies our identity to the flashbots network
+        flashbot(
+            web3,
+            Account.from_key(
+                get_secret("keepers/flashbots/test-signer", "FLASHBOTS_SIGNER_KEY")
+            ),
+        )
 
     harvester = GeneralHarvester(
         web3=web3,
@@ -105,28 +140,18 @@ if __name__ == "__main__":
         keeper_address=keeper_address,
         keeper_key=keeper_key,
         base_oracle_address=ETH_ETH_USD_CHAINLINK,
-        use_flashbots=False,
+        use_flashbots=USE_FLASHBOTS,
         discord_url=discord_url,
     )
 
-    strategies, vaults = get_strategies_and_vaults(web3, Network.Ethereum)
-
-    to_harvest = {
-        vault.address: strategy for strategy, vault in zip(strategies, vaults)
-    }
-
-    for vault_address in to_harvest.keys():
-        if (
-            # Restitution vaults (rembadger) don't have underlying strategy, waste of gas
-            vault_address not in ETH_HARVEST_SETTINGS.restitution_vaults
-            # Rewards manager vaults have to be handled separately
-            and vault_address not in ETH_HARVEST_SETTINGS.rewards_manager_vaults
-        ):
-            strategy: Contract = to_harvest[vault_address]
-            conditional_harvest(harvester, strategy)
+    strategies_to_harvest = get_strategies_to_harvest(web3)
+    # Read state of all strategies up front in a few multicall round-trips
+    harvester.prefetch([strategy.contract for strategy in strategies_to_harvest])
 
-            # Sleep for 2 blocks in between harvests
-            time.sleep(BLOCKS_TO_SLEEP * SECONDS_PER_BLOCK)
+    HarvestPipeline(harvester, bundle=harvester.use_flashbots).run(
+        strategies_to_harvest,
+        lambda strategy: is_harvest_due(harvester, strategy),
+    )
 
     # Harvest rewards manager strategies
     rewards_manager = harvester.web3.eth.contract(
@@ -149,7 +174,5 @@ if __name__ == "__main__":
         )
         strategy_name = strategy.functions.getName().call()
 
+        # Sequential, harvest_rewards_manager swaps the harvester's ACL
         conditional_harvest_rewards_manager(harvester, strategy_name, strategy)
-
-        # Sleep for 2 blocks in between harvests
-        time.sleep(BLOCKS_TO_SLEEP * SECONDS_PER_BLOCK)
@@ -0,0 +1,90 @@
+import os
+import sys
+
+from web3 import Web3
+
+from config.constants import ETH_ETH_USD_CHAINLINK
+from config.constants import ETH_KEEPER_ACL
+from scripts.eth_harvest import get_strategies_to_harvest
+from scripts.eth_harvest import is_harvest_due
+from src import metrics
+from src.aws import get_secret
+from src.aws import prefetch_secrets
+from src.general_harvester import GeneralHarvester
+from src.harvest_pipeline import HarvestPipeline
+from src.head_subscriber import HeadSubscriber
+from src.json_logger import exception_logging
+from src.json_logger import logger
+from src.rpc_metrics import instrument
+from src.rpc_metrics import set_job
+from src.run_digest import DIGEST_MODE
+from src.run_digest import get_run_digest
+
+# Seconds before a strategy whose harvest attempt didn't land is tried again,
+# so a failing send isn't repeated on every block
+RETRY_COOLDOWN = int(os.getenv("HARVEST_RETRY_COOLDOWN", 600))
+
+sys.excepthook = exception_logging
+
+
+# Long-running version of eth_harvest: harvest conditions are evaluated on every
+# new block instead of on a cron tick. Rewards manager strategies are left to the
+# cron job.
+if __name__ == "__main__":
+    set_job("eth_harvest_heads")
+    ws_url = os.getenv("NODE_WS_URL")
+    if not ws_url:
+        logger.error("NODE_WS_URL is not set, can't subscribe to new heads")
+        sys.exit(1)
+
+    prefetch_secrets(
+        [
+            "keepers/rebaser/keeper-pk",
+            "keepers/rebaser/keeper-address",
+            "keepers/info-webhook",
+            "keepers/alerts-webhook",
+            "keepers/etherscan",
+        ]
+    )
+    keeper_key = get_secret("keepers/rebaser/keeper-pk", "KEEPER_KEY")
+    keeper_address = get_secret("keepers/rebaser/keeper-address", "KEEPER_ADDRESS")
+    node_url = "https://rpc.flashbots.net"
+    discord_url = get_secret("keepers/info-webhook", "DISCORD_WEBHOOK_URL")
+
+    web3 = instrument(Web3(Web3.HTTPProvider(node_url)))
+
+    harvester = GeneralHarvester(
+        web3=web3,
+        keeper_acl=ETH_KEEPER_ACL,
+        keeper_address=keeper_address,
+        keeper_key=keeper_key,
+        base_oracle_address=ETH_ETH_USD_CHAINLINK,
+        use_flashbots=False,
+        discord_url=discord_url,
+    )
+    strategies_to_harvest = get_strategies_to_harvest(web3)
+    pipeline = HarvestPipeline(harvester, bundle=harvester.use_flashbots)
+    # Block timestamp of the last harvest attempt of each strategy
+    last_attempts = {}
+
+    def on_head(block):
+        # Time and base fee checks only need the pushed header
+        due = [
+            strategy
+            for strategy in strategies_to_harvest
+            if block["timestamp"] - last_attempts.get(strategy.address, 0)
+            >= RETRY_COOLDOWN
+            and is_harvest_due(harvester, strategy)
+        ]
+        logger.info(f"{len(due)} strategies due at block {block['number']}")
+        if not due:
+            return
+        for strategy in due:
+            last_attempts[strategy.address] = block["timestamp"]
+        harvester.prefetch([strategy.contract for strategy in due])
+        pipeline.run(due)
+        if DIGEST_MODE:
+            get_run_digest().send()
+
+    metrics.serve()
+    HeadSubscriber(ws_url, web3, on_head).run()
@@ -6,6 +6,7 @@ from config.enums import Network
 from src.aws import get_secret
 from src.json_logger import exception_logging
 from src.json_logger import logger
+from src.rpc_metrics import set_job
 from src.utils import get_healthy_node
 from src.vester import Vester
 
@@ -13,6 +14,7 @@ sys.excepthook = exception_logging
 
 
 if __name__ == "__main__":
+    set_job("eth_tree_vest")
     chain = Network.Ethereum
 
     keeper_key = get_secret("keepers/rebaser/keeper-pk", "KEEPER_KEY")
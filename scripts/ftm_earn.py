@@ -1,7 +1,5 @@
 import sys
 
-from web3 import Web3
-
 from config.constants import FTM_OXD_BVEOXD_VAULT
 from config.constants import FTM_VAULTS_1
 from config.constants import FTM_VAULTS_15
@@ -12,6 +10,8 @@ from src.aws import get_secret
 from src.earner import Earner
 from src.json_logger import exception_logging
 from src.json_logger import logger
+from src.rpc_metrics import set_job
+from src.utils import get_healthy_node
 from src.web3_utils import get_strategy_from_vault
 
 INVALID_VAULTS = [FTM_OXD_BVEOXD_VAULT]
@@ -30,9 +30,9 @@ def safe_earn(earner, vault, strategy):
 
 
 if __name__ == "__main__":
+    set_job("ftm_earn")
     for chain in [Network.Fantom]:
-        node_url = "https://rpc.ftm.tools/"
-        node = Web3(Web3.HTTPProvider(node_url))
+        node = get_healthy_node(chain)
 
         keeper_key = get_secret("keepers/rebaser/keeper-pk", "KEEPER_KEY")
         keeper_address = get_secret("keepers/rebaser/keeper-address", "KEEPER_ADDRESS")
@@ -1,8 +1,6 @@
 import sys
 import time
 
-from web3 import Web3
-
 from config.constants import FTM_VAULTS_1
 from config.constants import FTM_VAULTS_15
 from config.constants import MULTICHAIN_CONFIG
@@ -13,6 +11,8 @@ from src.general_harvester import GeneralHarvester
 from src.json_logger import exception_logging
 from src.json_logger import logger
 from src.misc_utils import hours
+from src.rpc_metrics import set_job
+from src.utils import get_healthy_node
 from src.web3_utils import get_strategy_from_vault
 
 HOURS_12 = hours(12)
@@ -22,15 +22,15 @@ sys.excepthook = exception_logging
 
 
 if __name__ == "__main__":
+    set_job("ftm_harvest")
     # Load secrets
     keeper_key = get_secret("keepers/rebaser/keeper-pk", "KEEPER_KEY")
     keeper_address = get_secret("keepers/rebaser/keeper-address", "KEEPER_ADDRESS")
-    node_url = "https://rpc.ftm.tools/"
     discord_url = get_secret(
         "keepers/harvester/fantom/info-webhook", "DISCORD_WEBHOOK_URL"
     )
 
-    web3 = Web3(Web3.HTTPProvider(node_url))
+    web3 = get_healthy_node(Network.Fantom)
 
     harvester = GeneralHarvester(
         web3=web3,
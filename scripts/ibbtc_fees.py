@@ -5,12 +5,14 @@ from src.aws import get_secret
 from src.ibbtc_fee_collector import ibBTCFeeCollector
 from src.json_logger import exception_logging
 from src.json_logger import logger
+from src.rpc_metrics import set_job
 from src.utils import get_healthy_node
 
 sys.excepthook = exception_logging
 
 
 if __name__ == "__main__":
+    set_job("ibbtc_fees")
     keeper_key = get_secret("keepers/rebaser/keeper-pk", "KEEPER_KEY")
     keeper_address = get_secret("keepers/rebaser/keeper-address", "KEEPER_ADDRESS")
     web3 = get_healthy_node(Network.Ethereum)
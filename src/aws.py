@@ -1,20 +1,95 @@
 import base64
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 import boto3
 from botocore.exceptions import ClientError
 
+from src.json_logger import logger
+
 AWS_ERR_CODES = [
     "DecryptionFailureException",
     "InternalServiceErrorException",
     "InvalidParameterException",
     "ResourceNotFoundException",
 ]
+DEFAULT_REGION = "us-west-1"
+# Seconds a fetched secret stays cached, cached for the process lifetime if unset
+SECRETS_CACHE_TTL = os.getenv("SECRETS_CACHE_TTL")
+MAX_PREFETCH_WORKERS = 8
+
+# (secret_name, region_name) -> (fetched at, decoded secret json)
+_secrets: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+
+
+@lru_cache(maxsize=None)
+def _get_client(region_name: str):
+    """Secrets Manager client, created once per region."""
+    session = boto3.session.Session()
+    return session.client(
+        service_name="secretsmanager",
+        region_name=region_name,
+    )
+
+
+def _is_fresh(fetched_at: float) -> bool:
+    return SECRETS_CACHE_TTL is None or time.monotonic() - fetched_at < float(
+        SECRETS_CACHE_TTL
+    )
+
+
+def get_secret_json(
+    secret_name: str, region_name: str = DEFAULT_REGION
+) -> Optional[dict]:
+    """Retrieves and decodes the whole secret json from AWS secretsmanager,
+    serving it from the in-process cache when possible.
+
+    Args:
+        secret_name (str): secret name in secretsmanager
+        region_name (str, optional): AWS region name for secret. Defaults to "us-west-1".
+    Raises:
+        e: ClientError with one of AWS_ERR_CODES, see get_secret.
+    Returns:
+        dict: decoded secret, None if the secret couldn't be fetched
+    """
+    cached = _secrets.get((secret_name, region_name))
+    if cached and _is_fresh(cached[0]):
+        return cached[1]
+
+    client = _get_client(region_name)
+
+    # In this sample we only handle the specific exceptions for the 'GetSecretValue' API.
+    # See https://docs.aws.amazon.com/secretsmanager/latest/apireference/API_GetSecretValue.html
+    # We rethrow the exception by default.
+    try:
+        get_secret_value_response = client.get_secret_value(SecretId=secret_name)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in AWS_ERR_CODES:
+            raise e
+        return None
+
+    # Decrypts secret using the associated KMS CMK.
+    # Depending on whether the secret is a string
+    # or binary, one of these fields will be populated.
+    if "SecretString" in get_secret_value_response:
+        secret = json.loads(get_secret_value_response["SecretString"])
+    else:
+        secret = json.loads(
+            base64.b64decode(get_secret_value_response["SecretBinary"]).decode("utf-8")
+        )
+    _secrets[(secret_name, region_name)] = (time.monotonic(), secret)
+    return secret
 
 
 def get_secret(
-    secret_name: str, secret_key: str, region_name: str = "us-west-1"
+    secret_name: str, secret_key: str, region_name: str = DEFAULT_REGION
 ) -> Optional[str]:
     """Retrieves secret from AWS secretsmanager.
     Args:
@@ -32,31 +107,34 @@ def get_secret(
     Returns:
         str: secret value
     """
+    secret = get_secret_json(secret_name, region_name)
+    if secret is None:
+        return None
+    return secret.get(secret_key)
 
-    # Create a Secrets Manager client
-    session = boto3.session.Session()
-    client = session.client(
-        service_name="secretsmanager",
-        region_name=region_name,
-    )
 
-    # In this sample we only handle the specific exceptions for the 'GetSecretValue' API.
-    # See https://docs.aws.amazon.com/secretsmanager/latest/apireference/API_GetSecretValue.html
-    # We rethrow the exception by default.
-    try:
-        get_secret_value_response = client.get_secret_value(SecretId=secret_name)
-    except ClientError as e:
-        if e.response["Error"]["Code"] in AWS_ERR_CODES:
-            raise e
-    else:
-        # Decrypts secret using the associated KMS CMK.
-        # Depending on whether the secret is a string
-        # or binary, one of these fields will be populated.
-        if "SecretString" in get_secret_value_response:
-            return json.loads(get_secret_value_response["SecretString"]).get(secret_key)
-        else:
-            return json.loads(
-                base64.b64decode(get_secret_value_response["SecretBinary"]).decode(
-                    "utf-8"
-                )
-            ).get(secret_key)
+def prefetch_secrets(secret_names: List[str], region_name: str = DEFAULT_REGION):
+    """Fetches secret_names concurrently so later get_secret calls are served
+    from the cache. Failures are only logged, get_secret raises them again when
+    the secret is actually needed.
+
+    Args:
+        secret_names (List[str]): secret names in secretsmanager
+        region_name (str, optional): AWS region name for secrets. Defaults to "us-west-1".
+    """
+    # Build the client up front, boto3 client creation isn't thread safe
+    _get_client(region_name)
+
+    def fetch(secret_name: str):
+        try:
+            get_secret_json(secret_name, region_name)
+        except Exception as e:
+            logger.error(f"Couldn't prefetch secret {secret_name}: {e}")
+
+    with ThreadPoolExecutor(max_workers=MAX_PREFETCH_WORKERS) as executor:
+        list(executor.map(fetch, set(secret_names)))
+
+
+def clear_secret_cache():
+    _secrets.clear()
+    _get_client.cache_clear()
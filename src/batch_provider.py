@@ -0,0 +1,155 @@
+import os
+import threading
+from contextlib import contextmanager
+from contextlib import nullcontext
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import List
+from typing import Optional
+
+from eth_utils import to_bytes
+from web3 import HTTPProvider
+from web3 import Web3
+from web3._utils.encoding import FriendlyJsonSerde
+from web3._utils.request import make_post_request
+from web3.types import RPCEndpoint
+from web3.types import RPCResponse
+
+from src.json_logger import logger
+
+# Seconds requests are collected before being sent as one batch, 0 disables
+# batching outside of batch() blocks
+RPC_BATCH_WINDOW = float(os.getenv("RPC_BATCH_WINDOW", 0))
+# Window used inside batch() blocks when RPC_BATCH_WINDOW is not set
+DEFAULT_BATCH_WINDOW = 0.01
+MAX_BATCH_SIZE = 100
+# Sent right away, a tx shouldn't wait on or fail with a batch of reads
+UNBATCHED_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+
+
+@dataclass
+class PendingRequest:
+    method: RPCEndpoint
+    params: Any
+    done: threading.Event = field(default_factory=threading.Event)
+    response: Optional[RPCResponse] = None
+    error: Optional[Exception] = None
+
+
+class BatchingHTTPProvider(HTTPProvider):
+    """HTTPProvider that collects the requests made by different threads within
+    a short window and sends them to the node as a single JSON-RPC batch POST.
+    Each caller still gets its own response, so it is a drop-in replacement.
+    Batching is on when a window is configured or inside a batch() block,
+    except for UNBATCHED_METHODS.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        window: float = RPC_BATCH_WINDOW,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        **kwargs,
+    ):
+        super().__init__(endpoint_uri, **kwargs)
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.batch_depth = 0
+        self.pending: List[PendingRequest] = []
+        self.lock = threading.Lock()
+        self.batch_full = threading.Event()
+
+    @contextmanager
+    def batch(self):
+        """Batches concurrent requests made while the block is open."""
+        with self.lock:
+            self.batch_depth += 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.batch_depth -= 1
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        window = self.window
+        if window <= 0 and self.batch_depth > 0:
+            window = DEFAULT_BATCH_WINDOW
+        if window <= 0 or method in UNBATCHED_METHODS:
+            return super().make_request(method, params)
+
+        request = PendingRequest(method, params)
+        with self.lock:
+            self.pending.append(request)
+            # First request of a window sends the whole batch
+            is_sender = len(self.pending) == 1
+            if len(self.pending) >= self.max_batch_size:
+                self.batch_full.set()
+
+        if is_sender:
+            self.batch_full.wait(window)
+            self.__flush()
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.response
+
+    def __flush(self):
+        with self.lock:
+            batch, self.pending = self.pending, []
+            self.batch_full.clear()
+
+        if len(batch) == 1:
+            self.__send_single(batch[0])
+            return
+        try:
+            responses = self.__send_batch(batch)
+        except Exception as e:
+            logger.warning(f"Batched rpc request failed, sending one by one: {e}")
+            responses = None
+
+        for request, response in zip(batch, responses or [None] * len(batch)):
+            if response is None:
+                self.__send_single(request)
+            else:
+                request.response = response
+                request.done.set()
+
+    def __send_batch(self, batch: List[PendingRequest]) -> List[Optional[RPCResponse]]:
+        rpc_requests = [
+            {
+                "jsonrpc": "2.0",
+                "method": request.method,
+                "params": request.params or [],
+                "id": next(self.request_counter),
+            }
+            for request in batch
+        ]
+        raw_response = make_post_request(
+            self.endpoint_uri,
+            to_bytes(text=FriendlyJsonSerde().json_encode(rpc_requests)),
+            **self.get_request_kwargs(),
+        )
+        responses = self.decode_rpc_response(raw_response)
+        if not isinstance(responses, list):
+            raise ValueError(f"Node doesn't support batch requests: {responses}")
+        by_id = {response.get("id"): response for response in responses}
+        # Requests missing from the batch response are retried on their own
+        return [by_id.get(rpc_request["id"]) for rpc_request in rpc_requests]
+
+    def __send_single(self, request: PendingRequest):
+        try:
+            request.response = super().make_request(request.method, request.params)
+        except Exception as e:
+            request.error = e
+        finally:
+            request.done.set()
+
+
+def batch(web3: Web3):
+    """Batches concurrent requests of web3 if its provider supports it
+    (BatchingHTTPProvider and NodePool).
+    """
+    if callable(getattr(type(web3.provider), "batch", None)):
+        return web3.provider.batch()
+    return nullcontext()
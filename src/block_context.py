@@ -0,0 +1,87 @@
+import os
+import threading
+import time
+import weakref
+from typing import Optional
+
+from web3 import Web3
+from web3.types import BlockData
+
+# Seconds the latest header is reused before asking the node again
+BLOCK_CONTEXT_MAX_AGE = float(os.getenv("BLOCK_CONTEXT_MAX_AGE", 2))
+DEFAULT_BASE_FEE = int(100e9)  # 100 gwei
+
+
+class BlockContext:
+    """Latest block header of a node, shared by every keeper decision made within
+    the same block (harvest timing, base fee, flashbots target blocks). The header
+    is fetched once and reused for max_age seconds, or until a newer block number
+    is observed, e.g. by the receipt watcher. Headers pushed by a HeadSubscriber
+    are used until the next one arrives, without asking the node.
+    """
+
+    def __init__(self, web3: Web3, max_age: float = BLOCK_CONTEXT_MAX_AGE):
+        self.web3 = web3
+        self.max_age = max_age
+        self.block: Optional[BlockData] = None
+        self.fetched_at = 0.0
+        # Set while headers are pushed through update()
+        self.pinned = False
+        self.lock = threading.Lock()
+
+    def latest(self) -> BlockData:
+        """Returns the latest block header, fetched only if the cached one is stale."""
+        with self.lock:
+            is_stale = time.monotonic() - self.fetched_at >= self.max_age
+            if self.block is None or (is_stale and not self.pinned):
+                self.block = self.web3.eth.get_block("latest")
+                self.fetched_at = time.monotonic()
+            return self.block
+
+    @property
+    def number(self) -> int:
+        return self.latest()["number"]
+
+    @property
+    def timestamp(self) -> int:
+        return self.latest()["timestamp"]
+
+    def base_fee(self, default: int = DEFAULT_BASE_FEE) -> int:
+        raw_base_fee = self.latest().get("baseFeePerGas", hex(default))
+        if isinstance(raw_base_fee, str) and raw_base_fee.startswith("0x"):
+            return int(raw_base_fee, 0)
+        return int(raw_base_fee)
+
+    def observe(self, block_number: int):
+        """Drops the cached header if the chain moved past it."""
+        with self.lock:
+            if self.block is not None and block_number > self.block["number"]:
+                self.block = None
+
+    def update(self, block: BlockData):
+        """Pins block as the latest header until the next update() or unpin()."""
+        with self.lock:
+            self.block = block
+            self.fetched_at = time.monotonic()
+            self.pinned = True
+
+    def unpin(self):
+        """Goes back to fetching the header from the node."""
+        with self.lock:
+            self.pinned = False
+
+    def invalidate(self):
+        with self.lock:
+            self.block = None
+
+
+_contexts: "weakref.WeakKeyDictionary[Web3, BlockContext]" = weakref.WeakKeyDictionary()
+_contexts_lock = threading.Lock()
+
+
+def get_block_context(web3: Web3) -> BlockContext:
+    """Returns the block context shared by everything using web3."""
+    with _contexts_lock:
+        if web3 not in _contexts:
+            _contexts[web3] = BlockContext(web3)
+        return _contexts[web3]
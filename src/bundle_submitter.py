@@ -0,0 +1,200 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Collection
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from hexbytes import HexBytes
+from web3 import Web3
+
+from src.block_context import get_block_context
+from src.json_logger import logger
+from src.rpc_metrics import context_map
+
+# Simulate bundles with eth_callBundle before sending them
+SIMULATE_BUNDLES = os.getenv("FLASHBOTS_SIMULATE", "false").lower() == "true"
+
+
+class BundleSimulationFailed(ValueError):
+    """Raised when a bundle tx that isn't allowed to revert reverts in simulation.
+
+    Args:
+        message (str)
+        tx_hashes (Collection[HexBytes], optional): txs that reverted, empty if
+            the simulation failed as a whole
+    """
+
+    def __init__(self, message: str, tx_hashes: Collection[HexBytes] = ()):
+        super().__init__(message)
+        self.tx_hashes = [HexBytes(tx) for tx in tx_hashes]
+
+
+@dataclass
+class BundleSubmission:
+    """Bundle of txs sent for a range of target blocks."""
+
+    tx_hashes: List[HexBytes]
+    target_blocks: List[int]
+    # Target blocks the relay accepted the bundle for
+    accepted_blocks: List[int] = field(default_factory=list)
+
+    @property
+    def max_target_block(self) -> int:
+        return max(self.target_blocks)
+
+    def inclusion(
+        self, included_block: Optional[int], current_block: int
+    ) -> Dict[int, str]:
+        """Status of the bundle of every target block.
+
+        Args:
+            included_block (int, optional): block the bundle was mined in, None if
+                it wasn't mined (yet)
+            current_block (int): latest block number
+
+        Returns:
+            Dict[int, str]: target block -> included, missed, pending or rejected
+        """
+        statuses = {}
+        for target_block in self.target_blocks:
+            if target_block not in self.accepted_blocks:
+                statuses[target_block] = "rejected"
+            elif target_block == included_block:
+                statuses[target_block] = "included"
+            elif included_block is not None or target_block <= current_block:
+                statuses[target_block] = "missed"
+            else:
+                statuses[target_block] = "pending"
+        return statuses
+
+
+class BundleSubmitter:
+    """Sends a flashbots bundle for num_bundles consecutive target blocks at once,
+    instead of one relay round-trip per target block. With simulate set, the
+    bundle is run through eth_callBundle first and not sent if a tx that isn't
+    allowed to revert reverts.
+    """
+
+    def __init__(self, web3: Web3, num_bundles: int, simulate: bool = SIMULATE_BUNDLES):
+        self.web3 = web3
+        self.num_bundles = num_bundles
+        self.simulate = simulate
+
+    def submit(self, signed_tx) -> BundleSubmission:
+        """Sends signed_tx as a single tx bundle for the next num_bundles blocks.
+
+        Args:
+            signed_tx (SignedTransaction): tx signed by the keeper
+
+        Raises:
+            BundleSimulationFailed: if simulation is on and the bundle reverts
+            ValueError: if the relay rejected the bundle for every target block
+
+        Returns:
+            BundleSubmission: the submitted bundle
+        """
+        return self.submit_bundle([signed_tx])
+
+    def submit_bundle(
+        self,
+        signed_txs: list,
+        reverting_tx_hashes: Collection[HexBytes] = (),
+        simulate: Optional[bool] = None,
+    ) -> BundleSubmission:
+        """Sends signed_txs, in order, as one bundle for the next num_bundles
+        blocks.
+
+        Args:
+            signed_txs (List[SignedTransaction]): txs signed by the keeper, with
+                sequential nonces
+            reverting_tx_hashes (Collection[HexBytes], optional): txs of the bundle
+                that may revert without the whole bundle being dropped
+            simulate (bool, optional): simulate the bundle before sending it.
+                Defaults to the submitter's simulate.
+
+        Raises:
+            BundleSimulationFailed: if simulation is on and a tx not in
+                reverting_tx_hashes reverts
+            ValueError: if the relay rejected the bundle for every target block
+
+        Returns:
+            BundleSubmission: the submitted bundle
+        """
+        bundle = [
+            {"signed_transaction": signed_tx.rawTransaction} for signed_tx in signed_txs
+        ]
+        opts = None
+        if reverting_tx_hashes:
+            opts = {"revertingTxHashes": [tx.hex() for tx in reverting_tx_hashes]}
+        context = get_block_context(self.web3)
+        # The cached header can be up to max_age old, with its next block already
+        # mined. A header pinned by newHeads is the chain head.
+        block_number = context.number if context.pinned else self.web3.eth.block_number
+        context.observe(block_number)
+        submission = BundleSubmission(
+            tx_hashes=[signed_tx.hash for signed_tx in signed_txs],
+            target_blocks=[block_number + i for i in range(1, self.num_bundles + 1)],
+        )
+        if simulate is None:
+            simulate = self.simulate
+        if simulate:
+            self.__simulate(bundle, block_number + 1, reverting_tx_hashes)
+
+        with ThreadPoolExecutor(max_workers=self.num_bundles) as executor:
+            results = context_map(
+                executor,
+                lambda target_block: self.__send(bundle, target_block, opts),
+                submission.target_blocks,
+            )
+        submission.accepted_blocks = [
+            target_block
+            for target_block, accepted in zip(submission.target_blocks, results)
+            if accepted
+        ]
+        if not submission.accepted_blocks:
+            raise ValueError(
+                f"No bundle of {[tx.hex() for tx in submission.tx_hashes]} "
+                "was accepted"
+            )
+        logger.info(
+            f"Bundle broadcasted for blocks {submission.accepted_blocks}, "
+            f"max target block {submission.max_target_block}"
+        )
+        return submission
+
+    def __simulate(
+        self,
+        bundle: List[dict],
+        target_block: int,
+        reverting_tx_hashes: Collection[HexBytes],
+    ):
+        simulation = self.web3.flashbots.simulate(bundle, target_block)
+        allowed = {HexBytes(tx) for tx in reverting_tx_hashes}
+        failed = [
+            result
+            for result in simulation.get("results", [])
+            if result.get("error")
+            and HexBytes(result.get("txHash", b"")) not in allowed
+        ]
+        if failed:
+            raise BundleSimulationFailed(
+                f"Bundle simulation failed: {[result['error'] for result in failed]}",
+                tx_hashes=[
+                    result["txHash"] for result in failed if result.get("txHash")
+                ],
+            )
+
+    def __send(
+        self, bundle: List[dict], target_block: int, opts: Optional[dict]
+    ) -> bool:
+        try:
+            self.web3.flashbots.send_bundle(
+                bundle, target_block_number=target_block, opts=opts
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Bundle for block {target_block} not accepted: {e}")
+            return False
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class GasQuote:
+    """EIP-1559 fees computed once per block and shared by estimation and tx building."""
+
+    block_number: int
+    base_fee: int
+    priority_fee: int
+    max_fee: int
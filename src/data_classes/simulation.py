@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Any
+from typing import Optional
+
+
+@dataclass
+class Simulation:
+    """eth_call result and gas estimate of a keeper function, reused within a block."""
+
+    block_number: int
+    call_result: Optional[Any] = None
+    gas: Optional[int] = None
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class StrategyState:
+    """Snapshot of the strategy reads needed before harvesting or tending."""
+
+    name: str
+    want: str
+    want_balance: int
+    want_decimals: int
+    block_number: int
@@ -0,0 +1,150 @@
+import atexit
+import os
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List
+from typing import Optional
+
+import requests
+from discord import Embed
+
+from src.http_client import DEFAULT_TIMEOUT
+from src.json_logger import logger
+
+# Seconds the worker waits for more messages to coalesce with the first one
+COALESCE_WINDOW = float(os.getenv("DISCORD_COALESCE_WINDOW", 1))
+# Seconds pending messages are still delivered for when the process exits
+FLUSH_TIMEOUT = float(os.getenv("DISCORD_FLUSH_TIMEOUT", 30))
+# Discord accepts up to 10 embeds per webhook message
+MAX_EMBEDS = 10
+MAX_RETRIES = 5
+
+
+@dataclass
+class Message:
+    url: str
+    username: str
+    embed: Optional[Embed] = None
+    content: Optional[str] = None
+
+
+class DiscordNotifier:
+    """Delivers webhook messages from a background worker, so keepers don't wait
+    on Discord. Messages to the same webhook and username sent within
+    COALESCE_WINDOW are merged into one post with up to MAX_EMBEDS embeds.
+    Connections are kept alive between posts and rate limited posts are retried
+    after the retry-after Discord asks for. Pending messages are flushed when the
+    process exits.
+    """
+
+    def __init__(self, coalesce_window: float = COALESCE_WINDOW):
+        self.coalesce_window = coalesce_window
+        self.session = requests.Session()
+        self.pending: List[Message] = []
+        # Messages taken by the worker but not delivered yet
+        self.in_flight = 0
+        self.condition = threading.Condition()
+        self.thread: Optional[threading.Thread] = None
+
+    def notify(
+        self,
+        url: str,
+        username: str,
+        embed: Optional[Embed] = None,
+        content: Optional[str] = None,
+    ):
+        """Queues a message for delivery and returns right away."""
+        with self.condition:
+            self.pending.append(Message(url, username, embed, content))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.__run, daemon=True)
+                self.thread.start()
+                atexit.register(self.flush)
+            self.condition.notify_all()
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT) -> bool:
+        """Waits until every queued message was delivered.
+
+        Returns:
+            bool: False if messages were still pending after timeout seconds
+        """
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: not self.pending and not self.in_flight, timeout
+            )
+
+    def __run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending)
+            # Give bursts a moment to arrive before taking the batch
+            time.sleep(self.coalesce_window)
+            with self.condition:
+                messages, self.pending = self.pending, []
+                self.in_flight = len(messages)
+
+            for url, username, payload in coalesce(messages):
+                try:
+                    self.__post(url, payload)
+                except Exception as e:
+                    logger.error(f"Error sending {username} message to discord: {e}")
+
+            with self.condition:
+                self.in_flight = 0
+                self.condition.notify_all()
+
+    def __post(self, url: str, payload: dict):
+        for _ in range(MAX_RETRIES):
+            response = self.session.post(url, json=payload, timeout=DEFAULT_TIMEOUT)
+            if response.status_code != 429:
+                response.raise_for_status()
+                return
+            retry_after = get_retry_after(response)
+            logger.warning(f"Rate limited by discord, retrying in {retry_after}s")
+            time.sleep(retry_after)
+        raise requests.HTTPError(f"Still rate limited after {MAX_RETRIES} tries")
+
+
+def coalesce(messages: List[Message]) -> List[tuple]:
+    """Merges the embeds of messages to the same webhook and username into posts
+    of up to MAX_EMBEDS embeds, keeping their order. Text messages are sent as is.
+
+    Returns:
+        List[tuple]: url, username and webhook payload of every post
+    """
+    posts = []
+    batches = {}
+    for message in messages:
+        if message.embed is None:
+            posts.append(
+                (
+                    message.url,
+                    message.username,
+                    {"username": message.username, "content": message.content},
+                )
+            )
+            continue
+        key = (message.url, message.username)
+        if key not in batches or len(batches[key]["embeds"]) == MAX_EMBEDS:
+            batches[key] = {"username": message.username, "embeds": []}
+            posts.append((message.url, message.username, batches[key]))
+        batches[key]["embeds"].append(message.embed.to_dict())
+    return posts
+
+
+def get_retry_after(response: requests.Response) -> float:
+    """Seconds Discord asks to wait before retrying a rate limited request."""
+    if "Retry-After" in response.headers:
+        return float(response.headers["Retry-After"])
+    try:
+        return float(response.json()["retry_after"])
+    except (ValueError, KeyError, TypeError):
+        return 1.0
+
+
+@lru_cache(maxsize=None)
+def get_notifier() -> DiscordNotifier:
+    """Returns the process wide discord notifier."""
+    return DiscordNotifier()
@@ -12,6 +12,13 @@ from config.constants import CRITICAL_VAULTS
 from config.constants import ETH_BVECVX_STRATEGY
 from config.enums import Network
 from src.aws import get_secret
+from src.discord_notifier import get_notifier
+from src.metrics import record_gas_cost
+from src.metrics import record_tx
+from src.run_digest import DIGEST_MODE
+from src.run_digest import DigestEntry
+from src.run_digest import get_run_digest
+from src.tracing import span
 from src.utils import get_explorer
 from src.utils import logger
 
@@ -37,6 +44,7 @@ def send_critical_error_to_discord(
     webhook.send(content=message, username=f"{chain} {sett_name} {tx_type}er")
 
 
+@span("notify")
 def send_error_to_discord(
     sett_name: str,
     tx_type: str,
@@ -48,16 +56,22 @@ def send_error_to_discord(
     webhook_url: Optional[str] = None,
 ) -> None:
     try:
-        if webhook_url:
-            webhook = Webhook.from_url(
+        if not webhook_url:
+            webhook_url = get_secret("keepers/alerts-webhook", "DISCORD_WEBHOOK_URL")
+        if error:
+            message = str(error)
+        if DIGEST_MODE:
+            get_run_digest().add(
                 webhook_url,
-                adapter=RequestsWebhookAdapter(),
-            )
-        else:
-            webhook = Webhook.from_url(
-                get_secret("keepers/alerts-webhook", "DISCORD_WEBHOOK_URL"),
-                adapter=RequestsWebhookAdapter(),
+                DigestEntry(
+                    title=f"{tx_type} {sett_name}",
+                    status="Failed",
+                    chain=chain,
+                    explorer_url=get_explorer_url(chain, tx_hash),
+                    message=message,
+                ),
             )
+            return
         embed = Embed(
             title=f"**{tx_type} Failed for {sett_name}**",
             description=f"{sett_name} Sett {tx_type} Details",
@@ -66,16 +80,15 @@ def send_error_to_discord(
             embed.add_field(name="Chain", value=chain, inline=True)
         if keeper_address:
             embed.add_field(name="Keeper", value=keeper_address, inline=True)
-        if error:
-            message = str(error)
         embed.add_field(name="Failure information", value=message, inline=True)
 
-        webhook.send(embed=embed, username=f"{sett_name} {tx_type}er")
+        get_notifier().notify(webhook_url, f"{sett_name} {tx_type}er", embed=embed)
 
     except Exception as e:
         logger.error(f"Error sending error to discord: {e}")
 
 
+@span("notify")
 def send_success_to_discord(
     tx_hash: HexBytes,
     tx_type: str,
@@ -89,12 +102,24 @@ def send_success_to_discord(
         if not url:
             url = get_secret("keepers/info-webhook", "DISCORD_WEBHOOK_URL")
 
-        webhook = Webhook.from_url(
-            url,
-            adapter=RequestsWebhookAdapter(),
-        )
-
         status = "Completed" if gas_cost else "Pending"
+        record_tx(tx_type, "confirmed" if gas_cost else "pending", chain)
+        if gas_cost:
+            record_gas_cost(tx_type, gas_cost, chain)
+
+        if DIGEST_MODE:
+            get_run_digest().add(
+                url,
+                DigestEntry(
+                    title=f"{tx_type} {sett_name}" if sett_name else tx_type,
+                    status=status,
+                    chain=chain,
+                    explorer_url=get_explorer_url(chain, tx_hash),
+                    gas_cost=gas_cost,
+                    message=f"Amount {tx_type}ed: {amt}" if amt else None,
+                ),
+            )
+            return
 
         (explorer_name, explorer_url) = get_explorer(chain, tx_hash)
 
@@ -146,9 +171,9 @@ def send_success_to_discord(
             )
 
         if tx_type in ["Harvest", "Tend"]:
-            webhook.send(embed=embed, username=f"{sett_name} {tx_type}er")
+            get_notifier().notify(url, f"{sett_name} {tx_type}er", embed=embed)
         else:
-            webhook.send(embed=embed, username=f"{tx_type}")
+            get_notifier().notify(url, f"{tx_type}", embed=embed)
 
     except Exception as e:
         logger.error(f"Error sending success to discord: {e}")
@@ -218,6 +243,15 @@ def send_oracle_error_to_discord(tx_type: str, error: Exception):
     webhook.send(embed=embed, username=f"{tx_type}")
 
 
+def get_explorer_url(
+    chain: Optional[str], tx_hash: Optional[HexBytes]
+) -> Optional[str]:
+    if not chain or not tx_hash or HexBytes(tx_hash) == HexBytes(0):
+        return None
+    explorer = get_explorer(chain, HexBytes(tx_hash))
+    return explorer[1] if explorer else None
+
+
 def get_hash_from_failed_tx_error(
     error: ValueError,
     tx_type: str,
@@ -2,7 +2,6 @@ import os
 import traceback
 from typing import Tuple
 
-import requests
 from hexbytes import HexBytes
 from web3 import Web3
 from web3 import contract
@@ -17,17 +16,23 @@ from config.constants import ETH_GRAVIAURA_VAULT
 from config.constants import FTM_BVEOXD_VOTER
 from config.constants import FTM_OXD_BVEOXD_VAULT
 from config.enums import Network
+from src import http_client
 from src.discord_utils import get_hash_from_failed_tx_error
 from src.discord_utils import send_critical_error_to_discord
 from src.discord_utils import send_error_to_discord
 from src.discord_utils import send_success_to_discord
 from src.json_logger import logger
+from src.keeper_roles import KeeperRoles
+from src.metrics import record_tx
+from src.nonce_manager import get_nonce_manager
+from src.rpc_metrics import rpc_context
 from src.token_utils import get_token_price
+from src.tracing import span
 from src.tx_utils import get_effective_gas_price
 from src.tx_utils import get_gas_price_of_tx
 from src.tx_utils import get_tx_options
 from src.tx_utils import sign_and_send_tx
-from src.utils import get_abi
+from src.utils import get_contract
 from src.web3_utils import confirm_transaction
 
 GAS_LIMITS = {
@@ -54,37 +59,45 @@ class Earner:
         self.web3 = web3
         self.keeper_key = keeper_key
         self.keeper_address = keeper_address
-        self.keeper_acl = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(keeper_acl),
-            abi=get_abi(self.chain, "keeper_acl"),
+        self.keeper_acl = get_contract(
+            self.web3, self.chain, "keeper_acl", self.web3.toChecksumAddress(keeper_acl)
         )
-        self.base_usd_oracle = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(base_oracle_address),
-            abi=get_abi(self.chain, "oracle"),
+        self.keeper_roles = KeeperRoles(
+            self.web3, self.chain, self.keeper_acl, self.keeper_address
+        )
+        self.nonce_manager = get_nonce_manager(
+            self.web3, self.chain, self.keeper_address
+        )
+        self.base_usd_oracle = get_contract(
+            self.web3,
+            self.chain,
+            "oracle",
+            self.web3.toChecksumAddress(base_oracle_address),
         )
         self.discord_url = discord_url
 
     def earn(self, vault: contract, strategy: contract, sett_name: str = None):
-        override_threshold = EARN_EXCEPTIONS.get(
-            strategy.address, EARN_OVERRIDE_THRESHOLD
-        )
+        with rpc_context(strategy=strategy.address), span("earn", vault=vault.address):
+            override_threshold = EARN_EXCEPTIONS.get(
+                strategy.address, EARN_OVERRIDE_THRESHOLD
+            )
 
-        want = self.web3.eth.contract(
-            address=vault.functions.token().call(), abi=get_abi(self.chain, "erc20")
-        )
+            want = get_contract(
+                self.web3, self.chain, "erc20", vault.functions.token().call()
+            )
 
-        # Pre safety checks
-        swant_address = strategy.functions.want().call()
-        assert want.address == swant_address
+            # Pre safety checks
+            swant_address = strategy.functions.want().call()
+            assert want.address == swant_address
 
-        vault_balance, strategy_balance = self.get_balances(vault, strategy, want)
+            vault_balance, strategy_balance = self.get_balances(vault, strategy, want)
 
-        if self.should_earn(override_threshold, vault_balance, strategy_balance):
-            if vault.address == ETH_BVECVX_VAULT:
-                self.bvecvx_unlock()
-            self.__process_earn(vault, sett_name)
-            if vault.address == FTM_OXD_BVEOXD_VAULT:
-                self.bveoxd_vote()
+            if self.should_earn(override_threshold, vault_balance, strategy_balance):
+                if vault.address == ETH_BVECVX_VAULT:
+                    self.bvecvx_unlock()
+                self.__process_earn(vault, sett_name)
+                if vault.address == FTM_OXD_BVEOXD_VAULT:
+                    self.bveoxd_vote()
 
     def get_balances(
         self, vault: contract, strategy: contract, want: contract
@@ -181,8 +194,7 @@ class Earner:
             bool: True if our bot is whitelisted to make function calls to strategy,
             False otherwise.
         """
-        earner_key = self.keeper_acl.functions.EARNER_ROLE().call()
-        return self.keeper_acl.functions.hasRole(earner_key, self.keeper_address).call()
+        return self.keeper_roles.has_role("EARNER_ROLE")
 
     def __process_earn(
         self,
@@ -221,6 +233,7 @@ class Earner:
                 )
         except Exception as e:
             logger.error(f"Error processing earn tx: {e}")
+            record_tx("Earn", "failed", self.chain)
             if vault and vault.address in CRITICAL_VAULTS.keys():
                 send_critical_error_to_discord(
                     sett_name,
@@ -251,25 +264,41 @@ class Earner:
         Returns:
             HexBytes: Transaction hash for transaction that was sent.
         """
+        tx_hash = HexBytes(0)
+        tx = None
         try:
-            tx = self.__build_transaction(vault.address)
-            signed_tx = self.web3.eth.account.sign_transaction(
-                tx, private_key=self.keeper_key
-            )
+            with span("build"):
+                tx = self.__build_transaction(vault.address)
+            with span("sign"):
+                signed_tx = self.web3.eth.account.sign_transaction(
+                    tx, private_key=self.keeper_key
+                )
             tx_hash = signed_tx.hash
             logger.info(f"attempted tx_hash: {tx_hash}")
-            self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            with span("send"):
+                self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            record_tx("Earn", "sent", self.chain)
         except ValueError as e:
             logger.error(f"Error in sending earn tx: {traceback.format_exc()}")
+            record_tx("Earn", "failed", self.chain)
+            self.nonce_manager.resync()
             tx_hash = get_hash_from_failed_tx_error(
                 e, "Earn", chain=self.chain, keeper_address=self.keeper_address
             )
+        except Exception as e:
+            logger.error(f"Error in sending earn tx: {traceback.format_exc()}")
+            record_tx("Earn", "failed", self.chain)
+            # Nonce is taken while building, unknown which one if that failed
+            self.nonce_manager.handle_error(tx["nonce"] if tx else None, e)
+            tx_hash = HexBytes(0)
         finally:
             return tx_hash
 
     def __get_gas_price(self) -> int:
         if self.chain == Network.Polygon:
-            response = requests.get("https://gasstation-mainnet.matic.network").json()
+            response = http_client.get(
+                "https://gasstation-mainnet.matic.network"
+            ).json()
             gas_price = self.web3.toWei(int(response.get("fast") * 1.1), "gwei")
         elif self.chain == Network.Ethereum:
             gas_price = get_effective_gas_price(self.web3)
@@ -294,17 +323,20 @@ class Earner:
         )
 
     def bveoxd_vote(self) -> None:
-        voter = self.web3.eth.contract(
-            address=FTM_BVEOXD_VOTER, abi=get_abi(Network.Fantom, "bveoxd_voter")
+        voter = get_contract(
+            self.web3, Network.Fantom, "bveoxd_voter", FTM_BVEOXD_VOTER
         )
 
         try:
             options = get_tx_options(self.web3, self.chain, self.keeper_address)
             tx = voter.functions.vote().buildTransaction(options)
-            tx_hash = sign_and_send_tx(self.web3, tx, self.keeper_key)
+            tx_hash = sign_and_send_tx(
+                self.web3, tx, self.keeper_key, nonce_manager=self.nonce_manager
+            )
         except Exception:
             logger.error(f"Error in sending vote tx: {traceback.format_exc()}")
             tx_hash = HexBytes(0)
+            self.nonce_manager.resync()
 
         try:
             succeeded, _ = confirm_transaction(self.web3, tx_hash)
@@ -329,6 +361,7 @@ class Earner:
                 )
         except Exception as e:
             logger.error(f"Error processing earn tx: {e}")
+            record_tx("Vote bveOXD", "failed", self.chain)
             send_error_to_discord(
                 "bveOXD",
                 "Vote bveOXD",
@@ -338,9 +371,8 @@ class Earner:
             )
 
     def bvecvx_unlock(self) -> None:
-        unlocker = self.web3.eth.contract(
-            address=ETH_BVECVX_STRATEGY,
-            abi=get_abi(Network.Ethereum, "bvecvx_unlock_upkeep"),
+        unlocker = get_contract(
+            self.web3, Network.Ethereum, "bvecvx_unlock_upkeep", ETH_BVECVX_STRATEGY
         )
 
         should_unlock = unlocker.functions.checkUpkeep(HexBytes(0)).call()[
@@ -353,10 +385,13 @@ class Earner:
                 tx = unlocker.functions.performUpkeep(HexBytes(0)).buildTransaction(
                     options
                 )
-                tx_hash = sign_and_send_tx(self.web3, tx, self.keeper_key)
+                tx_hash = sign_and_send_tx(
+                    self.web3, tx, self.keeper_key, nonce_manager=self.nonce_manager
+                )
             except Exception:
                 logger.error(f"Error in sending vote tx: {traceback.format_exc()}")
                 tx_hash = HexBytes(0)
+                self.nonce_manager.resync()
 
             try:
                 succeeded, _ = confirm_transaction(self.web3, tx_hash)
@@ -381,6 +416,7 @@ class Earner:
                     )
             except Exception as e:
                 logger.error(f"Error processing earn tx: {e}")
+                record_tx("Unlock bveCVX", "failed", self.chain)
                 send_critical_error_to_discord(
                     "bveCVX",
                     "Unlock bveCVX",
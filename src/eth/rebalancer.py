@@ -8,11 +8,14 @@ from web3 import contract
 from config.constants import DIGG
 from config.enums import Network
 from src.json_logger import logger
+from src.metrics import record_tx
+from src.nonce_manager import get_nonce_manager
 from src.tx_utils import get_effective_gas_price
 from src.tx_utils import get_gas_price_of_tx
-from src.tx_utils import get_priority_fee
+from src.tx_utils import get_gas_quote
 from src.web3_utils import confirm_transaction
-from src.utils import get_abi
+from src.utils import get_contract
+from src.bundle_submitter import BundleSubmitter
 from src.discord_utils import send_error_to_discord
 from src.discord_utils import send_success_to_discord
 
@@ -36,17 +39,20 @@ class Rebalancer:
         self.web3 = web3
         self.keeper_key = keeper_key
         self.keeper_address = keeper_address
-        self.keeper_acl = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(keeper_acl),
-            abi=get_abi(self.chain, "keeper_acl"),
+        self.nonce_manager = get_nonce_manager(
+            self.web3, self.chain, self.keeper_address
         )
-        self.base_usd_oracle = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(base_oracle_address),
-            abi=get_abi(self.chain, "oracle"),
+        self.keeper_acl = get_contract(
+            self.web3, self.chain, "keeper_acl", self.web3.toChecksumAddress(keeper_acl)
         )
-        self.digg = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(DIGG),
-            abi=get_abi(self.chain, "erc20"),
+        self.base_usd_oracle = get_contract(
+            self.web3,
+            self.chain,
+            "oracle",
+            self.web3.toChecksumAddress(base_oracle_address),
+        )
+        self.digg = get_contract(
+            self.web3, self.chain, "erc20", self.web3.toChecksumAddress(DIGG)
         )
 
         self.use_flashbots = use_flashbots
@@ -128,6 +134,8 @@ class Rebalancer:
                     chain=self.chain,
                 )
             elif tx_hash != HexBytes(0):
+                # Not mined in time or dropped, a nonce gap would block later txs
+                self.nonce_manager.resync()
                 if not self.use_flashbots:
                     send_success_to_discord(
                         tx_type=f"Rebalance {strategy_name}",
@@ -135,11 +143,13 @@ class Rebalancer:
                         chain=self.chain,
                     )
                 else:
+                    record_tx("Rebalance", "failed", self.chain)
                     send_error_to_discord(
                         strategy_name, "Rebalance", tx_hash=tx_hash, message=msg
                     )
         except Exception as e:
             logger.error(f"Error processing rebalance tx: {e}")
+            record_tx("Rebalance", "failed", self.chain)
             send_error_to_discord(strategy_name, "Rebalance", error=e)
 
     def __send_rebalance_tx(self, strategy: contract) -> HexBytes:
@@ -157,8 +167,10 @@ class Rebalancer:
         """
         max_target_block = None
         tx_hash = HexBytes(0)
+        nonce = None
         try:
-            tx = self.__build_transaction(strategy)
+            nonce = self.nonce_manager.get_nonce()
+            tx = self.__build_transaction(strategy, nonce)
             signed_tx = self.web3.eth.account.sign_transaction(
                 tx, private_key=self.keeper_key
             )
@@ -167,38 +179,40 @@ class Rebalancer:
             if not self.use_flashbots:
                 self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
             else:
-                bundle = [
-                    {"signed_transaction": signed_tx.rawTransaction},
-                ]
-
-                block_number = self.web3.eth.block_number
-                for i in range(1, NUM_FLASHBOTS_BUNDLES + 1):
-                    self.web3.flashbots.send_bundle(
-                        bundle, target_block_number=block_number + i
-                    )
-                max_target_block = block_number + NUM_FLASHBOTS_BUNDLES
-                logger.info(f"Bundle broadcasted at {max_target_block}")
+                submission = BundleSubmitter(self.web3, NUM_FLASHBOTS_BUNDLES).submit(
+                    signed_tx
+                )
+                max_target_block = submission.max_target_block
 
         except ValueError as e:
             logger.error(f"Error in sending rebalance tx: {e}")
+            record_tx("Rebalance", "failed", self.chain)
+            self.nonce_manager.handle_error(nonce, e)
+        except Exception as e:
+            logger.error(f"Error in sending rebalance tx: {e}")
+            record_tx("Rebalance", "failed", self.chain)
+            # Unknown whether the node got the tx, so read the nonce back from it
+            self.nonce_manager.resync()
+            tx_hash = HexBytes(0)
         finally:
             return tx_hash, max_target_block
 
-    def __build_transaction(self, strategy: contract) -> dict:
+    def __build_transaction(self, strategy: contract, nonce: int) -> dict:
         """Builds transaction depending on which chain we're rebalancing. EIP-1559
         requires different handling for ETH txs than the other EVM chains.
 
         Args:
             contract (contract): contract to use to build rebalance tx
+            nonce (int): tx nonce, handed out by the keeper's nonce manager
 
         Returns:
             dict: tx dictionary
         """
         # Use x times recommended priority fee as miner tip
-        priority_fee = get_priority_fee(self.web3)
+        priority_fee = get_gas_quote(self.web3).priority_fee
         logger.info(f"max_priority_fee: {priority_fee}")
         options = {
-            "nonce": self.web3.eth.get_transaction_count(self.keeper_address),
+            "nonce": nonce,
             "from": self.keeper_address,
             "maxPriorityFeePerGas": priority_fee,
             "maxFeePerGas": MAX_GAS_PRICE,
@@ -1,8 +1,11 @@
 import os
 from decimal import Decimal
 from time import sleep
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
 
-import requests
 from hexbytes import HexBytes
 from web3 import Web3
 from web3 import contract
@@ -12,18 +15,32 @@ from config.constants import BASE_CURRENCIES
 from config.constants import GAS_LIMITS
 from config.constants import MULTICHAIN_CONFIG
 from config.enums import Network
+from src import http_client
+from src.block_context import get_block_context
+from src.bundle_submitter import BundleSimulationFailed
+from src.bundle_submitter import BundleSubmission
+from src.bundle_submitter import BundleSubmitter
+from src.data_classes.simulation import Simulation
+from src.data_classes.strategy_state import StrategyState
 from src.discord_utils import get_hash_from_failed_tx_error
 from src.discord_utils import send_error_to_discord
 from src.discord_utils import send_success_to_discord
 from src.harvester import IHarvester
 from src.json_logger import logger
+from src.keeper_roles import KeeperRoles
+from src.metrics import record_tx
 from src.misc_utils import hours
 from src.misc_utils import seconds_to_blocks
+from src.multicall import multicall
+from src.nonce_manager import get_nonce_manager
+from src.receipt_watcher import get_receipt_watcher
+from src.rpc_metrics import strategy_rpc_context
 from src.token_utils import get_token_price
+from src.tracing import span
 from src.tx_utils import get_effective_gas_price
 from src.tx_utils import get_gas_price_of_tx
-from src.tx_utils import get_priority_fee
-from src.utils import get_abi
+from src.tx_utils import get_gas_quote
+from src.utils import get_contract
 from src.web3_utils import confirm_transaction
 from src.web3_utils import get_last_harvest_times
 
@@ -31,6 +48,19 @@ MAX_TIME_BETWEEN_HARVESTS = hours(120)
 HARVEST_THRESHOLD = 0.0005  # min ratio of want to total vault AUM required to harvest
 
 NUM_FLASHBOTS_BUNDLES = 6
+# Max harvest txs packed into a single flashbots bundle
+MAX_BUNDLE_TXS = int(os.getenv("FLASHBOTS_MAX_BUNDLE_TXS", 10))
+# Let a bundled harvest revert without the rest of its bundle being dropped
+ALLOW_BUNDLE_REVERTS = os.getenv("FLASHBOTS_ALLOW_REVERTS", "false").lower() == "true"
+
+# ACL role the keeper needs for each keeper function
+KEEPER_FUNCTION_ROLES = {
+    "harvest": "HARVESTER_ROLE",
+    "harvestNoReturn": "HARVESTER_ROLE",
+    "harvestMta": "HARVESTER_ROLE",
+    "tend": "TENDER_ROLE",
+    "rewards_manager": "KEEPER_ROLE",
+}
 
 
 class GeneralHarvester(IHarvester):
@@ -49,20 +79,23 @@ class GeneralHarvester(IHarvester):
         self.web3 = web3
         self.keeper_key = keeper_key
         self.keeper_address = keeper_address
-        self.keeper_acl: Contract = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(keeper_acl),
-            abi=get_abi(self.chain, "keeper_acl"),
+        self.keeper_acl: Contract = get_contract(
+            self.web3, self.chain, "keeper_acl", self.web3.toChecksumAddress(keeper_acl)
         )
-        self.base_usd_oracle: Contract = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(base_oracle_address),
-            abi=get_abi(self.chain, "oracle"),
+        self.base_usd_oracle: Contract = get_contract(
+            self.web3,
+            self.chain,
+            "oracle",
+            self.web3.toChecksumAddress(base_oracle_address),
         )
+        # Latest header shared by all decisions made within a block
+        self.block_context = get_block_context(self.web3)
         # Times of last harvest
         if self.chain in [Network.Ethereum, Network.Fantom]:
             self.last_harvest_times = get_last_harvest_times(
                 self.web3,
                 self.keeper_acl,
-                start_block=self.web3.eth.block_number
+                start_block=self.block_context.number
                 - seconds_to_blocks(MAX_TIME_BETWEEN_HARVESTS),
                 chain=self.chain,
             )
@@ -72,6 +105,96 @@ class GeneralHarvester(IHarvester):
 
         self.use_flashbots = use_flashbots
         self.discord_url = discord_url
+        self.nonce_manager = get_nonce_manager(
+            self.web3, self.chain, self.keeper_address
+        )
+        # Prefetched per-strategy reads, see prefetch()
+        self.strategy_states: Dict[str, StrategyState] = {}
+        # Keeper function simulations of the current block, see simulate_call()
+        self.simulations: Dict[Tuple[str, str, str], Simulation] = {}
+        self.bundle_submitter = BundleSubmitter(self.web3, NUM_FLASHBOTS_BUNDLES)
+        # Flashbots bundles sent this run by tx hash, see confirm_harvest()
+        self.bundle_submissions: Dict[HexBytes, BundleSubmission] = {}
+        self.keeper_roles = KeeperRoles(
+            self.web3, self.chain, self.keeper_acl, self.keeper_address
+        )
+
+    @span("reads")
+    def prefetch(self, strategies: List[contract.Contract]):
+        """Reads the state harvest/tend need for every strategy of the run
+        (name, want, want balance and decimals) in two multicall round-trips
+        pinned to the same block, and resolves the keeper's harvester and tender
+        roles alongside.
+
+        Args:
+            strategies (List[contract]): strategies that are going to be processed
+        """
+        block_number = self.block_context.number
+        self.keeper_roles.prefetch(
+            ["HARVESTER_ROLE", "TENDER_ROLE"], block_identifier=block_number
+        )
+
+        first_round = []
+        for strategy in strategies:
+            first_round.append(strategy.functions.getName())
+            first_round.append(strategy.functions.want())
+        names_and_wants = multicall(
+            self.web3, self.chain, first_round, block_identifier=block_number
+        )
+
+        second_round = []
+        fetched_strategies = []
+        for strategy, name, want_address in zip(
+            strategies, names_and_wants[::2], names_and_wants[1::2]
+        ):
+            if name is None or want_address is None:
+                continue
+            want = get_contract(self.web3, self.chain, "erc20", want_address)
+            second_round.append(want.functions.balanceOf(strategy.address))
+            second_round.append(want.functions.decimals())
+            fetched_strategies.append((strategy, name, want_address))
+        balances_and_decimals = multicall(
+            self.web3, self.chain, second_round, block_identifier=block_number
+        )
+
+        for (strategy, name, want_address), balance, decimals in zip(
+            fetched_strategies,
+            balances_and_decimals[::2],
+            balances_and_decimals[1::2],
+        ):
+            if balance is None or decimals is None:
+                continue
+            self.strategy_states[strategy.address] = StrategyState(
+                name=name,
+                want=want_address,
+                want_balance=balance,
+                want_decimals=decimals,
+                block_number=block_number,
+            )
+        logger.info(
+            f"Prefetched state of {len(self.strategy_states)} strategies "
+            f"at block {block_number}"
+        )
+
+    def get_strategy_state(self, strategy: contract.Contract) -> StrategyState:
+        """Returns the prefetched state of strategy, reading it from chain if the
+        strategy wasn't part of prefetch()
+        """
+        state = self.strategy_states.get(strategy.address)
+        if state is not None:
+            return state
+
+        want_address = strategy.functions.want().call()
+        want = get_contract(self.web3, self.chain, "erc20", want_address)
+        state = StrategyState(
+            name=strategy.functions.getName().call(),
+            want=want_address,
+            want_balance=want.functions.balanceOf(strategy.address).call(),
+            want_decimals=want.functions.decimals().call(),
+            block_number=self.block_context.number,
+        )
+        self.strategy_states[strategy.address] = state
+        return state
 
     def is_time_to_harvest(
         self,
@@ -95,7 +218,7 @@ class GeneralHarvester(IHarvester):
             return True
         try:
             last_harvest = self.last_harvest_times[strategy.address]
-            current_time = self.web3.eth.get_block("latest")["timestamp"]
+            current_time = self.block_context.timestamp
             logger.info(
                 f"Time since last harvest: {(current_time - last_harvest) / 3600}"
             )
@@ -104,6 +227,7 @@ class GeneralHarvester(IHarvester):
         except KeyError:
             return True
 
+    @strategy_rpc_context
     def harvest(
         self,
         strategy: contract.Contract,
@@ -118,26 +242,41 @@ class GeneralHarvester(IHarvester):
             ValueError: If the keeper isn't whitelisted, throw an error and alert user.
         """
         strategy_name = (
-            strategy.functions.getName().call()
+            self.get_strategy_state(strategy).name
             if strategy_name == ""
             else strategy_name
         )
 
+        if self.should_harvest(strategy):
+            self.__process_harvest(
+                strategy=strategy,
+                strategy_name=strategy_name,
+            )
+
+    @strategy_rpc_context
+    def should_harvest(self, strategy: contract.Contract) -> bool:
+        """Decision half of harvest(): checks the keeper is whitelisted and
+        estimates want gained and gas cost, without sending anything.
+
+        Args:
+            strategy (contract)
+
+        Raises:
+            ValueError: If the keeper isn't whitelisted.
+
+        Returns:
+            bool: True if the strategy should be harvested
+        """
+        state = self.get_strategy_state(strategy)
+
         # TODO: update for ACL
         if not self.__is_keeper_whitelisted("harvest"):
             raise ValueError("Keeper ACL is not whitelisted for calling harvest")
 
-        want_address = strategy.functions.want().call()
-        want = self.web3.eth.contract(
-            address=want_address,
-            abi=get_abi(self.chain, "erc20"),
-        )
-        vault_balance = want.functions.balanceOf(strategy.address).call()
-        logger.info(f"vault balance: {vault_balance}")
+        logger.info(f"vault balance: {state.want_balance}")
 
         want_to_harvest = (
-            self.estimate_harvest_amount(strategy)
-            / 10 ** want.functions.decimals().call()
+            self.estimate_harvest_amount(strategy) / 10 ** state.want_decimals
         )
         logger.info(f"estimated want change: {want_to_harvest}")
 
@@ -151,18 +290,15 @@ class GeneralHarvester(IHarvester):
         # for now we'll just harvest every hour
         should_harvest = self.is_profitable()
         logger.info(f"Should we harvest: {should_harvest}")
+        return should_harvest
 
-        if should_harvest:
-            self.__process_harvest(
-                strategy=strategy,
-                strategy_name=strategy_name,
-            )
-
+    @strategy_rpc_context
     def harvest_no_return(
         self,
         strategy: contract,
     ):
-        strategy_name = strategy.functions.getName().call()
+        state = self.get_strategy_state(strategy)
+        strategy_name = state.name
 
         # TODO: update for ACL
         if not self.__is_keeper_whitelisted("harvestNoReturn"):
@@ -170,13 +306,7 @@ class GeneralHarvester(IHarvester):
                 "Keeper ACL is not whitelisted for calling harvestNoReturn"
             )
 
-        want_address = strategy.functions.want().call()
-        want = self.web3.eth.contract(
-            address=want_address,
-            abi=get_abi(self.chain, "erc20"),
-        )
-        vault_balance = want.functions.balanceOf(strategy.address).call()
-        logger.info(f"vault balance: {vault_balance}")
+        logger.info(f"vault balance: {state.want_balance}")
 
         # TODO: figure out how to handle profit estimation
         # current_price_eth = self.get_current_rewards_price()
@@ -195,29 +325,31 @@ class GeneralHarvester(IHarvester):
                 strategy_name=strategy_name,
             )
 
+    @strategy_rpc_context
     def harvest_rewards_manager(
         self,
         strategy: contract,
     ):
-        strategy_name = strategy.functions.getName().call()
-
-        self.keeper_acl = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(
+        state = self.get_strategy_state(strategy)
+        strategy_name = state.name
+
+        self.keeper_acl = get_contract(
+            self.web3,
+            self.chain,
+            "rewards_manager",
+            self.web3.toChecksumAddress(
                 MULTICHAIN_CONFIG[self.chain]["rewards_manager"]
             ),
-            abi=get_abi(self.chain, "rewards_manager"),
+        )
+        # Cached roles belong to the previous ACL
+        self.keeper_roles = KeeperRoles(
+            self.web3, self.chain, self.keeper_acl, self.keeper_address
         )
 
         if not self.__is_keeper_whitelisted("rewards_manager"):
             raise ValueError(f"Keeper is not whitelisted for {strategy_name}")
 
-        want_address = strategy.functions.want().call()
-        want = self.web3.eth.contract(
-            address=want_address,
-            abi=get_abi(self.chain, "erc20"),
-        )
-        vault_balance = want.functions.balanceOf(strategy.address).call()
-        logger.info(f"vault balance: {vault_balance}")
+        logger.info(f"vault balance: {state.want_balance}")
 
         gas_fee = self.estimate_gas_fee(strategy.address)
         logger.info(f"estimated gas cost: {gas_fee}")
@@ -244,8 +376,9 @@ class GeneralHarvester(IHarvester):
         if should_harvest_mta:
             self.__process_harvest_mta(voter_proxy)
 
+    @strategy_rpc_context
     def tend(self, strategy: contract):
-        strategy_name = strategy.functions.getName().call()
+        strategy_name = self.get_strategy_state(strategy).name
         # TODO: update for ACL
         if not self.__is_keeper_whitelisted("tend"):
             raise ValueError("Keeper ACL is not whitelisted for calling tend")
@@ -268,21 +401,16 @@ class GeneralHarvester(IHarvester):
         self.harvest(strategy)
 
     def estimate_harvest_amount(self, strategy: contract) -> Decimal:
-        want = self.web3.eth.contract(
-            address=strategy.functions.want().call(),
-            abi=get_abi(self.chain, "erc20"),
-        )
-        want_gained = self.keeper_acl.functions.harvest(strategy.address).call(
-            {"from": self.keeper_address}
-        )
+        want_address = self.get_strategy_state(strategy).want
+        want_gained = self.simulate_call(strategy.address, "harvest")
         # call badger api to get prices
         currency = BASE_CURRENCIES[self.chain]
         if self.chain == Network.Fantom:
             price_per_want = get_token_price(
-                want.address, currency, self.chain, use_staging=True
+                want_address, currency, self.chain, use_staging=True
             )
         else:
-            price_per_want = get_token_price(want.address, currency, self.chain)
+            price_per_want = get_token_price(want_address, currency, self.chain)
 
         logger.info(f"price per want: {price_per_want} {currency}")
         logger.info(f"want gained: {want_gained}")
@@ -303,13 +431,7 @@ class GeneralHarvester(IHarvester):
         Returns:
             bool: True if our bot is whitelisted to make function calls, False otherwise.
         """
-        if function in ["harvest", "harvestMta"]:
-            key = self.keeper_acl.functions.HARVESTER_ROLE().call()
-        elif function == "tend":
-            key = self.keeper_acl.functions.TENDER_ROLE().call()
-        elif function == "rewards_manager":
-            key = self.keeper_acl.functions.KEEPER_ROLE().call()
-        return self.keeper_acl.functions.hasRole(key, self.keeper_address).call()
+        return self.keeper_roles.has_role(KEEPER_FUNCTION_ROLES[function])
 
     def __process_tend(
         self,
@@ -332,6 +454,8 @@ class GeneralHarvester(IHarvester):
                     url=self.discord_url,
                 )
             elif tx_hash != HexBytes(0):
+                # Not mined in time or dropped, a nonce gap would block later txs
+                self.nonce_manager.resync()
                 send_success_to_discord(
                     tx_type=f"Tend {strategy_name}",
                     tx_hash=tx_hash,
@@ -340,6 +464,7 @@ class GeneralHarvester(IHarvester):
                 )
         except Exception as e:
             logger.error(f"Error processing tend tx: {e}")
+            record_tx("Tend", "failed", self.chain)
             send_error_to_discord(
                 strategy_name,
                 "Tend",
@@ -363,13 +488,32 @@ class GeneralHarvester(IHarvester):
             strategy_name (str, optional): Defaults to None.
             harvested (Decimal, optional): Amount of Sushi harvested. Defaults to None.
         """
+        tx_hash, max_target_block = self.send_harvest_tx(strategy, returns=returns)
+        self.confirm_harvest(strategy, strategy_name, tx_hash, max_target_block)
+
+    @strategy_rpc_context
+    def confirm_harvest(
+        self,
+        strategy: contract,
+        strategy_name: str,
+        tx_hash: HexBytes,
+        max_target_block: Optional[int] = None,
+    ):
+        """Waits for a sent harvest tx, records the harvest time and reports the
+        result to Discord.
+
+        Args:
+            strategy (contract)
+            strategy_name (str)
+            tx_hash (HexBytes): hash returned by send_harvest_tx
+            max_target_block (int, optional): last block targeted by flashbots bundles
+        """
         try:
-            tx_hash, max_target_block = self.__send_harvest_tx(
-                strategy, returns=returns
-            )
             succeeded, msg = confirm_transaction(
                 self.web3, tx_hash, max_block=max_target_block
             )
+            if tx_hash in self.bundle_submissions:
+                self.log_bundle_inclusion(tx_hash, succeeded)
             if succeeded:
                 # If successful, update last harvest harvest
                 # time to make sure we don't double harvest
@@ -386,6 +530,8 @@ class GeneralHarvester(IHarvester):
                     url=self.discord_url,
                 )
             elif tx_hash != HexBytes(0):
+                # Not mined in time or dropped, a nonce gap would block later txs
+                self.nonce_manager.resync()
                 if not self.use_flashbots:
                     # And if pending
                     self.update_last_harvest_time(strategy.address)
@@ -396,6 +542,7 @@ class GeneralHarvester(IHarvester):
                         url=self.discord_url,
                     )
                 else:
+                    record_tx("Harvest", "failed", self.chain)
                     send_error_to_discord(
                         strategy_name,
                         "Harvest",
@@ -406,6 +553,7 @@ class GeneralHarvester(IHarvester):
                     )
         except Exception as e:
             logger.error(f"Error processing harvest tx: {e}")
+            record_tx("Harvest", "failed", self.chain)
             send_error_to_discord(
                 strategy_name,
                 "Harvest",
@@ -442,6 +590,8 @@ class GeneralHarvester(IHarvester):
                     url=self.discord_url,
                 )
             elif tx_hash != HexBytes(0):
+                # Not mined in time or dropped, a nonce gap would block later txs
+                self.nonce_manager.resync()
                 send_success_to_discord(
                     tx_type="Harvest MTA",
                     tx_hash=tx_hash,
@@ -450,6 +600,7 @@ class GeneralHarvester(IHarvester):
                 )
         except Exception as e:
             logger.error(f"Error processing harvestMta tx: {e}")
+            record_tx("Harvest MTA", "failed", self.chain)
             send_error_to_discord(
                 "",
                 "Harvest MTA",
@@ -458,11 +609,29 @@ class GeneralHarvester(IHarvester):
                 keeper_address=self.keeper_address,
             )
 
-    def __send_harvest_tx(self, strategy: contract, returns: bool = True) -> HexBytes:
+    def log_bundle_inclusion(self, tx_hash: HexBytes, succeeded: bool):
+        """Logs for every target block of the bundle of tx_hash whether it was
+        included, missed, still pending or rejected by the relay.
+        """
+        submission = self.bundle_submissions.pop(tx_hash)
+        included_block = None
+        if succeeded:
+            included_block = get_receipt_watcher(self.web3).receipt(tx_hash)[
+                "blockNumber"
+            ]
+        inclusion = submission.inclusion(included_block, self.block_context.number)
+        logger.info(f"Bundle inclusion of {tx_hash.hex()}: {inclusion}")
+
+    @strategy_rpc_context
+    def send_harvest_tx(
+        self, strategy: contract, returns: bool = True
+    ) -> Tuple[HexBytes, Optional[int]]:
         """Sends transaction to ETH node for confirmation.
 
         Args:
             strategy (contract)
+            returns (bool, optional): call harvest instead of harvestNoReturn.
+                Defaults to True.
 
         Raises:
             Exception: If we have an issue sending transaction (unable to communicate with
@@ -470,39 +639,163 @@ class GeneralHarvester(IHarvester):
 
         Returns:
             HexBytes: Transaction hash for transaction that was sent.
+            int: Last block targeted by flashbots bundles, None if not using flashbots.
         """
         max_target_block = None
         tx_hash = HexBytes(0)
+        nonce = None
         try:
-            tx = self.__build_transaction(strategy.address, returns=returns)
-            signed_tx = self.web3.eth.account.sign_transaction(
-                tx, private_key=self.keeper_key
-            )
+            nonce = self.nonce_manager.get_nonce()
+            with span("build"):
+                tx = self.__build_transaction(strategy.address, nonce, returns=returns)
+            with span("sign"):
+                signed_tx = self.web3.eth.account.sign_transaction(
+                    tx, private_key=self.keeper_key
+                )
             tx_hash = signed_tx.hash
 
-            if not self.use_flashbots:
-                self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            else:
-                bundle = [
-                    {"signed_transaction": signed_tx.rawTransaction},
-                ]
-
-                block_number = self.web3.eth.block_number
-                for i in range(1, NUM_FLASHBOTS_BUNDLES + 1):
-                    self.web3.flashbots.send_bundle(
-                        bundle, target_block_number=block_number + i
-                    )
-                max_target_block = block_number + NUM_FLASHBOTS_BUNDLES
-                logger.info(f"Bundle broadcasted at {max_target_block}")
+            with span("send", flashbots=self.use_flashbots):
+                if not self.use_flashbots:
+                    self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+                else:
+                    submission = self.bundle_submitter.submit(signed_tx)
+                    self.bundle_submissions[tx_hash] = submission
+                    max_target_block = submission.max_target_block
+            record_tx("Harvest", "sent", self.chain)
 
         except ValueError as e:
             logger.error(f"Error in sending harvest tx: {e}")
+            record_tx("Harvest", "failed", self.chain)
+            self.nonce_manager.handle_error(nonce, e)
             tx_hash = get_hash_from_failed_tx_error(
                 e, "Harvest", chain=self.chain, keeper_address=self.keeper_address
             )
+        except Exception as e:
+            logger.error(f"Error in sending harvest tx: {e}")
+            record_tx("Harvest", "failed", self.chain)
+            # Unknown whether the node got the tx, so read the nonce back from it
+            self.nonce_manager.resync()
+            tx_hash = HexBytes(0)
         finally:
             return tx_hash, max_target_block
 
+    def send_harvest_bundle(
+        self,
+        strategies: List[contract.Contract],
+        returns: bool = True,
+        allow_reverts: bool = ALLOW_BUNDLE_REVERTS,
+    ) -> List[Tuple[HexBytes, Optional[int]]]:
+        """Sends the harvest txs of several strategies, with sequential nonces,
+        as flashbots bundles of up to MAX_BUNDLE_TXS txs instead of one bundle
+        per harvest. All bundles target the same blocks, but as their nonces
+        follow on each other a bundle can only be included after the ones before
+        it, i.e. in a later block or after them in the same block. Bundles after
+        one that was never included are dropped. Unless allow_reverts is set,
+        bundles are simulated first and harvests that revert are left out.
+
+        Args:
+            strategies (List[contract.Contract])
+            returns (bool, optional): call harvest instead of harvestNoReturn.
+                Defaults to True.
+            allow_reverts (bool, optional): let single harvests revert without the
+                rest of their bundle being dropped. Defaults to
+                ALLOW_BUNDLE_REVERTS.
+
+        Returns:
+            List[Tuple[HexBytes, Optional[int]]]: tx hash and last block targeted
+                for each strategy, like send_harvest_tx. The tx hash is 0x00 if
+                the harvest wasn't sent.
+        """
+        sent: Dict[str, Tuple[HexBytes, int]] = {}
+        retry = list(strategies)
+        while retry:
+            retry = self.__send_harvest_bundles(retry, returns, allow_reverts, sent)
+        for strategy in strategies:
+            if strategy.address not in sent:
+                record_tx("Harvest", "failed", self.chain)
+        return [
+            sent.get(strategy.address, (HexBytes(0), None)) for strategy in strategies
+        ]
+
+    def __send_harvest_bundles(
+        self,
+        strategies: List[contract.Contract],
+        returns: bool,
+        allow_reverts: bool,
+        sent: Dict[str, Tuple[HexBytes, int]],
+    ) -> List[contract.Contract]:
+        """Signs and sends the harvests of strategies in bundles, see
+        send_harvest_bundle().
+
+        Args:
+            strategies (List[contract.Contract])
+            returns (bool): call harvest instead of harvestNoReturn
+            allow_reverts (bool): let single harvests revert
+            sent (Dict[str, Tuple[HexBytes, int]]): strategy address -> tx hash
+                and last block targeted, updated with the harvests sent
+
+        Returns:
+            List[contract.Contract]: strategies to sign and send again, after the
+                harvests that reverted in simulation were dropped
+        """
+        signed_txs = []
+        for strategy in strategies:
+            nonce = None
+            try:
+                nonce = self.nonce_manager.get_nonce()
+                tx = self.__build_transaction(strategy.address, nonce, returns=returns)
+                signed_tx = self.web3.eth.account.sign_transaction(
+                    tx, private_key=self.keeper_key
+                )
+                signed_txs.append((strategy, nonce, signed_tx))
+            except Exception as e:
+                logger.error(f"Error building harvest tx of {strategy.address}: {e}")
+                # Last nonce handed out, so the next harvest reuses it
+                self.nonce_manager.handle_error(nonce, e)
+
+        for start in range(0, len(signed_txs), MAX_BUNDLE_TXS):
+            end = start + MAX_BUNDLE_TXS
+            bundle = [signed_tx for _, _, signed_tx in signed_txs[start:end]]
+            reverting = (
+                [signed_tx.hash for signed_tx in bundle] if allow_reverts else []
+            )
+            try:
+                # Without simulating, a single reverting harvest has the relay
+                # drop the whole bundle
+                submission = self.bundle_submitter.submit_bundle(
+                    bundle,
+                    reverting_tx_hashes=reverting,
+                    simulate=None if allow_reverts else True,
+                )
+            except BundleSimulationFailed as e:
+                retry = [
+                    strategy
+                    for strategy, _, signed_tx in signed_txs[start:]
+                    if signed_tx.hash not in e.tx_hashes
+                ]
+                if len(retry) == len(signed_txs[start:]):
+                    logger.error(f"Error in sending harvest bundle: {e}")
+                    self.nonce_manager.resync()
+                    return []
+                logger.warning(
+                    f"Dropping reverting harvests {[tx.hex() for tx in e.tx_hashes]} "
+                    "from bundle"
+                )
+                # Nonces of this and all later bundles are unused, sign the
+                # harvests that didn't revert again with sequential nonces
+                self.nonce_manager.rewind(signed_txs[start][1])
+                return retry
+            except Exception as e:
+                logger.error(f"Error in sending harvest bundle: {e}")
+                # Nonces of this and all later bundles are unused now
+                self.nonce_manager.resync()
+                return []
+            for strategy, _, signed_tx in signed_txs[start:end]:
+                self.bundle_submissions[signed_tx.hash] = submission
+                sent[strategy.address] = (signed_tx.hash, submission.max_target_block)
+                record_tx("Harvest", "sent", self.chain)
+        return []
+
     def __send_tend_tx(self, strategy: contract) -> HexBytes:
         """Sends transaction to ETH node for confirmation.
 
@@ -517,8 +810,10 @@ class GeneralHarvester(IHarvester):
             HexBytes: Transaction hash for transaction that was sent.
         """
         tx_hash = HexBytes(0)
+        nonce = None
         try:
-            tx = self.__build_transaction(strategy.address, function="tend")
+            nonce = self.nonce_manager.get_nonce()
+            tx = self.__build_transaction(strategy.address, nonce, function="tend")
             signed_tx = self.web3.eth.account.sign_transaction(
                 tx, private_key=self.keeper_key
             )
@@ -527,9 +822,17 @@ class GeneralHarvester(IHarvester):
             self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
         except ValueError as e:
             logger.error(f"Error in sending tend tx: {e}")
+            record_tx("Tend", "failed", self.chain)
+            self.nonce_manager.handle_error(nonce, e)
             tx_hash = get_hash_from_failed_tx_error(
                 e, "Tend", chain=self.chain, keeper_address=self.keeper_address
             )
+        except Exception as e:
+            logger.error(f"Error in sending tend tx: {e}")
+            record_tx("Tend", "failed", self.chain)
+            # Unknown whether the node got the tx, so read the nonce back from it
+            self.nonce_manager.resync()
+            tx_hash = HexBytes(0)
         finally:
             return tx_hash
 
@@ -547,8 +850,12 @@ class GeneralHarvester(IHarvester):
             HexBytes: Transaction hash for transaction that was sent.
         """
         tx_hash = HexBytes(0)
+        nonce = None
         try:
-            tx = self.__build_transaction(voter_proxy.address, function="harvestMta")
+            nonce = self.nonce_manager.get_nonce()
+            tx = self.__build_transaction(
+                voter_proxy.address, nonce, function="harvestMta"
+            )
             signed_tx = self.web3.eth.account.sign_transaction(
                 tx, private_key=self.keeper_key
             )
@@ -557,49 +864,59 @@ class GeneralHarvester(IHarvester):
             self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
         except ValueError as e:
             logger.error(f"Error in sending harvestMta tx: {e}")
+            record_tx("Harvest MTA", "failed", self.chain)
+            self.nonce_manager.handle_error(nonce, e)
             tx_hash = get_hash_from_failed_tx_error(
                 e, "Harvest MTA", chain=self.chain, keeper_address=self.keeper_address
             )
+        except Exception as e:
+            logger.error(f"Error in sending harvestMta tx: {e}")
+            record_tx("Harvest MTA", "failed", self.chain)
+            # Unknown whether the node got the tx, so read the nonce back from it
+            self.nonce_manager.resync()
+            tx_hash = HexBytes(0)
         finally:
             return tx_hash
 
     def __build_transaction(
-        self, address: str, returns: bool = True, function: str = "harvest"
+        self,
+        address: str,
+        nonce: int,
+        returns: bool = True,
+        function: str = "harvest",
     ) -> dict:
         """Builds transaction depending on which chain we're harvesting. EIP-1559
         requires different handling for ETH txs than the other EVM chains.
 
         Args:
             contract (contract): contract to use to build harvest tx
+            nonce (int): tx nonce, handed out by the keeper's nonce manager
 
         Returns:
             dict: tx dictionary
         """
         options = {
-            "nonce": self.web3.eth.get_transaction_count(
-                self.keeper_address, "pending"
-            ),
+            "nonce": nonce,
             "from": self.keeper_address,
             "gas": GAS_LIMITS[self.chain],
         }
         if self.chain == Network.Ethereum:
-            options["maxPriorityFeePerGas"] = get_priority_fee(self.web3)
+            options["maxPriorityFeePerGas"] = get_gas_quote(self.web3).priority_fee
             options["maxFeePerGas"] = self.__get_effective_gas_price()
         else:
             options["gasPrice"] = self.__get_effective_gas_price()
 
+        keeper_function = (
+            "harvestNoReturn" if function == "harvest" and not returns else function
+        )
+        # Served from the simulation already done for the profitability estimate
+        logger.info(f"estimated gas fee: {self.estimate_gas(address, keeper_function)}")
+
         if function == "harvest":
-            logger.info(
-                f"estimated gas fee: {self.__estimate_harvest_gas(address, returns)}"
-            )
             return self.__build_harvest_transaction(address, returns, options)
         elif function == "tend":
-            logger.info(f"estimated gas fee: {self.__estimate_tend_gas(address)}")
             return self.__build_tend_transaction(address, options)
         elif function == "harvestMta":
-            logger.info(
-                f"estimated gas fee: {self.__estimate_harvest_mta_gas(address)}"
-            )
             return self.__build_harvest_mta_transaction(address, options)
 
     def __build_harvest_transaction(
@@ -630,44 +947,57 @@ class GeneralHarvester(IHarvester):
         self, address: str, returns: bool = True, function: str = "harvest"
     ) -> Decimal:
         current_gas_price = self.__get_effective_gas_price()
-        if function == "harvest":
-            estimated_gas = self.__estimate_harvest_gas(address, returns)
-        elif function == "tend":
-            estimated_gas = self.__estimate_tend_gas(address)
-        elif function == "harvestMta":
-            estimated_gas = self.__estimate_harvest_mta_gas(address)
+        if function == "harvest" and not returns:
+            function = "harvestNoReturn"
+        estimated_gas = self.estimate_gas(address, function)
 
         return Decimal(current_gas_price * estimated_gas)
 
-    def __estimate_harvest_gas(self, strategy_address: str, returns: bool) -> Decimal:
-        if returns:
-            estimated_gas_to_harvest = self.keeper_acl.functions.harvest(
-                strategy_address
-            ).estimateGas({"from": self.keeper_address})
-        else:
-            estimated_gas_to_harvest = self.keeper_acl.functions.harvestNoReturn(
-                strategy_address
-            ).estimateGas({"from": self.keeper_address})
+    def simulate_call(self, address: str, function: str = "harvest"):
+        """Result of calling keeper ACL function on address, one eth_call per block.
 
-        return Decimal(estimated_gas_to_harvest)
+        Args:
+            address (str): strategy (or voter proxy) address passed to function
+            function (str, optional): keeper ACL function. Defaults to "harvest".
+        """
+        simulation = self.__get_simulation(address, function)
+        if simulation.call_result is None:
+            with span("simulate", function=function):
+                simulation.call_result = getattr(self.keeper_acl.functions, function)(
+                    address
+                ).call({"from": self.keeper_address})
+        return simulation.call_result
 
-    def __estimate_tend_gas(self, strategy_address: str) -> Decimal:
-        return Decimal(
-            self.keeper_acl.functions.tend(strategy_address).estimateGas(
-                {"from": self.keeper_address}
-            )
-        )
+    def estimate_gas(self, address: str, function: str = "harvest") -> Decimal:
+        """Gas used by keeper ACL function on address, one eth_estimateGas per block.
 
-    def __estimate_harvest_mta_gas(self, voter_proxy_address: str) -> Decimal:
-        return Decimal(
-            self.keeper_acl.functions.harvestMta(voter_proxy_address).estimateGas(
-                {"from": self.keeper_address}
-            )
-        )
+        Args:
+            address (str): strategy (or voter proxy) address passed to function
+            function (str, optional): keeper ACL function. Defaults to "harvest".
+        """
+        simulation = self.__get_simulation(address, function)
+        if simulation.gas is None:
+            with span("estimate_gas", function=function):
+                simulation.gas = getattr(self.keeper_acl.functions, function)(
+                    address
+                ).estimateGas({"from": self.keeper_address})
+        return Decimal(simulation.gas)
+
+    def __get_simulation(self, address: str, function: str) -> Simulation:
+        # Rewards manager harvests swap keeper_acl, so it's part of the key
+        key = (self.keeper_acl.address, function, address)
+        block_number = self.block_context.number
+        simulation = self.simulations.get(key)
+        if simulation is None or simulation.block_number != block_number:
+            simulation = Simulation(block_number=block_number)
+            self.simulations[key] = simulation
+        return simulation
 
     def __get_effective_gas_price(self) -> int:
         if self.chain == Network.Polygon:
-            response = requests.get("https://gasstation-mainnet.matic.network").json()
+            response = http_client.get(
+                "https://gasstation-mainnet.matic.network"
+            ).json()
             gas_price = self.web3.toWei(int(response.get("fast") * 1.1), "gwei")
         elif self.chain in [Network.Arbitrum, Network.Fantom]:
             gas_price = int(1.1 * self.web3.eth.gas_price)
@@ -678,6 +1008,4 @@ class GeneralHarvester(IHarvester):
         return gas_price
 
     def update_last_harvest_time(self, strategy_address: str):
-        self.last_harvest_times[strategy_address] = self.web3.eth.get_block("latest")[
-            "timestamp"
-        ]
+        self.last_harvest_times[strategy_address] = self.block_context.timestamp
@@ -0,0 +1,101 @@
+import sqlite3
+from contextlib import closing
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+# Blocks rescanned below the last processed block, block explorers can lag
+# behind the node by a few blocks
+RESCAN_BLOCKS = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scanned_blocks (
+    chain TEXT NOT NULL,
+    acl TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    PRIMARY KEY (chain, acl)
+);
+CREATE TABLE IF NOT EXISTS harvest_times (
+    chain TEXT NOT NULL,
+    acl TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    PRIMARY KEY (chain, acl, strategy)
+);
+"""
+
+
+class HarvestIndex:
+    """On-disk SQLite index of the latest harvest/tend time of every strategy
+    called through a keeper ACL, together with the highest block scanned so far.
+    Later runs only need to fetch the ACL txs mined after that block.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with closing(self.connect()) as conn, conn:
+            conn.executescript(SCHEMA)
+
+    def connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def get_scanned_block(self, chain: str, acl: str) -> Optional[int]:
+        """Highest block already scanned for acl, None if it was never scanned."""
+        with closing(self.connect()) as conn:
+            row = conn.execute(
+                "SELECT block_number FROM scanned_blocks WHERE chain = ? AND acl = ?",
+                (str(chain), acl),
+            ).fetchone()
+        return row[0] if row else None
+
+    def record(
+        self,
+        chain: str,
+        acl: str,
+        times: Dict[str, Tuple[int, int]],
+        scanned_block: int,
+    ):
+        """Stores the harvest times found up to scanned_block, keeping the latest
+        time of every strategy.
+
+        Args:
+            chain (str): chain of the ACL
+            acl (str): keeper ACL address
+            times (Dict[str, Tuple[int, int]]): strategy -> (timestamp, block number)
+            scanned_block (int): highest block the txs were fetched up to
+        """
+        with closing(self.connect()) as conn, conn:
+            conn.executemany(
+                """
+                INSERT INTO harvest_times VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (chain, acl, strategy) DO UPDATE SET
+                    timestamp = excluded.timestamp,
+                    block_number = excluded.block_number
+                WHERE excluded.block_number > harvest_times.block_number
+                """,
+                [
+                    (str(chain), acl, strategy, timestamp, block_number)
+                    for strategy, (timestamp, block_number) in times.items()
+                ],
+            )
+            conn.execute(
+                """
+                INSERT INTO scanned_blocks VALUES (?, ?, ?)
+                ON CONFLICT (chain, acl) DO UPDATE SET
+                    block_number = MAX(block_number, excluded.block_number)
+                """,
+                (str(chain), acl, scanned_block),
+            )
+
+    def get_times(self, chain: str, acl: str, start_block: int = 0) -> Dict[str, int]:
+        """Latest harvest timestamp of every strategy harvested after start_block."""
+        with closing(self.connect()) as conn:
+            rows = conn.execute(
+                """
+                SELECT strategy, timestamp FROM harvest_times
+                WHERE chain = ? AND acl = ? AND block_number >= ?
+                """,
+                (str(chain), acl, start_block),
+            ).fetchall()
+        return dict(rows)
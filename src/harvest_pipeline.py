@@ -0,0 +1,162 @@
+import asyncio
+import os
+from typing import Callable
+from typing import List
+from typing import Optional
+
+from hexbytes import HexBytes
+
+from src.batch_provider import batch
+from src.data_classes.contract import Contract
+from src.general_harvester import GeneralHarvester
+from src.json_logger import logger
+from src.tracing import span
+
+# Max number of strategies being evaluated or confirmed at the same time
+HARVEST_CONCURRENCY = int(os.getenv("HARVEST_CONCURRENCY", 4))
+
+
+class HarvestPipeline:
+    """Runs GeneralHarvester over a list of strategies concurrently. Harvest
+    conditions are evaluated, txs sent and confirmations awaited in parallel,
+    sequential nonces are handed out by the harvester's nonce manager. With
+    bundle set, all due harvests are sent together in flashbots bundles (see
+    GeneralHarvester.send_harvest_bundle) once every strategy was evaluated.
+    """
+
+    def __init__(
+        self,
+        harvester: GeneralHarvester,
+        concurrency: int = HARVEST_CONCURRENCY,
+        bundle: bool = False,
+    ):
+        self.harvester = harvester
+        self.concurrency = concurrency
+        self.bundle = bundle
+
+    def run(
+        self,
+        strategies: List[Contract],
+        is_harvest_due: Callable[[Contract], bool] = lambda strategy: True,
+    ):
+        """Harvests every strategy for which is_harvest_due and the harvester's
+        own checks (see GeneralHarvester.should_harvest) pass.
+
+        Args:
+            strategies (List[Contract]): strategies to process
+            is_harvest_due (Callable[[Contract], bool], optional): extra per run
+                conditions, e.g. time since last harvest and base fee.
+        """
+        asyncio.run(self.run_async(strategies, is_harvest_due))
+
+    async def run_async(
+        self,
+        strategies: List[Contract],
+        is_harvest_due: Callable[[Contract], bool],
+    ):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        if self.bundle:
+            await self.__process_bundled(strategies, is_harvest_due, semaphore)
+            return
+        await asyncio.gather(
+            *[
+                self.__process(strategy, is_harvest_due, semaphore)
+                for strategy in strategies
+            ]
+        )
+
+    async def __process_bundled(
+        self,
+        strategies: List[Contract],
+        is_harvest_due: Callable[[Contract], bool],
+        semaphore: asyncio.Semaphore,
+    ):
+        should_harvest = await asyncio.gather(
+            *[
+                self.__check(strategy, is_harvest_due, semaphore)
+                for strategy in strategies
+            ]
+        )
+        due = [
+            strategy for strategy, should in zip(strategies, should_harvest) if should
+        ]
+        if not due:
+            return
+
+        logger.info(f"+-----Harvesting {[strategy.name for strategy in due]}-----+")
+        sent = await asyncio.to_thread(
+            self.harvester.send_harvest_bundle,
+            [strategy.contract for strategy in due],
+        )
+        await asyncio.gather(
+            *[
+                self.__confirm(strategy, tx_hash, max_target_block, semaphore)
+                for strategy, (tx_hash, max_target_block) in zip(due, sent)
+            ]
+        )
+
+    async def __check(
+        self,
+        strategy: Contract,
+        is_harvest_due: Callable[[Contract], bool],
+        semaphore: asyncio.Semaphore,
+    ) -> bool:
+        async with semaphore:
+            try:
+                # Reads of concurrently evaluated strategies share JSON-RPC batches
+                with batch(self.harvester.web3):
+                    return await asyncio.to_thread(
+                        self.__should_harvest, strategy, is_harvest_due
+                    )
+            except Exception as e:
+                logger.error(f"Error running {strategy.name} harvest: {e}")
+                return False
+
+    async def __confirm(
+        self,
+        strategy: Contract,
+        tx_hash: HexBytes,
+        max_target_block: Optional[int],
+        semaphore: asyncio.Semaphore,
+    ):
+        async with semaphore:
+            try:
+                await asyncio.to_thread(
+                    self.harvester.confirm_harvest,
+                    strategy.contract,
+                    strategy.name,
+                    tx_hash,
+                    max_target_block,
+                )
+            except Exception as e:
+                logger.error(f"Error confirming {strategy.name} harvest: {e}")
+
+    async def __process(
+        self,
+        strategy: Contract,
+        is_harvest_due: Callable[[Contract], bool],
+        semaphore: asyncio.Semaphore,
+    ):
+        if not await self.__check(strategy, is_harvest_due, semaphore):
+            return
+
+        logger.info(f"+-----Harvesting {strategy.name} {strategy.address}-----+")
+        # Parent of the stage spans of this harvest
+        with span("harvest", strategy=strategy.address, strategy_name=strategy.name):
+            async with semaphore:
+                try:
+                    tx_hash, max_target_block = await asyncio.to_thread(
+                        self.harvester.send_harvest_tx, strategy.contract
+                    )
+                except Exception as e:
+                    logger.error(f"Error sending {strategy.name} harvest: {e}")
+                    return
+            # Other strategies can be evaluated while this one is being mined
+            await self.__confirm(strategy, tx_hash, max_target_block, semaphore)
+
+    def __should_harvest(
+        self, strategy: Contract, is_harvest_due: Callable[[Contract], bool]
+    ) -> bool:
+        return is_harvest_due(strategy) and self.harvester.should_harvest(
+            strategy.contract
+        )
@@ -0,0 +1,117 @@
+import asyncio
+import json
+from typing import Callable
+from typing import Optional
+
+import websockets
+from web3 import Web3
+from web3.types import BlockData
+
+from src.block_context import get_block_context
+from src.json_logger import logger
+from src.receipt_watcher import get_receipt_watcher
+
+# Seconds to wait before reconnecting a dropped websocket, doubled after every
+# failed attempt up to MAX_RECONNECT_DELAY
+RECONNECT_DELAY = 5
+MAX_RECONNECT_DELAY = 60
+
+
+def parse_head(head: dict) -> BlockData:
+    """Converts the hex quantities of a newHeads notification to ints, like
+    web3.eth.get_block does.
+    """
+    block = dict(head)
+    for key in ["number", "timestamp", "baseFeePerGas", "gasLimit", "gasUsed"]:
+        if isinstance(block.get(key), str):
+            block[key] = int(block[key], 16)
+    return block
+
+
+class HeadSubscriber:
+    """Long-running keeper mode driven by newHeads over a websocket instead of
+    polling. Every new header is pushed to the block context and receipt watcher
+    of web3, so decisions, gas quotes and receipt checks follow the chain head.
+    on_head runs for the latest header only: heads that arrive while it is still
+    busy are skipped rather than queued.
+    """
+
+    def __init__(
+        self,
+        ws_url: str,
+        web3: Web3,
+        on_head: Optional[Callable[[BlockData], None]] = None,
+        reconnect_delay: float = RECONNECT_DELAY,
+        max_reconnect_delay: float = MAX_RECONNECT_DELAY,
+    ):
+        self.ws_url = ws_url
+        self.web3 = web3
+        self.on_head = on_head
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.backoff = reconnect_delay
+        self.latest: Optional[BlockData] = None
+        self.new_head: Optional[asyncio.Event] = None
+
+    def run(self):
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        self.new_head = asyncio.Event()
+        worker = asyncio.create_task(self.__process_heads())
+        try:
+            while True:
+                try:
+                    await self.subscribe()
+                except Exception as e:
+                    logger.warning(
+                        f"newHeads subscription dropped: {e}, "
+                        f"reconnecting in {self.backoff}s"
+                    )
+                finally:
+                    # Fall back to polling while disconnected
+                    get_block_context(self.web3).unpin()
+                    get_receipt_watcher(self.web3).notify_head(None)
+                await asyncio.sleep(self.backoff)
+                self.backoff = min(self.backoff * 2, self.max_reconnect_delay)
+        finally:
+            worker.cancel()
+
+    async def subscribe(self):
+        async with websockets.connect(self.ws_url) as ws:
+            await ws.send(
+                json.dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": 1,
+                        "method": "eth_subscribe",
+                        "params": ["newHeads"],
+                    }
+                )
+            )
+            subscription = json.loads(await ws.recv())["result"]
+            logger.info(f"Subscribed to newHeads: {subscription}")
+            self.backoff = self.reconnect_delay
+            async for message in ws:
+                data = json.loads(message)
+                params = data.get("params", {})
+                if params.get("subscription") == subscription:
+                    self.handle_head(parse_head(params["result"]))
+
+    def handle_head(self, block: BlockData):
+        get_block_context(self.web3).update(block)
+        get_receipt_watcher(self.web3).notify_head(block["number"])
+        self.latest = block
+        if self.new_head is not None:
+            self.new_head.set()
+
+    async def __process_heads(self):
+        while True:
+            await self.new_head.wait()
+            self.new_head.clear()
+            if self.on_head is None:
+                continue
+            try:
+                await asyncio.to_thread(self.on_head, self.latest)
+            except Exception as e:
+                logger.error(f"Error handling block {self.latest['number']}: {e}")
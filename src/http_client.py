@@ -0,0 +1,93 @@
+import os
+from functools import lru_cache
+from typing import List
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.metrics import record_http_response
+
+# Seconds to wait for a connection/response before giving up
+DEFAULT_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 10))
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+# Keep-alive connections kept open per host
+POOL_MAXSIZE = 10
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to requests that don't set one."""
+
+    def __init__(self, *args, timeout: float = DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def make_session(allowed_methods: List[str]) -> requests.Session:
+    """Session with pooled keep-alive connections, a default timeout and retries
+    with backoff on connection errors and 429/5xx responses.
+
+    Args:
+        allowed_methods (List[str]): http methods safe to retry
+
+    Returns:
+        requests.Session
+    """
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=allowed_methods,
+        raise_on_status=False,
+    )
+    adapter = TimeoutHTTPAdapter(
+        max_retries=retry, pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.hooks["response"].append(record_http_response)
+    return session
+
+
+@lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """Returns the process wide session used for off-chain http calls (price api,
+    gas stations, block explorers, trace exports). Only GETs are retried, a
+    retried POST may be applied twice.
+
+    Returns:
+        requests.Session: shared session
+    """
+    return make_session(["GET"])
+
+
+@lru_cache(maxsize=None)
+def get_query_session() -> requests.Session:
+    """Returns the process wide session for read-only POSTs, like subgraph
+    queries, which are safe to retry.
+
+    Returns:
+        requests.Session: shared session
+    """
+    return make_session(["GET", "POST"])
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return get_session().get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return get_session().post(url, **kwargs)
+
+
+def query(url: str, **kwargs) -> requests.Response:
+    """POSTs a read-only query, retried like a GET."""
+    return get_query_session().post(url, **kwargs)
@@ -1,4 +1,3 @@
-import json
 import os
 from decimal import Decimal
 
@@ -14,9 +13,11 @@ from src.discord_utils import get_hash_from_failed_tx_error
 from src.discord_utils import send_oracle_error_to_discord
 from src.discord_utils import send_success_to_discord
 from src.json_logger import logger
+from src.nonce_manager import get_nonce_manager
 from src.tx_utils import get_effective_gas_price
 from src.tx_utils import get_gas_price_of_tx
-from src.tx_utils import get_priority_fee
+from src.tx_utils import get_gas_quote
+from src.utils import get_contract
 from src.web3_utils import confirm_transaction
 
 FEE_THRESHOLD = 0.01  # ratio of gas cost to harvest amount we're ok with
@@ -32,22 +33,27 @@ class ibBTCFeeCollector:
         self.web3 = web3
         self.keeper_key = keeper_key  # get secret here
         self.keeper_address = keeper_address  # get secret here
-        self.eth_usd_oracle = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(ETH_ETH_USD_CHAINLINK),
-            abi=self.__get_abi("oracle"),
+        self.nonce_manager = get_nonce_manager(
+            self.web3, Network.Ethereum, self.keeper_address
         )
-        self.btc_eth_oracle = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(ETH_BTC_ETH_CHAINLINK),
-            abi=self.__get_abi("oracle"),
+        self.eth_usd_oracle = get_contract(
+            self.web3,
+            Network.Ethereum,
+            "oracle",
+            self.web3.toChecksumAddress(ETH_ETH_USD_CHAINLINK),
         )
-        self.ibbtc = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(IBBTC_CORE_ADDRESS),
-            abi=self.__get_abi("ibbtc_core"),
+        self.btc_eth_oracle = get_contract(
+            self.web3,
+            Network.Ethereum,
+            "oracle",
+            self.web3.toChecksumAddress(ETH_BTC_ETH_CHAINLINK),
+        )
+        self.ibbtc = get_contract(
+            self.web3,
+            Network.Ethereum,
+            "ibbtc_core",
+            self.web3.toChecksumAddress(IBBTC_CORE_ADDRESS),
         )
-
-    def __get_abi(self, contract_id: str):
-        with open(f"./abi/eth/{contract_id}.json") as f:
-            return json.load(f)
 
     def collect_fees(self):
         # get outstanding fees
@@ -109,6 +115,8 @@ class ibBTCFeeCollector:
                     gas_cost=gas_price_of_tx,
                 )
             elif tx_hash != HexBytes(0):
+                # Not mined in time or dropped, a nonce gap would block later txs
+                self.nonce_manager.resync()
                 send_success_to_discord(tx_hash=tx_hash, tx_type="ibBTC Fee Collection")
         except Exception as e:
             logger.error(f"Error processing collection tx: {e}")
@@ -124,15 +132,17 @@ class ibBTCFeeCollector:
         Returns:
             HexBytes: Transaction hash for transaction that was sent.
         """
-        options = {
-            "nonce": self.web3.eth.get_transaction_count(self.keeper_address),
-            "from": self.keeper_address,
-            "gas": GAS_LIMITS[Network.Ethereum],
-            "maxPriorityFeePerGas": get_priority_fee(self.web3),
-            "maxFeePerGas": get_effective_gas_price(self.web3),
-        }
         tx_hash = HexBytes(0)
+        nonce = None
         try:
+            nonce = self.nonce_manager.get_nonce()
+            options = {
+                "nonce": nonce,
+                "from": self.keeper_address,
+                "gas": GAS_LIMITS[Network.Ethereum],
+                "maxPriorityFeePerGas": get_gas_quote(self.web3).priority_fee,
+                "maxFeePerGas": get_effective_gas_price(self.web3),
+            }
             tx = self.ibbtc.functions.collectFee().buildTransaction(options)
             signed_tx = self.web3.eth.account.sign_transaction(
                 tx, private_key=self.keeper_key
@@ -142,8 +152,14 @@ class ibBTCFeeCollector:
             self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
         except ValueError as e:
             logger.error(f"Error in sending collection tx: {e}")
+            self.nonce_manager.handle_error(nonce, e)
             tx_hash = get_hash_from_failed_tx_error(
                 e, logger, keeper_address=self.keeper_address
             )
+        except Exception as e:
+            logger.error(f"Error in sending collection tx: {e}")
+            # Unknown whether the node got the tx, so read the nonce back from it
+            self.nonce_manager.resync()
+            tx_hash = HexBytes(0)
         finally:
             return tx_hash
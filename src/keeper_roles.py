@@ -0,0 +1,169 @@
+import json
+import os
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.contract import Contract
+
+from src.json_logger import logger
+from src.multicall import multicall
+
+ROLE_GRANTED_TOPIC = Web3.keccak(text="RoleGranted(bytes32,address,address)").hex()
+ROLE_REVOKED_TOPIC = Web3.keccak(text="RoleRevoked(bytes32,address,address)").hex()
+
+
+class KeeperRoles:
+    """Caches the AccessControl role membership of the keeper address on an ACL
+    contract. Role hashes and hasRole() are resolved once per run in a batched
+    multicall, and can optionally be persisted to cache_path and reused by later
+    runs until a RoleGranted/RoleRevoked event for the keeper shows up.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        chain: str,
+        acl: Contract,
+        keeper_address: str,
+        cache_path: Optional[str] = None,
+    ):
+        self.web3 = web3
+        self.chain = chain
+        self.acl = acl
+        self.keeper_address = keeper_address
+        self.cache_path = cache_path or os.getenv("KEEPER_ROLES_CACHE")
+        self.role_keys: Dict[str, HexBytes] = {}
+        self.members: Dict[str, bool] = {}
+        if self.cache_path:
+            self.load()
+
+    @property
+    def cache_key(self) -> str:
+        return f"{self.chain}:{self.acl.address}:{self.keeper_address}"
+
+    def prefetch(self, role_names: List[str], block_identifier="latest"):
+        """Resolves role hashes and keeper membership for all role_names that
+        aren't cached yet in two multicall round-trips.
+        """
+        missing = [role for role in role_names if role not in self.members]
+        if not missing:
+            return
+        if self.cache_path and not isinstance(block_identifier, int):
+            # Persisted roles need to know which block they were read at
+            block_identifier = self.web3.eth.block_number
+
+        to_resolve = [role for role in missing if role not in self.role_keys]
+        keys = multicall(
+            self.web3,
+            self.chain,
+            [getattr(self.acl.functions, role)() for role in to_resolve],
+            block_identifier=block_identifier,
+        )
+        for role, key in zip(to_resolve, keys):
+            if key is not None:
+                self.role_keys[role] = HexBytes(key)
+
+        resolved = [role for role in missing if role in self.role_keys]
+        memberships = multicall(
+            self.web3,
+            self.chain,
+            [
+                self.acl.functions.hasRole(self.role_keys[role], self.keeper_address)
+                for role in resolved
+            ],
+            block_identifier=block_identifier,
+        )
+        for role, is_member in zip(resolved, memberships):
+            if is_member is not None:
+                self.members[role] = is_member
+
+        if self.cache_path:
+            self.save(block_identifier)
+
+    def has_role(self, role_name: str) -> bool:
+        """Checks if the keeper holds role_name, hitting the chain only on a cache miss.
+
+        Args:
+            role_name (str): name of the role getter on the ACL, e.g. HARVESTER_ROLE
+
+        Returns:
+            bool: True if the keeper address holds the role, False otherwise.
+        """
+        if role_name not in self.members:
+            self.prefetch([role_name])
+        if role_name not in self.members:
+            # Multicall failed, fall back to direct calls
+            key = getattr(self.acl.functions, role_name)().call()
+            self.role_keys[role_name] = HexBytes(key)
+            self.members[role_name] = self.acl.functions.hasRole(
+                key, self.keeper_address
+            ).call()
+        return self.members[role_name]
+
+    def load(self):
+        """Loads roles persisted by a previous run, dropping every role that was
+        granted or revoked for the keeper since then. The cache is ignored if the
+        role events can't be checked.
+        """
+        try:
+            with open(self.cache_path) as f:
+                cached = json.load(f).get(self.cache_key)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if not cached:
+            return
+
+        role_keys = {role: HexBytes(key) for role, key in cached["role_keys"].items()}
+        members = dict(cached["members"])
+
+        keeper_topic = "0x" + "0" * 24 + self.keeper_address[2:].lower()
+        try:
+            head = self.web3.eth.block_number
+            logs = []
+            if head > cached["block_number"]:
+                logs = self.web3.eth.get_logs(
+                    {
+                        "address": self.acl.address,
+                        "fromBlock": cached["block_number"] + 1,
+                        "toBlock": head,
+                        "topics": [
+                            [ROLE_GRANTED_TOPIC, ROLE_REVOKED_TOPIC],
+                            None,
+                            keeper_topic,
+                        ],
+                    }
+                )
+        except Exception as e:
+            logger.warning(
+                f"Error checking role events since last run, refetching: {e}"
+            )
+            return
+
+        self.role_keys = role_keys
+        self.members = members
+        changed_keys = {HexBytes(log["topics"][1]) for log in logs}
+        for role, key in self.role_keys.items():
+            if key in changed_keys:
+                logger.info(f"{role} changed for keeper since last run, refetching")
+                self.members.pop(role, None)
+        if head > cached["block_number"]:
+            # Next run only has to scan the blocks after this one
+            self.save(head)
+
+    def save(self, block_number: int):
+        try:
+            with open(self.cache_path) as f:
+                cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            cache = {}
+
+        cache[self.cache_key] = {
+            "block_number": block_number,
+            "role_keys": {role: key.hex() for role, key in self.role_keys.items()},
+            "members": self.members,
+        }
+        with open(self.cache_path, "w") as f:
+            json.dump(cache, f)
@@ -0,0 +1,148 @@
+import atexit
+import os
+from decimal import Decimal
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+from prometheus_client import CollectorRegistry
+from prometheus_client import Counter
+from prometheus_client import Histogram
+from prometheus_client import push_to_gateway
+from prometheus_client import start_http_server
+from prometheus_client import write_to_textfile
+from prometheus_client.core import CounterMetricFamily
+
+from src.json_logger import logger
+from src.rpc_metrics import current_job
+from src.rpc_metrics import metrics as rpc_metrics
+
+# Port metrics are served on by long-running keepers, see serve()
+METRICS_PORT = os.getenv("METRICS_PORT")
+# node-exporter textfile collector file metrics are written to at exit
+METRICS_TEXTFILE = os.getenv("METRICS_TEXTFILE")
+# Pushgateway metrics are pushed to at exit
+METRICS_PUSHGATEWAY = os.getenv("METRICS_PUSHGATEWAY")
+
+INCLUSION_BUCKETS = (5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+
+registry = CollectorRegistry()
+
+txs = Counter(
+    "keeper_txs",
+    "Keeper txs by status: sent, confirmed, pending or failed",
+    ["job", "chain", "tx_type", "status"],
+    registry=registry,
+)
+inclusion_seconds = Histogram(
+    "keeper_tx_inclusion_seconds",
+    "Seconds from starting to wait for a tx until it was mined",
+    ["job"],
+    buckets=INCLUSION_BUCKETS,
+    registry=registry,
+)
+gas_cost_usd = Counter(
+    "keeper_gas_cost_usd",
+    "USD spent on gas by confirmed keeper txs",
+    ["job", "chain", "tx_type"],
+    registry=registry,
+)
+http_requests = Counter(
+    "keeper_http_requests",
+    "Off-chain http requests (price api, gas stations, explorers, subgraphs)",
+    ["job", "host", "status"],
+    registry=registry,
+)
+http_latency_seconds = Histogram(
+    "keeper_http_latency_seconds",
+    "Latency of off-chain http requests",
+    ["job", "host"],
+    registry=registry,
+)
+
+
+class RpcCollector:
+    """Exposes the JSON-RPC stats recorded by src.rpc_metrics."""
+
+    def collect(self):
+        calls = CounterMetricFamily(
+            "keeper_rpc_calls",
+            "JSON-RPC requests by method",
+            labels=["job", "method", "status"],
+        )
+        latency = CounterMetricFamily(
+            "keeper_rpc_latency_seconds",
+            "Total latency of JSON-RPC requests by method",
+            labels=["job", "method"],
+        )
+        totals = {}
+        for method in rpc_metrics.summary()["methods"]:
+            key = (method["job"], method["method"])
+            total = totals.setdefault(key, {"calls": 0, "errors": 0, "latency": 0.0})
+            total["calls"] += method["calls"]
+            total["errors"] += method["errors"]
+            total["latency"] += method["total_latency"]
+        for (job, method), total in totals.items():
+            calls.add_metric([job, method, "ok"], total["calls"] - total["errors"])
+            calls.add_metric([job, method, "error"], total["errors"])
+            latency.add_metric([job, method], total["latency"])
+        yield calls
+        yield latency
+
+
+registry.register(RpcCollector())
+
+
+def get_tx_type(tx_type: str) -> str:
+    """Keeper function of a tx type like "Harvest <strategy name>", so strategy
+    names don't end up in label values.
+    """
+    return tx_type.split(" ")[0] if tx_type else "unknown"
+
+
+def record_tx(tx_type: str, status: str, chain: Optional[str] = None):
+    txs.labels(current_job(), chain or "unknown", get_tx_type(tx_type), status).inc()
+
+
+def record_gas_cost(tx_type: str, cost: Decimal, chain: Optional[str] = None):
+    gas_cost_usd.labels(current_job(), chain or "unknown", get_tx_type(tx_type)).inc(
+        float(cost)
+    )
+
+
+def record_inclusion(seconds: float):
+    inclusion_seconds.labels(current_job()).observe(seconds)
+
+
+def record_http_response(response: requests.Response, *args, **kwargs):
+    """requests response hook recording every off-chain http request."""
+    host = urlparse(response.url).hostname or "unknown"
+    http_requests.labels(current_job(), host, str(response.status_code)).inc()
+    http_latency_seconds.labels(current_job(), host).observe(
+        response.elapsed.total_seconds()
+    )
+
+
+def serve(port: Optional[str] = METRICS_PORT):
+    """Serves metrics over http if a port is configured, for long-running mode."""
+    if port:
+        start_http_server(int(port), registry=registry)
+        logger.info(f"Serving metrics on port {port}")
+
+
+def export():
+    """Writes metrics to the configured textfile and/or pushgateway."""
+    if METRICS_TEXTFILE:
+        try:
+            write_to_textfile(METRICS_TEXTFILE, registry)
+        except OSError as e:
+            logger.error(f"Error writing metrics to {METRICS_TEXTFILE}: {e}")
+    if METRICS_PUSHGATEWAY:
+        try:
+            push_to_gateway(METRICS_PUSHGATEWAY, job=current_job(), registry=registry)
+        except OSError as e:
+            logger.error(f"Error pushing metrics to {METRICS_PUSHGATEWAY}: {e}")
+
+
+if METRICS_TEXTFILE or METRICS_PUSHGATEWAY:
+    atexit.register(export)
@@ -0,0 +1,76 @@
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Union
+
+from web3 import Web3
+from web3._utils.abi import get_abi_output_types
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract import ContractFunction
+from web3.types import BlockIdentifier
+
+from config.constants import MULTICALL3
+from src.json_logger import logger
+from src.utils import get_contract
+
+# Max number of calls packed into a single aggregate3 eth_call
+MULTICALL_CHUNK_SIZE = 100
+
+
+def multicall(
+    web3: Web3,
+    chain: str,
+    calls: List[ContractFunction],
+    block_identifier: Union[BlockIdentifier, None] = "latest",
+    chunk_size: int = MULTICALL_CHUNK_SIZE,
+) -> List[Optional[Any]]:
+    """Executes a list of read-only contract calls through Multicall3 aggregate3,
+    splitting them into chunks of chunk_size calls per eth_call.
+
+    Args:
+        web3 (Web3): web3 node instance
+        chain (str): chain the contracts live on, used to pick the multicall abi
+        calls (List[ContractFunction]): bound contract function calls,
+            e.g. vault.functions.token()
+        block_identifier (BlockIdentifier, optional): block to pin all the reads to.
+            Defaults to "latest".
+        chunk_size (int, optional): max calls per round-trip.
+            Defaults to MULTICALL_CHUNK_SIZE.
+
+    Returns:
+        List[Optional[Any]]: decoded return value for every call in the same order.
+            Single output functions are unwrapped, failed calls return None.
+    """
+    multicall3 = get_contract(web3, chain, "multicall3", MULTICALL3)
+
+    results = []
+    for start in range(0, len(calls), chunk_size):
+        end = start + chunk_size
+        chunk = calls[start:end]
+        call_data = [
+            (call.address, True, call._encode_transaction_data()) for call in chunk
+        ]
+        raw_results = multicall3.functions.aggregate3(call_data).call(
+            block_identifier=block_identifier
+        )
+        for call, (success, return_data) in zip(chunk, raw_results):
+            results.append(_decode_result(web3, call, success, return_data))
+
+    return results
+
+
+def _decode_result(
+    web3: Web3, call: ContractFunction, success: bool, return_data: bytes
+) -> Optional[Any]:
+    if not success or not return_data:
+        logger.warning(f"Multicall to {call.address} {call.fn_name} failed")
+        return None
+
+    output_types = get_abi_output_types(call.abi)
+    decoded = web3.codec.decode_abi(output_types, return_data)
+    normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+
+    if len(normalized) == 1:
+        return normalized[0]
+    return normalized
@@ -0,0 +1,177 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import requests
+from web3.providers.base import BaseProvider
+from web3.types import RPCEndpoint
+from web3.types import RPCResponse
+
+from src.batch_provider import UNBATCHED_METHODS
+from src.batch_provider import BatchingHTTPProvider
+from src.json_logger import logger
+
+# Nodes more than this many blocks behind the highest head are left out
+MAX_HEAD_LAG = int(os.getenv("NODE_MAX_HEAD_LAG", 2))
+# Consecutive failures that take a node out of rotation
+MAX_FAILURES = 3
+# Seconds a failing node stays out of rotation before it is tried again
+CIRCUIT_COOLDOWN = float(os.getenv("NODE_CIRCUIT_COOLDOWN", 60))
+# Seconds between health checks re-ranking the nodes mid-run
+RECHECK_INTERVAL = float(os.getenv("NODE_RECHECK_INTERVAL", 300))
+
+
+@dataclass
+class Node:
+    provider: BatchingHTTPProvider
+    latency: float = float("inf")
+    head: int = 0
+    failures: int = 0
+    open_until: float = 0.0
+    # Public nodes are only used when no private node is, and never for sends
+    public: bool = False
+
+    @property
+    def endpoint_uri(self) -> str:
+        return self.provider.endpoint_uri
+
+    def is_available(self) -> bool:
+        return time.monotonic() >= self.open_until
+
+
+class NodePool(BaseProvider):
+    """Provider spreading requests over all configured nodes of a chain. Nodes are
+    health-checked in parallel and ranked by latency, leaving out nodes whose head
+    lags behind, with public nodes as a last resort. Requests go to the fastest
+    available node and fail over to the next one on connection errors, timeouts
+    and HTTP errors. A node failing MAX_FAILURES times in a row is skipped for
+    CIRCUIT_COOLDOWN seconds. Nodes are checked again every RECHECK_INTERVAL
+    seconds and once a circuit cooldown is over. Txs are only sent to private
+    nodes, a public node may leak them.
+    """
+
+    def __init__(
+        self,
+        endpoint_uris: List[str],
+        public_uris: List[str] = (),
+        recheck_interval: float = RECHECK_INTERVAL,
+    ):
+        self.nodes = [Node(BatchingHTTPProvider(uri)) for uri in endpoint_uris] + [
+            Node(BatchingHTTPProvider(uri), public=True) for uri in public_uris
+        ]
+        self.recheck_interval = recheck_interval
+        self.checked_at = time.monotonic()
+        self.check_lock = threading.Lock()
+
+    @property
+    def endpoint_uri(self) -> Optional[str]:
+        """Uri of the node requests currently go to."""
+        candidates = self.__candidates()
+        return candidates[0].endpoint_uri if candidates else None
+
+    def get_request_kwargs(self) -> Dict[str, Any]:
+        return self.nodes[0].provider.get_request_kwargs()
+
+    def check(self) -> List[Node]:
+        """Measures latency and head of every node in parallel and ranks them.
+
+        Returns:
+            List[Node]: healthy nodes, fastest first
+        """
+        self.checked_at = time.monotonic()
+        nodes = list(self.nodes)
+        with ThreadPoolExecutor(max_workers=len(nodes) or 1) as executor:
+            list(executor.map(self.__check_node, nodes))
+
+        healthy = [node for node in nodes if node.is_available()]
+        max_head = max([node.head for node in healthy], default=0)
+        for node in healthy:
+            if node.head < max_head - MAX_HEAD_LAG:
+                logger.warning(
+                    f"Node {node.endpoint_uri} is {max_head - node.head} blocks behind"
+                )
+                self.__open_circuit(node)
+        # Replaced rather than sorted in place, requests may be iterating it
+        self.nodes = sorted(
+            nodes, key=lambda node: (not node.is_available(), node.public, node.latency)
+        )
+        return [node for node in self.nodes if node.is_available()]
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        self.__recheck()
+        candidates = self.__candidates()
+        if method in UNBATCHED_METHODS:
+            candidates = [node for node in candidates if not node.public]
+        error = None
+        for node in candidates:
+            try:
+                response = node.provider.make_request(method, params)
+            except requests.RequestException as e:
+                logger.warning(f"Node {node.endpoint_uri} failed {method}: {e}")
+                self.__record_failure(node)
+                error = e
+                continue
+            node.failures = 0
+            return response
+        raise error or requests.ConnectionError(f"No node available for {method}")
+
+    @contextmanager
+    def batch(self):
+        """Batches concurrent requests, see BatchingHTTPProvider.batch."""
+        with ExitStack() as stack:
+            for node in self.nodes:
+                stack.enter_context(node.provider.batch())
+            yield
+
+    def __candidates(self) -> List[Node]:
+        nodes = self.nodes
+        available = [node for node in nodes if node.is_available()]
+        # All circuits open, try every node rather than failing outright
+        return available or sorted(nodes, key=lambda node: node.open_until)
+
+    def __recheck(self):
+        """Re-ranks the nodes if the last check is RECHECK_INTERVAL old or a
+        circuit cooldown ended since. Only one request runs the check, the others
+        go on with the current ranking.
+        """
+        now = time.monotonic()
+        cooled_down = any(
+            self.checked_at < node.open_until <= now for node in self.nodes
+        )
+        if now < self.checked_at + self.recheck_interval and not cooled_down:
+            return
+        if not self.check_lock.acquire(blocking=False):
+            return
+        try:
+            self.check()
+        finally:
+            self.check_lock.release()
+
+    def __check_node(self, node: Node):
+        start = time.monotonic()
+        try:
+            response = node.provider.make_request(RPCEndpoint("eth_blockNumber"), [])
+            node.head = int(response["result"], 16)
+            node.latency = time.monotonic() - start
+            node.failures = 0
+            node.open_until = 0.0
+        except Exception as e:
+            logger.error(f"Node {node.endpoint_uri} is unhealthy: {e}")
+            self.__open_circuit(node)
+
+    def __record_failure(self, node: Node):
+        node.failures += 1
+        if node.failures >= MAX_FAILURES:
+            self.__open_circuit(node)
+
+    def __open_circuit(self, node: Node):
+        node.failures = 0
+        node.open_until = time.monotonic() + CIRCUIT_COOLDOWN
@@ -0,0 +1,97 @@
+import threading
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from web3 import Web3
+
+from src.json_logger import logger
+
+# Node errors meaning our local nonce fell behind the chain
+NONCE_TOO_LOW_ERRORS = ["nonce too low", "already known", "replacement transaction"]
+
+
+class NonceManager:
+    """Hands out sequential nonces for a keeper address locally, so several txs
+    can be built and sent without waiting for each other to be mined. The nonce
+    is read from the node once and only re-read after something went wrong: a
+    nonce too low error, a gap left by a tx that wasn't sent or a dropped tx.
+    """
+
+    def __init__(self, web3: Web3, address: str):
+        self.web3 = web3
+        self.address = address
+        self.next_nonce: Optional[int] = None
+        self.lock = threading.Lock()
+
+    def get_nonce(self) -> int:
+        """Returns the next nonce to use, syncing with the node if needed."""
+        with self.lock:
+            if self.next_nonce is None:
+                self.next_nonce = self.web3.eth.get_transaction_count(
+                    self.address, "pending"
+                )
+                logger.info(f"Synced nonce of {self.address}: {self.next_nonce}")
+            nonce = self.next_nonce
+            self.next_nonce += 1
+            return nonce
+
+    def release(self, nonce: int):
+        """Gives back a nonce whose tx was never broadcast. It is only reused if
+        it was the last nonce handed out. If later nonces are already in flight,
+        e.g. sent concurrently by HarvestPipeline, reusing it would collide with
+        them and skipping it leaves a gap, so the next nonce is resynced.
+        """
+        with self.lock:
+            if self.next_nonce is not None and nonce == self.next_nonce - 1:
+                self.next_nonce = nonce
+            else:
+                self.next_nonce = None
+
+    def rewind(self, nonce: int):
+        """Gives back nonce and every nonce handed out after it, none of whose
+        txs was broadcast. Only for a caller that took all of them in a row, like
+        GeneralHarvester.send_harvest_bundle.
+        """
+        with self.lock:
+            if self.next_nonce is not None and nonce < self.next_nonce:
+                self.next_nonce = nonce
+
+    def resync(self):
+        """Drops the local nonce, the next get_nonce() reads it from the node."""
+        with self.lock:
+            self.next_nonce = None
+
+    def handle_error(self, nonce: Optional[int], error: Exception):
+        """Updates the local nonce after sending the tx with nonce failed.
+
+        Args:
+            nonce (int, optional): nonce of the failed tx, None if getting the
+                nonce itself failed
+            error (Exception): error raised while building or sending the tx
+        """
+        if nonce is None:
+            self.resync()
+        elif any(msg in str(error).lower() for msg in NONCE_TOO_LOW_ERRORS):
+            logger.warning(f"Nonce {nonce} of {self.address} is stale, resyncing")
+            self.resync()
+        else:
+            self.release(nonce)
+
+
+_nonce_managers: Dict[Tuple[str, str], NonceManager] = {}
+_registry_lock = threading.Lock()
+
+
+def get_nonce_manager(web3: Web3, chain: str, address: str) -> NonceManager:
+    """Returns the process wide nonce manager of address on chain."""
+    with _registry_lock:
+        key = (chain, address)
+        if key not in _nonce_managers:
+            _nonce_managers[key] = NonceManager(web3, address)
+        return _nonce_managers[key]
+
+
+def reset_nonce_managers():
+    with _registry_lock:
+        _nonce_managers.clear()
@@ -4,7 +4,6 @@ from datetime import datetime
 from datetime import timezone
 from traceback import format_exc
 
-import requests
 from hexbytes import HexBytes
 from web3 import Web3
 
@@ -17,14 +16,16 @@ from config.constants import SUSHI_SUBGRAPH
 from config.constants import UNIV2_DIGG_WBTC
 from config.constants import UNI_SUBGRAPH
 from config.enums import Network
+from src import http_client
 from src.discord_utils import get_hash_from_failed_tx_error
 from src.discord_utils import send_oracle_error_to_discord
 from src.discord_utils import send_success_to_discord
 from src.json_logger import logger
+from src.nonce_manager import get_nonce_manager
 from src.tx_utils import get_effective_gas_price
 from src.tx_utils import get_gas_price_of_tx
-from src.tx_utils import get_priority_fee
-from src.utils import get_abi
+from src.tx_utils import get_gas_quote
+from src.utils import get_contract
 from src.web3_utils import confirm_transaction
 
 # push report to centralizedOracle
@@ -43,21 +44,32 @@ class Oracle:
         self.web3 = web3
         self.keeper_key = keeper_key
         self.keeper_address = keeper_address
-        self.eth_usd_oracle = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(ETH_ETH_USD_CHAINLINK),
-            abi=get_abi(Network.Ethereum, "oracle"),
+        self.nonce_manager = get_nonce_manager(
+            self.web3, Network.Ethereum, self.keeper_address
         )
-        self.centralized_oracle = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(DIGG_CENTRALIZED_ORACLE),
-            abi=get_abi(Network.Ethereum, "digg_centralized_oracle"),
+        self.eth_usd_oracle = get_contract(
+            self.web3,
+            Network.Ethereum,
+            "oracle",
+            self.web3.toChecksumAddress(ETH_ETH_USD_CHAINLINK),
         )
-        self.chainlink_forwarder = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(DIGG_CHAINLINK_FORWARDER),
-            abi=get_abi(Network.Ethereum, "chainlink_forwarder"),
+        self.centralized_oracle = get_contract(
+            self.web3,
+            Network.Ethereum,
+            "digg_centralized_oracle",
+            self.web3.toChecksumAddress(DIGG_CENTRALIZED_ORACLE),
         )
-        self.digg_btc_chainlink = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(ETH_DIGG_BTC_CHAINLINK),
-            abi=get_abi(Network.Ethereum, "oracle"),
+        self.chainlink_forwarder = get_contract(
+            self.web3,
+            Network.Ethereum,
+            "chainlink_forwarder",
+            self.web3.toChecksumAddress(DIGG_CHAINLINK_FORWARDER),
+        )
+        self.digg_btc_chainlink = get_contract(
+            self.web3,
+            Network.Ethereum,
+            "oracle",
+            self.web3.toChecksumAddress(ETH_DIGG_BTC_CHAINLINK),
         )
 
     def is_negative_rebase(self):
@@ -105,6 +117,8 @@ class Oracle:
                     gas_cost=gas_price_of_tx,
                 )
             elif tx_hash != HexBytes(0):
+                # Not mined in time or dropped, a nonce gap would block later txs
+                self.nonce_manager.resync()
                 send_success_to_discord(
                     tx_type=f"Centralized Oracle {function}", tx_hash=tx_hash
                 )
@@ -124,11 +138,14 @@ class Oracle:
         Returns:
             HexBytes: Transaction hash for transaction that was sent.
         """
+        tx_hash = HexBytes(0)
+        nonce = None
         try:
-            priority_fee = get_priority_fee(self.web3)
+            nonce = self.nonce_manager.get_nonce()
+            priority_fee = get_gas_quote(self.web3).priority_fee
             logger.info(f"priority_fee: {priority_fee}")
             options = {
-                "nonce": self.web3.eth.get_transaction_count(self.keeper_address),
+                "nonce": nonce,
                 "from": self.keeper_address,
                 "maxPriorityFeePerGas": priority_fee,
                 "maxFeePerGas": get_effective_gas_price(self.web3),
@@ -151,11 +168,14 @@ class Oracle:
 
         except ValueError as e:
             logger.error(f"Error in sending oracle tx: {e}")
+            self.nonce_manager.handle_error(nonce, e)
             tx_hash = get_hash_from_failed_tx_error(
                 e, logger, keeper_address=self.keeper_address
             )
         except Exception as e:
             logger.error(format_exc())
+            # Unknown whether the node got the tx, so read the nonce back from it
+            self.nonce_manager.resync()
             tx_hash = get_hash_from_failed_tx_error(
                 e, logger, keeper_address=self.keeper_address
             )
@@ -229,7 +249,7 @@ class Oracle:
         }}
         """
 
-        r = requests.post(url, json={"query": query})
+        r = http_client.query(url, json={"query": query})
         return json.loads(r.content)
 
     def _get_today_report_datetime(self):
@@ -283,6 +303,8 @@ class Oracle:
                     gas_cost=gas_price_of_tx,
                 )
             elif tx_hash != HexBytes(0):
+                # Not mined in time or dropped, a nonce gap would block later txs
+                self.nonce_manager.resync()
                 send_success_to_discord(tx_type="Chainlink Forwarder", tx_hash=tx_hash)
         except Exception as e:
             logger.error(f"Error processing chainlink tx: {e}")
@@ -298,11 +320,14 @@ class Oracle:
         Returns:
             HexBytes: Transaction hash for transaction that was sent.
         """
+        tx_hash = HexBytes(0)
+        nonce = None
         try:
-            priority_fee = get_priority_fee(self.web3)
+            nonce = self.nonce_manager.get_nonce()
+            priority_fee = get_gas_quote(self.web3).priority_fee
             logger.info(f"priority_fee: {priority_fee}")
             options = {
-                "nonce": self.web3.eth.get_transaction_count(self.keeper_address),
+                "nonce": nonce,
                 "from": self.keeper_address,
                 "maxPriorityFeePerGas": priority_fee,
                 "maxFeePerGas": get_effective_gas_price(self.web3),
@@ -319,8 +344,14 @@ class Oracle:
 
         except ValueError as e:
             logger.error(f"Error in sending chainlink tx: {e}")
+            self.nonce_manager.handle_error(nonce, e)
             tx_hash = get_hash_from_failed_tx_error(
                 e, logger, keeper_address=self.keeper_address
             )
+        except Exception as e:
+            logger.error(f"Error in sending chainlink tx: {e}")
+            # Unknown whether the node got the tx, so read the nonce back from it
+            self.nonce_manager.resync()
+            tx_hash = HexBytes(0)
         finally:
             return tx_hash
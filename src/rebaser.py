@@ -1,4 +1,3 @@
-import json
 import os
 import time
 
@@ -17,9 +16,11 @@ from src.discord_utils import send_rebase_error_to_discord
 from src.discord_utils import send_rebase_to_discord
 from src.json_logger import logger
 from src.misc_utils import hours
+from src.nonce_manager import get_nonce_manager
 from src.tx_utils import get_effective_gas_price
 from src.tx_utils import get_gas_price_of_tx
-from src.tx_utils import get_priority_fee
+from src.tx_utils import get_gas_quote
+from src.utils import get_contract
 from src.web3_utils import confirm_transaction
 
 MAX_GAS_PRICE = int(1000e9)  # 1000 gwei
@@ -35,34 +36,42 @@ class Rebaser:
         self.web3 = web3
         self.keeper_key = keeper_key  # get secret here
         self.keeper_address = keeper_address  # get secret here
-        self.eth_usd_oracle = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(ETH_ETH_USD_CHAINLINK),
-            abi=self.__get_abi("oracle"),
+        self.nonce_manager = get_nonce_manager(
+            self.web3, Network.Ethereum, self.keeper_address
         )
-        self.digg_token = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(DIGG),
-            abi=self.__get_abi("digg_token"),
+        self.eth_usd_oracle = get_contract(
+            self.web3,
+            Network.Ethereum,
+            "oracle",
+            self.web3.toChecksumAddress(ETH_ETH_USD_CHAINLINK),
         )
-        self.digg_orchestrator = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(DIGG_ORCHESTRATOR),
-            abi=self.__get_abi("digg_orchestrator"),
+        self.digg_token = get_contract(
+            self.web3, Network.Ethereum, "digg_token", self.web3.toChecksumAddress(DIGG)
         )
-        self.digg_policy = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(DIGG_POLICY),
-            abi=self.__get_abi("digg_policy"),
+        self.digg_orchestrator = get_contract(
+            self.web3,
+            Network.Ethereum,
+            "digg_orchestrator",
+            self.web3.toChecksumAddress(DIGG_ORCHESTRATOR),
         )
-        self.uni_pair = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(UNIV2_DIGG_WBTC),
-            abi=self.__get_abi("univ2_pair"),
+        self.digg_policy = get_contract(
+            self.web3,
+            Network.Ethereum,
+            "digg_policy",
+            self.web3.toChecksumAddress(DIGG_POLICY),
         )
-        self.sushi_pair = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(SUSHI_DIGG_WBTC),
-            abi=self.__get_abi("sushi_pair"),
+        self.uni_pair = get_contract(
+            self.web3,
+            Network.Ethereum,
+            "univ2_pair",
+            self.web3.toChecksumAddress(UNIV2_DIGG_WBTC),
+        )
+        self.sushi_pair = get_contract(
+            self.web3,
+            Network.Ethereum,
+            "sushi_pair",
+            self.web3.toChecksumAddress(SUSHI_DIGG_WBTC),
         )
-
-    def __get_abi(self, contract_id: str):
-        with open(f"./abi/eth/{contract_id}.json") as f:
-            return json.load(f)
 
     def rebase(self):
         # call digg cuntions
@@ -146,6 +155,8 @@ class Rebaser:
                 )
                 send_rebase_to_discord(tx_hash=tx_hash, gas_cost=gas_price_of_tx)
             elif tx_hash != HexBytes(0):
+                # Not mined in time or dropped, a nonce gap would block later txs
+                self.nonce_manager.resync()
                 send_rebase_to_discord(tx_hash=tx_hash)
         except Exception as e:
             logger.error(f"Error processing rebase tx: {e}")
@@ -161,11 +172,14 @@ class Rebaser:
         Returns:
             HexBytes: Transaction hash for transaction that was sent.
         """
+        tx_hash = HexBytes(0)
+        nonce = None
         try:
+            nonce = self.nonce_manager.get_nonce()
             logger.info(f"max_priority_fee: {self.web3.eth.max_priority_fee}")
-            priority_fee = get_priority_fee(self.web3)
+            priority_fee = get_gas_quote(self.web3).priority_fee
             options = {
-                "nonce": self.web3.eth.get_transaction_count(self.keeper_address),
+                "nonce": nonce,
                 "from": self.keeper_address,
                 "maxPriorityFeePerGas": priority_fee,
                 "maxFeePerGas": get_effective_gas_price(self.web3),
@@ -178,8 +192,14 @@ class Rebaser:
             tx_hash = self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
         except ValueError as e:
             logger.error(f"Error in sending rebase tx: {e}")
+            self.nonce_manager.handle_error(nonce, e)
             tx_hash = get_hash_from_failed_tx_error(
                 e, logger, keeper_address=self.keeper_address
             )
+        except Exception as e:
+            logger.error(f"Error in sending rebase tx: {e}")
+            # Unknown whether the node got the tx, so read the nonce back from it
+            self.nonce_manager.resync()
+            tx_hash = HexBytes(0)
         finally:
             return tx_hash
@@ -0,0 +1,219 @@
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from hexbytes import HexBytes
+from web3 import Web3
+from web3 import exceptions
+from web3.types import TxReceipt
+
+from src.batch_provider import MAX_BATCH_SIZE
+from src.batch_provider import batch
+from src.block_context import get_block_context
+from src.json_logger import logger
+from src.rpc_metrics import context_map
+from src.rpc_metrics import job_context
+
+# Seconds between checks for a new block
+POLL_INTERVAL = 1
+# Receipts of mined txs kept for receipt()
+MAX_RECEIPTS = 256
+
+
+@dataclass
+class PendingTx:
+    tx_hash: HexBytes
+    deadline: float
+    max_block: Optional[int]
+    future: Future = field(default_factory=Future)
+
+
+class ReceiptWatcher:
+    """Tracks pending txs of a node and checks all of them once per new block
+    with concurrent eth_getTransactionReceipt requests, sent as a single
+    JSON-RPC batch by batching providers (see src.batch_provider). A
+    background thread runs while there is something to watch and resolves
+    the future of every tx when it lands, times out or, for flashbots bundles,
+    when its max block has passed. Heads pushed through notify_head() replace
+    polling the block number.
+    """
+
+    def __init__(self, web3: Web3, poll_interval: float = POLL_INTERVAL):
+        self.web3 = web3
+        self.poll_interval = poll_interval
+        self.pending: Dict[str, PendingTx] = {}
+        self.receipts: "OrderedDict[str, TxReceipt]" = OrderedDict()
+        self.lock = threading.RLock()
+        self.thread: Optional[threading.Thread] = None
+        self.last_block = None
+        # Latest block number pushed by a HeadSubscriber, None when polling
+        self.head: Optional[int] = None
+        self.new_head = threading.Event()
+
+    def watch(
+        self, tx_hash: HexBytes, timeout: int = 120, max_block: int = None
+    ) -> "Future[Tuple[bool, str]]":
+        """Starts watching tx_hash.
+
+        Args:
+            tx_hash (HexBytes): Transaction hash to identify transaction to wait on.
+            timeout (int, optional): Timeout in seconds, ignored if max_block is set.
+                Defaults to 120.
+            max_block (int, optional): Max block number to wait until. Defaults to None.
+
+        Returns:
+            Future[Tuple[bool, str]]: resolves to True if the transaction was
+                confirmed, False otherwise, and a log message.
+        """
+        key = tx_hash.hex()
+        with self.lock:
+            if key not in self.pending:
+                self.pending[key] = PendingTx(
+                    tx_hash=tx_hash,
+                    deadline=time.monotonic() + timeout,
+                    max_block=max_block,
+                )
+            future = self.pending[key].future
+            if self.thread is None:
+                # Polls serve every strategy, so they are attributed to the job
+                self.thread = threading.Thread(
+                    target=job_context().run, args=(self.__run,), daemon=True
+                )
+                self.thread.start()
+        return future
+
+    def __run(self):
+        while True:
+            with self.lock:
+                if not self.pending:
+                    self.thread = None
+                    # Txs watched by the next thread are checked right away
+                    self.last_block = None
+                    return
+                pending = list(self.pending.values())
+            block_number = None
+            try:
+                block_number = self.head
+                if block_number is None:
+                    block_number = self.web3.eth.block_number
+                if block_number != self.last_block:
+                    get_block_context(self.web3).observe(block_number)
+                    # Failed receipt requests are retried on the next poll
+                    if self.__check_receipts(pending):
+                        self.last_block = block_number
+            except Exception as e:
+                # Txs may still be mined, they only fail once they expire
+                logger.warning(f"Error checking pending txs, retrying: {e}")
+            self.__expire(pending, block_number)
+            self.new_head.wait(self.poll_interval)
+            self.new_head.clear()
+
+    def receipt(self, tx_hash: HexBytes) -> TxReceipt:
+        """Receipt of tx_hash, reusing the one fetched when the watcher saw it
+        mined.
+
+        Args:
+            tx_hash (HexBytes)
+
+        Returns:
+            TxReceipt: receipt of the mined tx
+        """
+        with self.lock:
+            receipt = self.receipts.get(HexBytes(tx_hash).hex())
+        if receipt is None:
+            receipt = self.web3.eth.get_transaction_receipt(tx_hash)
+        return receipt
+
+    def notify_head(self, block_number: Optional[int]):
+        """Checks pending receipts right away for a new head. None goes back to
+        polling the block number.
+        """
+        self.head = block_number
+        if block_number is not None:
+            self.new_head.set()
+
+    def __check_receipts(self, pending: List[PendingTx]) -> bool:
+        """Resolves every mined tx.
+
+        Returns:
+            bool: False if the receipt of any tx couldn't be fetched
+        """
+        checked = True
+        for tx, receipt in zip(pending, self.__get_receipts(pending)):
+            if isinstance(receipt, Exception):
+                logger.warning(f"Error waiting for {tx.tx_hash.hex()}: {receipt}")
+                checked = False
+            elif receipt is not None:
+                with self.lock:
+                    self.receipts[tx.tx_hash.hex()] = receipt
+                    if len(self.receipts) > MAX_RECEIPTS:
+                        self.receipts.popitem(last=False)
+                msg = f"Transaction {tx.tx_hash.hex()} succeeded!"
+                logger.info(msg)
+                self.__resolve(tx, True, msg)
+        return checked
+
+    def __expire(self, pending: List[PendingTx], block_number: Optional[int]):
+        for tx in pending:
+            if tx.future.done():
+                continue
+            if tx.max_block is None and time.monotonic() >= tx.deadline:
+                msg = f"Transaction {tx.tx_hash.hex()} timed out, not included in block yet."
+            elif (
+                tx.max_block is not None
+                and block_number is not None
+                and block_number > tx.max_block
+            ):
+                msg = f"Transaction {tx.tx_hash.hex()} was not included in the block."
+            else:
+                continue
+            logger.error(msg)
+            self.__resolve(tx, False, msg)
+
+    def __resolve(self, tx: PendingTx, succeeded: bool, msg: str):
+        with self.lock:
+            self.pending.pop(tx.tx_hash.hex(), None)
+        if not tx.future.done():
+            tx.future.set_result((succeeded, msg))
+
+    def __get_receipts(self, pending: List[PendingTx]) -> list:
+        """Receipt, None if not mined yet or the raised error, for every tx.
+        Requests go through web3, so they are recorded by its middlewares and
+        fail over with its provider.
+        """
+        if len(pending) == 1:
+            return [self.__get_receipt(pending[0])]
+        workers = min(len(pending), MAX_BATCH_SIZE)
+        with batch(self.web3), ThreadPoolExecutor(max_workers=workers) as executor:
+            return context_map(executor, self.__get_receipt, pending)
+
+    def __get_receipt(self, tx: PendingTx):
+        try:
+            return self.web3.eth.get_transaction_receipt(tx.tx_hash)
+        except exceptions.TransactionNotFound:
+            return None
+        except Exception as e:
+            return e
+
+
+_watchers: "weakref.WeakKeyDictionary[Web3, ReceiptWatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+_watchers_lock = threading.Lock()
+
+
+def get_receipt_watcher(web3: Web3) -> ReceiptWatcher:
+    """Returns the receipt watcher shared by everything using web3."""
+    with _watchers_lock:
+        if web3 not in _watchers:
+            _watchers[web3] = ReceiptWatcher(web3)
+        return _watchers[web3]
@@ -0,0 +1,235 @@
+import atexit
+import contextvars
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from web3 import Web3
+from web3.types import RPCEndpoint
+from web3.types import RPCResponse
+
+from src.json_logger import logger
+
+# Record every JSON-RPC request made through instrumented web3 instances
+RPC_METRICS = os.getenv("RPC_METRICS", "true").lower() == "true"
+# Job the requests of this process are attributed to when none is set
+DEFAULT_JOB = os.path.splitext(os.path.basename(sys.argv[0] or "keeper"))[0]
+
+_job: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "rpc_job", default=None
+)
+_strategy: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "rpc_strategy", default=None
+)
+
+
+def current_job() -> str:
+    """Job the current requests are attributed to."""
+    return _job.get() or DEFAULT_JOB
+
+
+def current_strategy() -> Optional[str]:
+    """Strategy the current requests are attributed to, if any."""
+    return _strategy.get()
+
+
+@contextmanager
+def rpc_context(job: Optional[str] = None, strategy: Optional[str] = None):
+    """Attributes the requests made inside the block to job and/or strategy.
+    Unset values are inherited from the enclosing context. The context follows
+    asyncio tasks and asyncio.to_thread, but not plain threads: run their work
+    under job_context() or with context_map().
+    """
+    tokens = []
+    if job is not None:
+        tokens.append((_job, _job.set(job)))
+    if strategy is not None:
+        tokens.append((_strategy, _strategy.set(strategy)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def set_job(job: str):
+    """Attributes the requests of the rest of the current context, e.g. the main
+    thread of a script, to job.
+    """
+    _job.set(job)
+
+
+def job_context() -> contextvars.Context:
+    """Context for a thread working for the whole job rather than a single
+    strategy, like the receipt watcher. Its requests are attributed to the
+    current job only.
+    """
+    context = contextvars.Context()
+    context.run(_job.set, _job.get())
+    return context
+
+
+def context_map(executor: Executor, fn: Callable, items: Iterable) -> List:
+    """Like executor.map(), but fn runs under a copy of the caller's context, so
+    the requests of the workers are attributed like the caller's.
+    """
+    futures = [
+        executor.submit(contextvars.copy_context().run, fn, item) for item in items
+    ]
+    return [future.result() for future in futures]
+
+
+def strategy_rpc_context(method: Callable) -> Callable:
+    """Attributes the requests of a keeper method taking the strategy contract as
+    first argument to that strategy.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, strategy, *args, **kwargs):
+        with rpc_context(strategy=strategy.address):
+            return method(self, strategy, *args, **kwargs)
+
+    return wrapper
+
+
+@dataclass
+class MethodStats:
+    calls: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+    def record(
+        self, latency: float, request_bytes: int, response_bytes: int, failed: bool
+    ):
+        self.calls += 1
+        self.errors += int(failed)
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+
+
+class RpcMetrics:
+    """Per job, strategy and method stats of the JSON-RPC requests of a process."""
+
+    def __init__(self):
+        self.stats: Dict[Tuple[str, Optional[str], str], MethodStats] = {}
+        self.lock = threading.Lock()
+
+    def record(
+        self,
+        method: str,
+        latency: float,
+        request_bytes: int,
+        response_bytes: int,
+        failed: bool,
+    ):
+        key = (current_job(), _strategy.get(), method)
+        with self.lock:
+            if key not in self.stats:
+                self.stats[key] = MethodStats()
+            self.stats[key].record(latency, request_bytes, response_bytes, failed)
+
+    def summary(self) -> dict:
+        """Totals and per job/strategy/method stats, latencies in seconds."""
+        with self.lock:
+            stats = dict(self.stats)
+        return {
+            "calls": sum(method.calls for method in stats.values()),
+            "errors": sum(method.errors for method in stats.values()),
+            "latency": round(sum(m.total_latency for m in stats.values()), 3),
+            "methods": [
+                {"job": job, "strategy": strategy, "method": method, **asdict(stat)}
+                for (job, strategy, method), stat in sorted(
+                    stats.items(), key=lambda item: -item[1].calls
+                )
+            ],
+        }
+
+    def log_summary(self):
+        summary = self.summary()
+        if summary["calls"]:
+            logger.info(
+                f"RPC summary: {summary['calls']} calls, {summary['errors']} errors",
+                extra={"rpc_summary": summary},
+            )
+
+    def reset(self):
+        with self.lock:
+            self.stats = {}
+
+
+metrics = RpcMetrics()
+
+
+def payload_size(payload: Any) -> int:
+    try:
+        return len(json.dumps(payload, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def rpc_metrics_middleware(
+    make_request: Callable[[RPCEndpoint, Any], Any], web3: Web3
+) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+    def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+        start = time.monotonic()
+        try:
+            response = make_request(method, params)
+        except Exception:
+            metrics.record(
+                method, time.monotonic() - start, payload_size(params), 0, True
+            )
+            raise
+        metrics.record(
+            method,
+            time.monotonic() - start,
+            payload_size(params),
+            payload_size(response),
+            isinstance(response, dict) and "error" in response,
+        )
+        return response
+
+    return middleware
+
+
+_summary_registered = False
+_summary_lock = threading.Lock()
+
+
+def instrument(web3: Web3) -> Web3:
+    """Records the requests of web3 and logs a summary when the process exits.
+
+    Args:
+        web3 (Web3): node to instrument, unchanged if RPC_METRICS is off
+
+    Returns:
+        Web3: web3
+    """
+    global _summary_registered
+    if not RPC_METRICS or "rpc_metrics" in web3.middleware_onion:
+        return web3
+    # Innermost, so latencies are as close to the wire as possible
+    web3.middleware_onion.inject(rpc_metrics_middleware, "rpc_metrics", layer=0)
+    with _summary_lock:
+        if not _summary_registered:
+            atexit.register(metrics.log_summary)
+            _summary_registered = True
+    return web3
@@ -0,0 +1,99 @@
+import atexit
+import os
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from discord import Embed
+
+from src.discord_notifier import get_notifier
+from src.json_logger import logger
+
+# Report a run's txs in a few summary embeds at the end instead of one post each
+DIGEST_MODE = os.getenv("DISCORD_DIGEST", "false").lower() == "true"
+USERNAME = "Keeper Digest"
+# Discord limits per embed
+MAX_FIELDS = 25
+MAX_FIELD_VALUE = 1024
+
+
+@dataclass
+class DigestEntry:
+    title: str
+    status: str  # Completed, Pending or Failed
+    chain: Optional[str] = None
+    explorer_url: Optional[str] = None
+    gas_cost: Optional[Decimal] = None
+    message: Optional[str] = None
+
+    def to_field(self) -> dict:
+        lines = []
+        if self.chain:
+            lines.append(f"Chain: {self.chain}")
+        if self.explorer_url:
+            lines.append(self.explorer_url)
+        if self.gas_cost is not None:
+            lines.append(f"Gas Cost: ${round(self.gas_cost, 2)}")
+        if self.message:
+            lines.append(self.message)
+        return {
+            "name": f"{self.status}: {self.title}",
+            "value": "\n".join(lines)[:MAX_FIELD_VALUE] or "-",
+            "inline": False,
+        }
+
+
+class RunDigest:
+    """Collects the results of a keeper run per webhook and reports them in one
+    or a few summary embeds when send() is called or the process exits.
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, List[DigestEntry]] = {}
+        self.lock = threading.Lock()
+
+    def add(self, url: str, entry: DigestEntry):
+        with self.lock:
+            self.entries.setdefault(url, []).append(entry)
+
+    def send(self):
+        """Queues the summary of every webhook and starts a new digest."""
+        with self.lock:
+            entries, self.entries = self.entries, {}
+        for url, url_entries in entries.items():
+            for embed in build_embeds(url_entries):
+                get_notifier().notify(url, USERNAME, embed=embed)
+
+    def close(self):
+        self.send()
+        if not get_notifier().flush():
+            logger.error("Run digest was not delivered before exiting")
+
+
+def build_embeds(entries: List[DigestEntry]) -> List[Embed]:
+    """Summary embeds of entries, MAX_FIELDS entries each."""
+    counts = {}
+    for entry in entries:
+        counts[entry.status] = counts.get(entry.status, 0) + 1
+    summary = ", ".join(f"{count} {status}" for status, count in counts.items())
+
+    embeds = []
+    for start in range(0, len(entries), MAX_FIELDS):
+        end = start + MAX_FIELDS
+        embed = Embed(title="**Badger Keeper Run Digest**", description=summary)
+        for entry in entries[start:end]:
+            embed.add_field(**entry.to_field())
+        embeds.append(embed)
+    return embeds
+
+
+@lru_cache(maxsize=None)
+def get_run_digest() -> RunDigest:
+    """Returns the digest of this process, sent when it exits."""
+    digest = RunDigest()
+    atexit.register(digest.close)
+    return digest
@@ -1,32 +1,75 @@
+import os
+import time
+from typing import Dict
+from typing import Tuple
 from typing import Union
 
-import requests
+from src import http_client
+
+PROD_API_URL = "https://api.badger.com"
+STAGING_API_URL = "https://staging-api.badger.com"
+# Seconds a downloaded price map stays valid
+PRICE_SNAPSHOT_TTL = int(os.getenv("PRICE_SNAPSHOT_TTL", 300))
 
 
 class PriceNotFound(Exception):
     pass
 
 
-def get_token_price(
-    token_address: str, currency: str, chain: str, use_staging: bool = False
-) -> Union[int]:
-    staging_base_url = "https://staging-api.badger.com"
-    base_url = staging_base_url if use_staging else "https://api.badger.com"
+class PriceSnapshot:
+    """In-memory copy of the Badger API price maps. Every (chain, currency,
+    environment) map is downloaded at most once per ttl seconds and all token
+    lookups are served from it.
+    """
 
-    response = requests.get(f"{base_url}/v2/prices?currency={currency}&chain={chain}")
-    response.raise_for_status()
-    price = response.json().get(token_address, 0)
+    def __init__(self, ttl: int = PRICE_SNAPSHOT_TTL):
+        self.ttl = ttl
+        self.prices: Dict[Tuple[str, str, str], Tuple[float, Dict[str, float]]] = {}
 
-    if price == 0:
-        response = requests.get(
-            f"{staging_base_url}/v2/prices?currency={currency}&chain={chain}"
+    def get_prices(
+        self, currency: str, chain: str, base_url: str = PROD_API_URL
+    ) -> Dict[str, float]:
+        key = (chain, currency, base_url)
+        cached = self.prices.get(key)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        response = http_client.get(
+            f"{base_url}/v2/prices?currency={currency}&chain={chain}"
         )
         response.raise_for_status()
+        prices = response.json()
+        self.prices[key] = (time.monotonic(), prices)
+        return prices
+
+    def get_price(
+        self, token_address: str, currency: str, chain: str, use_staging: bool = False
+    ) -> float:
+        """Looks up token_address on prod, falling back to staging when prod
+        has no price for it. Staging is only downloaded if a fallback happens.
+
+        Raises:
+            PriceNotFound: If neither api has a price for token_address.
+        """
+        if not use_staging:
+            price = self.get_prices(currency, chain).get(token_address, 0)
+            if price != 0:
+                return price
         try:
-            price = response.json()[token_address]
+            return self.get_prices(currency, chain, STAGING_API_URL)[token_address]
         except KeyError:
             raise PriceNotFound(
                 f"Could not find price on prod or staging api for {token_address}"
             )
 
-    return price
+    def clear(self):
+        self.prices = {}
+
+
+price_snapshot = PriceSnapshot()
+
+
+def get_token_price(
+    token_address: str, currency: str, chain: str, use_staging: bool = False
+) -> Union[int]:
+    return price_snapshot.get_price(token_address, currency, chain, use_staging)
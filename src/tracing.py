@@ -0,0 +1,177 @@
+import atexit
+import contextvars
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from src import http_client
+from src.json_logger import logger
+from src.rpc_metrics import current_strategy
+
+# Log the duration of every keeper stage (span) as a structured record
+TRACING = os.getenv("TRACING", "true").lower() == "true"
+# Collector spans are exported to as OTLP/HTTP JSON, e.g. http://localhost:4318
+OTLP_ENDPOINT = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "python-keepers")
+# Spans sent to the collector per export request
+EXPORT_BATCH_SIZE = 256
+
+# OTLP status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_time: int = field(default_factory=time.time_ns)
+    end_time: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return round(((self.end_time or time.time_ns()) - self.start_time) / 1e6, 3)
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def to_log(self) -> dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+            **self.attributes,
+        }
+
+    def to_otlp(self) -> dict:
+        """Span in the OTLP JSON encoding."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "kind": 1,  # internal
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time),
+            "attributes": [
+                {"key": key, "value": {"stringValue": str(value)}}
+                for key, value in self.attributes.items()
+            ],
+            "status": (
+                {"code": STATUS_ERROR, "message": self.error}
+                if self.error
+                else {"code": STATUS_OK}
+            ),
+        }
+
+
+class OtlpExporter:
+    """Buffers finished spans and posts them to an OpenTelemetry collector in
+    batches of EXPORT_BATCH_SIZE, the rest when the process exits.
+    """
+
+    def __init__(self, endpoint: str, batch_size: int = EXPORT_BATCH_SIZE):
+        self.url = f"{endpoint.rstrip('/')}/v1/traces"
+        self.batch_size = batch_size
+        self.spans: List[Span] = []
+        self.lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def export(self, span: Span):
+        with self.lock:
+            self.spans.append(span)
+            is_full = len(self.spans) >= self.batch_size
+        if is_full:
+            threading.Thread(target=self.flush, daemon=True).start()
+
+    def flush(self):
+        with self.lock:
+            spans, self.spans = self.spans, []
+        if not spans:
+            return
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": SERVICE_NAME},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        try:
+            http_client.post(self.url, json=payload).raise_for_status()
+        except Exception as e:
+            logger.warning(f"Error exporting {len(spans)} spans: {e}")
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+exporter = OtlpExporter(OTLP_ENDPOINT) if TRACING and OTLP_ENDPOINT else None
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Times a keeper stage. Spans opened inside the block, also from asyncio
+    tasks and asyncio.to_thread, become its children. Usable as a decorator.
+
+    Args:
+        name (str): stage name, e.g. build, sign, send, confirm
+        attributes: extra fields logged and exported with the span
+
+    Yields:
+        Span: the span, to add attributes while it's open
+    """
+    parent = _current_span.get()
+    strategy = current_strategy()
+    if strategy is not None:
+        attributes.setdefault("strategy", strategy)
+    current = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else secrets.token_hex(16),
+        span_id=secrets.token_hex(8),
+        parent_id=parent.span_id if parent else None,
+        attributes={**(parent.attributes if parent else {}), **attributes},
+    )
+    token = _current_span.set(current)
+    try:
+        yield current
+    except Exception as e:
+        current.error = str(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end_time = time.time_ns()
+        if TRACING:
+            logger.info(
+                f"span {name}: {current.duration_ms}ms",
+                extra={"span": current.to_log()},
+            )
+            if exporter is not None:
+                exporter.export(current)
@@ -1,9 +1,10 @@
 # TODO: Move this module as a shared functionality to badger utils lib
 import traceback
+import weakref
 from decimal import Decimal
 from typing import Dict
+from typing import Optional
 
-import requests
 from hexbytes import HexBytes
 from web3 import Web3
 from web3 import contract
@@ -11,9 +12,18 @@ from web3 import exceptions
 
 from config.constants import GAS_LIMITS
 from config.enums import Network
+from src import http_client
+from src.block_context import get_block_context
+from src.data_classes.gas_quote import GasQuote
 from src.json_logger import logger
+from src.nonce_manager import NonceManager
+from src.nonce_manager import get_nonce_manager
+from src.tracing import span
 
+_gas_quotes: "weakref.WeakKeyDictionary[Web3, GasQuote]" = weakref.WeakKeyDictionary()
 
+
+@span("usd_cost")
 def get_gas_price_of_tx(
     web3: Web3, gas_oracle: contract, tx_hash: HexBytes, chain: str = Network.Ethereum
 ) -> Decimal:
@@ -54,26 +64,45 @@ def get_gas_price_of_tx(
 def get_latest_base_fee(
     web3: Web3, default: int = int(100e9)
 ) -> int:  # default to 100 gwei
-    latest = web3.eth.get_block("latest")
-    raw_base_fee = latest.get("baseFeePerGas", hex(default))
-    if isinstance(raw_base_fee, str) and raw_base_fee.startswith("0x"):
-        base_fee = int(raw_base_fee, 0)
-    else:
-        base_fee = int(raw_base_fee)
-    return base_fee
+    return get_block_context(web3).base_fee(default)
 
 
-def get_effective_gas_price(web3: Web3) -> int:
+def get_gas_quote(web3: Web3) -> GasQuote:
+    """Returns the EIP-1559 fees for the latest block, computing them only once
+    per block so gas estimation and tx building reuse the same quote.
+
+    Args:
+        web3 (Web3): Web3 object
+
+    Returns:
+        GasQuote: base fee, priority fee and max fee for the latest block
+    """
+    block_number = get_block_context(web3).number
+    quote = _gas_quotes.get(web3)
+    if quote is not None and quote.block_number == block_number:
+        return quote
+
     # TODO: Currently using max fee (per gas) that can be used for this tx.
     # TODO: Maybe use base + priority (for average).
-    base_fee = get_latest_base_fee(web3)
-    logger.info(f"latest base fee: {base_fee}")
+    with span("gas_quote", block_number=block_number):
+        base_fee = get_latest_base_fee(web3)
+        logger.info(f"latest base fee: {base_fee}")
 
-    priority_fee = get_priority_fee(web3)
-    logger.info(f"avg priority fee: {priority_fee}")
+        priority_fee = get_priority_fee(web3)
+        logger.info(f"avg priority fee: {priority_fee}")
     # max fee aka gas price enough to get included in next 6 blocks
-    gas_price = 2 * base_fee + priority_fee
-    return gas_price
+    quote = GasQuote(
+        block_number=block_number,
+        base_fee=base_fee,
+        priority_fee=priority_fee,
+        max_fee=2 * base_fee + priority_fee,
+    )
+    _gas_quotes[web3] = quote
+    return quote
+
+
+def get_effective_gas_price(web3: Web3) -> int:
+    return get_gas_quote(web3).max_fee
 
 
 def get_priority_fee(
@@ -113,7 +142,7 @@ def get_priority_fee(
 
 def get_gas_price(web3: Web3, chain: Network) -> int:
     if chain == Network.Polygon:
-        response = requests.get("https://gasstation-mainnet.matic.network").json()
+        response = http_client.get("https://gasstation-mainnet.matic.network").json()
         gas_price = web3.toWei(int(response.get("fast") * 1.1), "gwei")
     elif chain == Network.Ethereum:
         gas_price = get_effective_gas_price(web3)
@@ -125,12 +154,12 @@ def get_gas_price(web3: Web3, chain: Network) -> int:
 
 def get_tx_options(web3: Web3, chain: Network, address: str) -> Dict:
     options = {
-        "nonce": web3.eth.get_transaction_count(address),
+        "nonce": get_nonce_manager(web3, chain, address).get_nonce(),
         "from": address,
         "gas": GAS_LIMITS[chain],
     }
     if chain == Network.Ethereum:
-        options["maxPriorityFeePerGas"] = get_priority_fee(web3)
+        options["maxPriorityFeePerGas"] = get_gas_quote(web3).priority_fee
         options["maxFeePerGas"] = get_gas_price(web3, chain)
     else:
         options["gasPrice"] = get_gas_price(web3, chain)
@@ -138,14 +167,21 @@ def get_tx_options(web3: Web3, chain: Network, address: str) -> Dict:
     return options
 
 
-def sign_and_send_tx(web3: Web3, tx: contract.TxParams, signer_key: str) -> HexBytes:
+def sign_and_send_tx(
+    web3: Web3,
+    tx: contract.TxParams,
+    signer_key: str,
+    nonce_manager: Optional[NonceManager] = None,
+) -> HexBytes:
     try:
         signed_tx = web3.eth.account.sign_transaction(tx, private_key=signer_key)
         tx_hash = signed_tx.hash
         logger.info(f"attempted tx_hash: {tx_hash}")
         web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-    except Exception:
+    except Exception as e:
         logger.error(f"Error in sending vote tx: {traceback.format_exc()}")
         tx_hash = HexBytes(0)
+        if nonce_manager is not None:
+            nonce_manager.handle_error(tx["nonce"], e)
 
     return tx_hash
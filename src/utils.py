@@ -1,16 +1,25 @@
 import json
 import os
+import threading
+import weakref
+from functools import lru_cache
+from typing import Dict
 from typing import Optional
 from typing import Tuple
+from typing import Type
 
 from hexbytes import HexBytes
 from web3 import Web3
+from web3.contract import Contract
 
 from config.constants import ABI_DIRS
 from config.constants import NODE_URL_SECRET_NAMES
+from config.constants import PUBLIC_NODE_URLS
 from config.enums import Network
 from src.aws import get_secret
 from src.json_logger import logger
+from src.node_pool import NodePool
+from src.rpc_metrics import instrument
 
 
 class NoHealthyNode(Exception):
@@ -18,29 +27,70 @@ class NoHealthyNode(Exception):
 
 
 def get_healthy_node(chain: Network) -> Web3:
-    node_credentials = NODE_URL_SECRET_NAMES[chain]
-    for node_credential in node_credentials:
-        secret_name = node_credential["name"]
-        secret_key = node_credential["key"]
-        url = get_secret(secret_name, secret_key)
-        if not url:
-            continue
-        node = Web3(Web3.HTTPProvider(url))
-        try:
-            node.eth.get_block_number()
-            return node
-        except Exception as e:
-            logger.error(e)
-    raise NoHealthyNode(f"No healthy nodes for chain: {chain}")
+    """Returns a web3 instance backed by a NodePool of every configured node of
+    chain, ranked by latency, with the public nodes of chain as a last resort.
+    Requests fail over to the next node mid-run.
+
+    Raises:
+        NoHealthyNode: if none of the nodes answers
+    """
+    urls = [
+        get_secret(node_credential["name"], node_credential["key"])
+        for node_credential in NODE_URL_SECRET_NAMES[chain]
+    ]
+    pool = NodePool(
+        [url for url in urls if url], public_uris=PUBLIC_NODE_URLS.get(chain, [])
+    )
+    healthy = pool.check()
+    if not healthy:
+        raise NoHealthyNode(f"No healthy nodes for chain: {chain}")
+    logger.info(f"Using {len(healthy)} nodes for {chain}")
+    return instrument(Web3(pool))
 
 
 # TODO: Don't duplicate common abis for all chains
+@lru_cache(maxsize=None)
 def get_abi(chain: str, contract_id: str):
+    """Loads abi of contract_id for chain. Abis are parsed once per process,
+    callers must not mutate the returned list.
+    """
     project_root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     with open(f"{project_root_dir}/abi/{ABI_DIRS[chain]}/{contract_id}.json") as f:
         return json.load(f)
 
 
+_factories: "weakref.WeakKeyDictionary[Web3, Dict[Tuple[str, str], Type[Contract]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_factories_lock = threading.Lock()
+
+
+def get_contract_factory(web3: Web3, chain: str, contract_id: str) -> Type[Contract]:
+    """Returns web3 contract class for contract_id, built once per web3 instance."""
+    with _factories_lock:
+        factories = _factories.setdefault(web3, {})
+        if (chain, contract_id) not in factories:
+            factories[(chain, contract_id)] = web3.eth.contract(
+                abi=get_abi(chain, contract_id)
+            )
+        return factories[(chain, contract_id)]
+
+
+def get_contract(web3: Web3, chain: str, contract_id: str, address: str) -> Contract:
+    """Binds the cached contract factory of contract_id to address.
+
+    Args:
+        web3 (Web3): web3 node instance
+        chain (str): chain of the contract, used to pick the abi
+        contract_id (str): abi file name without extension, e.g. "erc20"
+        address (str): checksummed contract address
+
+    Returns:
+        Contract: web3 contract instance
+    """
+    return get_contract_factory(web3, chain, contract_id)(address=address)
+
+
 def get_explorer(chain: Network, tx_hash: HexBytes) -> Optional[Tuple[str, str]]:
     if chain == Network.Ethereum:
         explorer_name = "Etherscan"
@@ -1,6 +1,5 @@
 import os
 
-import requests
 from hexbytes import HexBytes
 from web3 import Web3
 
@@ -9,14 +8,17 @@ from config.constants import ARB_VESTER_Q2_22
 from config.constants import ETH_BADGER
 from config.constants import GAS_LIMITS
 from config.enums import Network
+from src import http_client
 from src.discord_utils import get_hash_from_failed_tx_error
 from src.discord_utils import send_error_to_discord
 from src.discord_utils import send_success_to_discord
 from src.json_logger import logger
+from src.metrics import record_tx
+from src.nonce_manager import get_nonce_manager
 from src.tx_utils import get_effective_gas_price
 from src.tx_utils import get_gas_price_of_tx
-from src.tx_utils import get_priority_fee
-from src.utils import get_abi
+from src.tx_utils import get_gas_quote
+from src.utils import get_contract
 from src.web3_utils import confirm_transaction
 
 MAX_GAS_PRICE = int(1000e9)  # 1000 gwei
@@ -38,13 +40,20 @@ class Vester:
         self.chain = chain
         self.keeper_key = keeper_key  # get secret here
         self.keeper_address = keeper_address  # get secret here
-        self.eth_usd_oracle = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(base_oracle_address),
-            abi=get_abi(self.chain, "oracle"),
+        self.nonce_manager = get_nonce_manager(
+            self.web3, self.chain, self.keeper_address
         )
-        self.vesting_contract = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(vesting_contract_address),
-            abi=get_abi(self.chain, "vester"),
+        self.eth_usd_oracle = get_contract(
+            self.web3,
+            self.chain,
+            "oracle",
+            self.web3.toChecksumAddress(base_oracle_address),
+        )
+        self.vesting_contract = get_contract(
+            self.web3,
+            self.chain,
+            "vester",
+            self.web3.toChecksumAddress(vesting_contract_address),
         )
         self.discord_url = discord_url
 
@@ -70,6 +79,8 @@ class Vester:
                     url=self.discord_url,
                 )
             elif tx_hash != HexBytes(0):
+                # Not mined in time or dropped, a nonce gap would block later txs
+                self.nonce_manager.resync()
                 send_success_to_discord(
                     tx_type="Release Vested Badger to Tree",
                     tx_hash=tx_hash,
@@ -78,6 +89,7 @@ class Vester:
                 )
         except Exception as e:
             logger.error(f"Error processing release tx: {e}")
+            record_tx("Vest", "failed", self.chain)
             send_error_to_discord(
                 "Badger",
                 "Vest",
@@ -97,16 +109,16 @@ class Vester:
             HexBytes: Transaction hash for transaction that was sent.
         """
         tx_hash = HexBytes(0)
+        nonce = None
         try:
+            nonce = self.nonce_manager.get_nonce()
             options = {
-                "nonce": self.web3.eth.get_transaction_count(
-                    self.keeper_address, "pending"
-                ),
+                "nonce": nonce,
                 "from": self.keeper_address,
                 "gas": GAS_LIMITS[self.chain],
             }
             if self.chain == Network.Ethereum:
-                options["maxPriorityFeePerGas"] = get_priority_fee(self.web3)
+                options["maxPriorityFeePerGas"] = get_gas_quote(self.web3).priority_fee
                 options["maxFeePerGas"] = self._get_effective_gas_price()
                 logger.info(f"max_priority_fee: {self.web3.eth.max_priority_fee}")
             else:
@@ -121,16 +133,26 @@ class Vester:
             tx_hash = self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
         except ValueError as e:
             logger.error(f"Error in sending vesting release tx: {e}")
+            record_tx("Vest", "failed", self.chain)
+            self.nonce_manager.handle_error(nonce, e)
             tx_hash = get_hash_from_failed_tx_error(
                 e, "Vester", keeper_address=self.keeper_address
             )
+        except Exception as e:
+            logger.error(f"Error in sending vesting release tx: {e}")
+            record_tx("Vest", "failed", self.chain)
+            # Unknown whether the node got the tx, so read the nonce back from it
+            self.nonce_manager.resync()
+            tx_hash = HexBytes(0)
         finally:
             return tx_hash
 
     def _get_effective_gas_price(self) -> float:
         gas_price = 0
         if self.chain == Network.Polygon:
-            response = requests.get("https://gasstation-mainnet.matic.network").json()
+            response = http_client.get(
+                "https://gasstation-mainnet.matic.network"
+            ).json()
             gas_price = self.web3.toWei(int(response.get("fast") * 1.1), "gwei")
         elif self.chain in [Network.Arbitrum, Network.Fantom]:
             gas_price = int(1.1 * self.web3.eth.gas_price)
@@ -1,3 +1,5 @@
+import os
+import time
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -7,25 +9,45 @@ import requests
 from hexbytes import HexBytes
 from web3 import Web3
 from web3 import contract
-from web3 import exceptions
 
 from config.constants import MULTICHAIN_CONFIG
 from config.enums import Network
 from config.enums import VaultVersion
+from src import http_client
 from src.aws import get_secret
 from src.data_classes.contract import Contract
+from src.harvest_index import RESCAN_BLOCKS
+from src.harvest_index import HarvestIndex
 from src.json_logger import logger
+from src.metrics import record_inclusion
+from src.multicall import multicall
+from src.receipt_watcher import get_receipt_watcher
 from src.registry_utils import get_production_vaults
 from src.settings.registry_settings import ETH_REGISTRY_SETTINGS
-from src.utils import get_abi
+from src.tracing import span
+from src.utils import get_contract
+
+# 4-byte selector of keeper ACL functions -> whether the call is a harvest.
+# Every one of them takes a single address, so it can be sliced out of calldata.
+KEEPER_ACL_SELECTORS = {
+    "0x" + Web3.keccak(text=signature)[:4].hex().replace("0x", ""): is_harvest
+    for signature, is_harvest in [
+        ("harvest(address)", True),
+        ("harvestNoReturn(address)", True),
+        ("harvestMta(address)", True),
+        ("tend(address)", False),
+    ]
+}
 
 
 def get_strategies_from_registry(node: Web3, chain: str) -> list:
     strategies = []
 
-    registry = node.eth.contract(
-        address=node.toChecksumAddress(MULTICHAIN_CONFIG[chain]["registry"]),
-        abi=get_abi(chain, "registry"),
+    registry = get_contract(
+        node,
+        chain,
+        "registry",
+        node.toChecksumAddress(MULTICHAIN_CONFIG[chain]["registry"]),
     )
 
     for vault_owner in MULTICHAIN_CONFIG[chain]["vault_owner"]:
@@ -42,19 +64,15 @@ def get_strategy_from_vault(
     node: Web3, chain: str, vault_address: str, version: VaultVersion = VaultVersion.v1
 ) -> (contract, contract):
     if version == VaultVersion.v1_5:
-        vault_contract = node.eth.contract(
-            address=vault_address, abi=get_abi(chain, "vault_v1_5")
-        )
+        vault_contract = get_contract(node, chain, "vault_v1_5", vault_address)
         strategy_address = vault_contract.functions.strategy().call()
     else:
-        vault_contract = node.eth.contract(
-            address=vault_address, abi=get_abi(chain, "vault")
-        )
+        vault_contract = get_contract(node, chain, "vault", vault_address)
         token_address = vault_contract.functions.token().call()
         controller_address = vault_contract.functions.controller().call()
 
-        controller_contract = node.eth.contract(
-            address=controller_address, abi=get_abi(chain, "controller")
+        controller_contract = get_contract(
+            node, chain, "controller", controller_address
         )
 
         strategy_address = controller_contract.functions.strategies(
@@ -62,55 +80,136 @@ def get_strategy_from_vault(
         ).call()
 
     # TODO: handle v1 vs v2 strategy abi
-    strategy_contract = node.eth.contract(
-        address=strategy_address, abi=get_abi(chain, "strategy")
-    )
+    strategy_contract = get_contract(node, chain, "strategy", strategy_address)
 
     return strategy_contract, vault_contract
 
 
+def get_strategies_from_vaults_multicall(
+    node: Web3, chain: str, vaults: List[Tuple[str, VaultVersion]]
+) -> List[Tuple[contract, contract]]:
+    """Batched version of get_strategy_from_vault. Resolves token, controller
+    and strategy of every vault through Multicall3, so discovery costs two
+    (chunked) round-trips instead of three eth_calls per vault.
+
+    Args:
+        node (Web3): web3 node instance
+        chain (str): chain the vaults live on
+        vaults (List[Tuple[str, VaultVersion]]): vault addresses and their versions
+
+    Returns:
+        List[Tuple[contract, contract]]: (strategy, vault) contracts in the same
+            order as vaults
+    """
+    vault_contracts = []
+    first_round = []
+    for vault_address, version in vaults:
+        if version == VaultVersion.v1_5:
+            vault_contract = get_contract(node, chain, "vault_v1_5", vault_address)
+            first_round.append(vault_contract.functions.strategy())
+        else:
+            vault_contract = get_contract(node, chain, "vault", vault_address)
+            first_round.append(vault_contract.functions.token())
+            first_round.append(vault_contract.functions.controller())
+        vault_contracts.append(vault_contract)
+
+    first_results = iter(multicall(node, chain, first_round))
+
+    strategy_addresses = {}
+    second_round = []
+    second_round_vaults = []
+    for vault_address, version in vaults:
+        if version == VaultVersion.v1_5:
+            strategy_addresses[vault_address] = next(first_results)
+            continue
+        token_address = next(first_results)
+        controller_address = next(first_results)
+        if token_address is None or controller_address is None:
+            strategy_addresses[vault_address] = None
+            continue
+        controller_contract = get_contract(
+            node, chain, "controller", controller_address
+        )
+        second_round.append(controller_contract.functions.strategies(token_address))
+        second_round_vaults.append(vault_address)
+
+    for vault_address, strategy_address in zip(
+        second_round_vaults, multicall(node, chain, second_round)
+    ):
+        strategy_addresses[vault_address] = strategy_address
+
+    strategies_and_vaults = []
+    for (vault_address, version), vault_contract in zip(vaults, vault_contracts):
+        strategy_address = strategy_addresses[vault_address]
+        if strategy_address is None:
+            # Fall back to sequential reads so one bad vault doesn't break discovery
+            logger.warning(f"Multicall discovery failed for {vault_address}, retrying")
+            strategies_and_vaults.append(
+                get_strategy_from_vault(node, chain, vault_address, version=version)
+            )
+            continue
+        strategy_contract = get_contract(node, chain, "strategy", strategy_address)
+        strategies_and_vaults.append((strategy_contract, vault_contract))
+
+    return strategies_and_vaults
+
+
+@span("discovery")
 def get_strategies_and_vaults(
-    node: Web3, chain: str
+    node: Web3, chain: str, use_multicall: bool = False
 ) -> Tuple[List[Contract], List[Contract]]:
     strategies: List[Contract] = []
     vaults: List[Contract] = []
 
     vaults_by_version = get_production_vaults(node, chain)
 
-    for version in vaults_by_version.keys():
-        for vault_address in vaults_by_version[version].keys():
-            if vault_address not in ETH_REGISTRY_SETTINGS.externally_managed_vaults:
-                strategy, vault = get_strategy_from_vault(
-                    node, chain, vault_address, version=version
-                )
-                vaults.append(
-                    Contract(
-                        name=vaults_by_version[version][vault_address]["name"],
-                        contract=vault,
-                        address=vault_address,
-                    )
-                )
-                strategies.append(
-                    Contract(
-                        name=vaults_by_version[version][vault_address]["name"],
-                        contract=strategy,
-                        address=strategy.address,
-                    )
-                )
+    vaults_to_resolve = [
+        (vault_address, version)
+        for version in vaults_by_version.keys()
+        for vault_address in vaults_by_version[version].keys()
+        if vault_address not in ETH_REGISTRY_SETTINGS.externally_managed_vaults
+    ]
+    if use_multicall:
+        resolved = get_strategies_from_vaults_multicall(node, chain, vaults_to_resolve)
+    else:
+        resolved = [
+            get_strategy_from_vault(node, chain, vault_address, version=version)
+            for vault_address, version in vaults_to_resolve
+        ]
+
+    for (vault_address, version), (strategy, vault) in zip(vaults_to_resolve, resolved):
+        vault_name = vaults_by_version[version][vault_address]["name"]
+        vaults.append(
+            Contract(
+                name=vault_name,
+                contract=vault,
+                address=vault_address,
+            )
+        )
+        strategies.append(
+            Contract(
+                name=vault_name,
+                contract=strategy,
+                address=strategy.address,
+            )
+        )
 
     return strategies, vaults
 
 
+@span("confirm")
 def confirm_transaction(
     web3: Web3, tx_hash: HexBytes, timeout: int = 120, max_block: int = None
 ) -> Tuple[bool, str]:
     """Waits for transaction to appear within
         a given timeframe or before a given block (if specified), and then times out.
+    Receipts are checked by the shared ReceiptWatcher of web3, together with all
+    other transactions being confirmed at the same time.
 
     Args:
         web3 (Web3): Web3 instance
         tx_hash (HexBytes): Transaction hash to identify transaction to wait on.
-        timeout (int, optional): Timeout in seconds. Defaults to 60.
+        timeout (int, optional): Timeout in seconds. Defaults to 120.
         max_block (int, optional): Max block number to wait until. Defaults to None.
 
     Returns:
@@ -118,37 +217,29 @@ def confirm_transaction(
         msg: Log message.
     """
     logger.info(f"tx_hash before confirm: {tx_hash.hex()}")
-
-    while True:
-        try:
-            web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
-            msg = f"Transaction {tx_hash.hex()} succeeded!"
-            logger.info(msg)
-            return True, msg
-        except exceptions.TimeExhausted:
-            if max_block is None or web3.eth.block_number > max_block:
-                if max_block is None:
-                    msg = f"Transaction {tx_hash.hex()} timed out, not included in block yet."
-                else:
-                    msg = f"Transaction {tx_hash.hex()} was not included in the block."
-                logger.error(msg)
-                return False, msg
-            else:
-                continue
-        except Exception as e:
-            msg = f"Error waiting for {tx_hash.hex()}. Error: {e}."
-            logger.error(msg)
-            return False, msg
+    start = time.monotonic()
+    succeeded, msg = (
+        get_receipt_watcher(web3)
+        .watch(tx_hash, timeout=timeout, max_block=max_block)
+        .result()
+    )
+    if succeeded:
+        record_inclusion(time.monotonic() - start)
+    return succeeded, msg
 
 
+@span("harvest_times")
 def get_last_harvest_times(
     web3: Web3,
     keeper_acl: contract.Contract,
     start_block: int = 0,
     chain: Optional[Network] = Network.Ethereum,
+    index_path: Optional[str] = None,
 ) -> Optional[Dict]:
     """Fetches the latest harvest timestamps
         of strategies from Etherscan API which occur after `start_block`.
+    If an index path is given (or set in HARVEST_INDEX_PATH), times are kept in a
+    HarvestIndex and only txs mined since the previous run are fetched.
     NOTE: Temporary function until Harvested events are emitted from all strategies.
 
     Args:
@@ -157,6 +248,7 @@ def get_last_harvest_times(
         start_block (int, optional):
             Minimum block number to start fetching harvest timestamps from. Defaults to 0.
         chain (Network)
+        index_path (str, optional): Path of the on-disk harvest index. Defaults to None.
 
     Returns:
         dict: Dictionary of strategy addresses and their latest harvest timestamps.
@@ -171,43 +263,80 @@ def get_last_harvest_times(
         logger.warning(f"Unknown chain {chain}. Can't fetch harvest times")
         return
 
+    end_block = web3.eth.block_number
+    index_path = index_path or os.getenv("HARVEST_INDEX_PATH")
+    if not index_path:
+        times = _fetch_harvest_times(
+            web3, keeper_acl, url, api_key, start_block, end_block
+        )
+        return {strategy: timestamp for strategy, (timestamp, _) in times.items()}
+
+    index = HarvestIndex(index_path)
+    scanned_block = index.get_scanned_block(chain, keeper_acl.address)
+    fetch_from = start_block
+    if scanned_block is not None:
+        fetch_from = max(start_block, scanned_block - RESCAN_BLOCKS)
+    times = _fetch_harvest_times(web3, keeper_acl, url, api_key, fetch_from, end_block)
+    index.record(chain, keeper_acl.address, times, end_block)
+    return index.get_times(chain, keeper_acl.address, start_block)
+
+
+def _fetch_harvest_times(
+    web3: Web3,
+    keeper_acl: contract.Contract,
+    url: str,
+    api_key: str,
+    start_block: int,
+    end_block: int,
+) -> Dict[str, Tuple[int, int]]:
+    """Latest harvest timestamp and block of every strategy harvested through
+    keeper_acl between start_block and end_block, from the block explorer txlist.
+    """
     payload = {
         "module": "account",
         "action": "txlist",
         "address": keeper_acl.address,
         "startblock": start_block,
-        "endblock": web3.eth.block_number,
+        "endblock": end_block,
         "sort": "desc",
         "apikey": api_key,
     }
     try:
-        response = requests.get(url, params=payload)
+        response = http_client.get(url, params=payload)
         response.raise_for_status()  # Raise HTTP errors
 
         data = response.json()
+        acl_address = keeper_acl.address.lower()
         times = {}
         for tx in data["result"]:
-            if (
-                tx["to"] == ""
-                or web3.toChecksumAddress(tx["to"]) != keeper_acl.address
-                or "input" not in tx
-            ):
+            if tx["to"].lower() != acl_address or "input" not in tx:
                 continue
-            fn, args = keeper_acl.decode_function_input(tx["input"])
-            if (
-                str(fn)
-                in [
-                    "<Function harvest(address)>",
-                    "<Function harvestNoReturn(address)>",
-                ]
-                and args["strategy"] not in times
-            ):
-                times[args["strategy"]] = int(tx["timeStamp"])
-            elif (
-                str(fn) == "<Function harvestMta(address)>"
-                and args["voterProxy"] not in times
-            ):
-                times[args["voterProxy"]] = int(tx["timeStamp"])
+            strategy = _get_harvested_address(web3, keeper_acl, tx["input"])
+            if strategy is not None and strategy not in times:
+                times[strategy] = (int(tx["timeStamp"]), int(tx["blockNumber"]))
         return times
     except (KeyError, requests.HTTPError):
         raise ValueError("Last harvest time couldn't be fetched")
+
+
+def _get_harvested_address(
+    web3: Web3, keeper_acl: contract.Contract, tx_input: str
+) -> Optional[str]:
+    """Address harvested by a keeper ACL call, None if it's not a harvest.
+    Known selectors are classified without decoding the calldata.
+    """
+    selector = tx_input[:10].lower()
+    if selector in KEEPER_ACL_SELECTORS:
+        if not KEEPER_ACL_SELECTORS[selector]:
+            return None
+        # Address is right aligned in the first 32 byte argument
+        return web3.toChecksumAddress("0x" + tx_input[34:74])
+
+    fn, args = keeper_acl.decode_function_input(tx_input)
+    if str(fn) in [
+        "<Function harvest(address)>",
+        "<Function harvestNoReturn(address)>",
+    ]:
+        return args["strategy"]
+    elif str(fn) == "<Function harvestMta(address)>":
+        return args["voterProxy"]
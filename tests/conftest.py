@@ -0,0 +1,14 @@
+import pytest
+
+from src.aws import clear_secret_cache
+from src.nonce_manager import reset_nonce_managers
+from src.token_utils import price_snapshot
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Process wide caches must not leak state between tests"""
+    price_snapshot.clear()
+    clear_secret_cache()
+    reset_nonce_managers()
+    yield
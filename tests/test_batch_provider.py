@@ -0,0 +1,114 @@
+import json
+import threading
+from unittest.mock import MagicMock
+
+import responses
+from web3 import HTTPProvider
+
+from src.batch_provider import BatchingHTTPProvider
+from src.batch_provider import batch
+
+NODE_URL = "https://node.url"
+
+
+def batch_callback(request):
+    body = json.loads(request.body)
+    return (
+        200,
+        {},
+        json.dumps(
+            [
+                {"jsonrpc": "2.0", "id": item["id"], "result": item["params"][0]}
+                for item in reversed(body)
+            ]
+        ),
+    )
+
+
+@responses.activate
+def test_concurrent_requests_sent_as_one_batch():
+    responses.add_callback(responses.POST, NODE_URL, callback=batch_callback)
+    provider = BatchingHTTPProvider(NODE_URL, window=0.2)
+    results = {}
+
+    def request(i):
+        results[i] = provider.make_request("eth_getBalance", [hex(i)])["result"]
+
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {i: hex(i) for i in range(3)}
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_no_batching_without_window():
+    responses.add(
+        responses.POST, NODE_URL, json={"jsonrpc": "2.0", "id": 0, "result": "0x1"}
+    )
+    provider = BatchingHTTPProvider(NODE_URL)
+
+    assert provider.make_request("eth_blockNumber", [])["result"] == "0x1"
+    assert json.loads(responses.calls[0].request.body)["method"] == "eth_blockNumber"
+
+
+@responses.activate
+def test_batch_falls_back_to_single_requests():
+    responses.add(
+        responses.POST,
+        NODE_URL,
+        json={"jsonrpc": "2.0", "id": None, "error": {"message": "no batches"}},
+    )
+    responses.add(
+        responses.POST, NODE_URL, json={"jsonrpc": "2.0", "id": 0, "result": "0x1"}
+    )
+    responses.add(
+        responses.POST, NODE_URL, json={"jsonrpc": "2.0", "id": 1, "result": "0x2"}
+    )
+    provider = BatchingHTTPProvider(NODE_URL, window=0.2)
+    results = []
+
+    def request():
+        results.append(provider.make_request("eth_blockNumber", [])["result"])
+
+    with provider.batch():
+        threads = [threading.Thread(target=request) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted(results) == ["0x1", "0x2"]
+    assert len(responses.calls) == 3
+
+
+def test_batch_noop_for_other_providers():
+    with batch(MagicMock(provider=HTTPProvider(NODE_URL))):
+        pass
+
+
+@responses.activate
+def test_send_raw_transaction_not_batched():
+    def callback(request):
+        body = json.loads(request.body)
+        if isinstance(body, list):
+            return batch_callback(request)
+        return 200, {}, json.dumps({"jsonrpc": "2.0", "id": body["id"], "result": "0x"})
+
+    responses.add_callback(responses.POST, NODE_URL, callback=callback)
+    provider = BatchingHTTPProvider(NODE_URL, window=0.2)
+
+    with provider.batch():
+        read = threading.Thread(
+            target=provider.make_request, args=("eth_getBalance", ["0x1"])
+        )
+        read.start()
+        provider.make_request("eth_sendRawTransaction", ["0x1234"])
+        read.join()
+
+    bodies = [json.loads(call.request.body) for call in responses.calls]
+    assert bodies[0]["method"] == "eth_sendRawTransaction"
+    assert bodies[1]["method"] == "eth_getBalance"
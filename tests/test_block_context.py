@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock
+
+from src.block_context import BlockContext
+from src.block_context import get_block_context
+
+
+def test_latest_header_fetched_once_per_block():
+    web3 = MagicMock(
+        eth=MagicMock(
+            get_block=MagicMock(
+                return_value={"number": 100, "timestamp": 1234, "baseFeePerGas": 10}
+            )
+        )
+    )
+    context = BlockContext(web3, max_age=60)
+
+    assert context.number == 100
+    assert context.timestamp == 1234
+    assert context.base_fee() == 10
+    assert web3.eth.get_block.call_count == 1
+
+    # Same block seen again, header is still current
+    context.observe(100)
+    assert context.number == 100
+    assert web3.eth.get_block.call_count == 1
+
+    context.observe(101)
+    assert context.number == 100
+    assert web3.eth.get_block.call_count == 2
+
+
+def test_stale_header_refetched():
+    web3 = MagicMock(eth=MagicMock(get_block=MagicMock(return_value={"number": 1})))
+    context = BlockContext(web3, max_age=0)
+
+    context.latest()
+    context.latest()
+
+    assert web3.eth.get_block.call_count == 2
+
+
+def test_base_fee_defaults():
+    web3 = MagicMock(eth=MagicMock(get_block=MagicMock(return_value={"number": 1})))
+    assert BlockContext(web3).base_fee(default=5) == 5
+
+
+def test_block_context_shared_per_node():
+    web3 = MagicMock()
+    assert get_block_context(web3) is get_block_context(web3)
+    assert get_block_context(MagicMock()) is not get_block_context(web3)
@@ -0,0 +1,138 @@
+from unittest.mock import MagicMock
+
+import pytest
+from hexbytes import HexBytes
+
+from src.bundle_submitter import BundleSimulationFailed
+from src.bundle_submitter import BundleSubmission
+from src.block_context import get_block_context
+from src.bundle_submitter import BundleSubmitter
+
+
+@pytest.fixture
+def web3():
+    return MagicMock(
+        eth=MagicMock(
+            # Cached header is a block behind the node
+            block_number=100,
+            get_block=MagicMock(return_value={"number": 99}),
+        ),
+    )
+
+
+@pytest.fixture
+def signed_tx():
+    return MagicMock(rawTransaction=HexBytes("0x1234"), hash=HexBytes("0xabcd"))
+
+
+def test_submit_targets_next_blocks(web3, signed_tx):
+    submission = BundleSubmitter(web3, 3, simulate=False).submit(signed_tx)
+
+    assert web3.flashbots.send_bundle.call_count == 3
+    target_blocks = sorted(
+        call.kwargs["target_block_number"]
+        for call in web3.flashbots.send_bundle.call_args_list
+    )
+    assert target_blocks == [101, 102, 103]
+    assert submission.accepted_blocks == [101, 102, 103]
+    assert submission.max_target_block == 103
+    web3.flashbots.simulate.assert_not_called()
+
+
+def test_submit_partially_accepted(web3, signed_tx):
+    def send_bundle(bundle, target_block_number, opts=None):
+        if target_block_number == 102:
+            raise ValueError("relay error")
+
+    web3.flashbots.send_bundle = MagicMock(side_effect=send_bundle)
+
+    submission = BundleSubmitter(web3, 3, simulate=False).submit(signed_tx)
+
+    assert submission.accepted_blocks == [101, 103]
+    assert submission.max_target_block == 103
+
+
+def test_submit_rejected_everywhere(web3, signed_tx):
+    web3.flashbots.send_bundle = MagicMock(side_effect=ValueError("relay error"))
+
+    with pytest.raises(ValueError):
+        BundleSubmitter(web3, 2, simulate=False).submit(signed_tx)
+
+
+def test_submit_simulation_failed(web3, signed_tx):
+    web3.flashbots.simulate = MagicMock(
+        return_value={"results": [{"error": "execution reverted"}]}
+    )
+
+    with pytest.raises(BundleSimulationFailed):
+        BundleSubmitter(web3, 2, simulate=True).submit(signed_tx)
+    web3.flashbots.send_bundle.assert_not_called()
+
+
+def test_submit_bundle_simulation_reports_reverting_txs(web3):
+    signed_txs = [
+        MagicMock(rawTransaction=HexBytes("0x01"), hash=HexBytes("0xaa")),
+        MagicMock(rawTransaction=HexBytes("0x02"), hash=HexBytes("0xbb")),
+    ]
+    web3.flashbots.simulate = MagicMock(
+        return_value={
+            "results": [{"txHash": "0xaa"}, {"txHash": "0xbb", "error": "reverted"}]
+        }
+    )
+
+    with pytest.raises(BundleSimulationFailed) as e:
+        # Simulated even though the submitter doesn't simulate by default
+        BundleSubmitter(web3, 2).submit_bundle(signed_txs, simulate=True)
+    assert e.value.tx_hashes == [HexBytes("0xbb")]
+    web3.flashbots.send_bundle.assert_not_called()
+
+
+def test_inclusion():
+    submission = BundleSubmission(
+        tx_hashes=[HexBytes("0xabcd")],
+        target_blocks=[101, 102, 103],
+        accepted_blocks=[101, 102],
+    )
+
+    assert submission.inclusion(102, 104) == {
+        101: "missed",
+        102: "included",
+        103: "rejected",
+    }
+    assert submission.inclusion(None, 101) == {
+        101: "missed",
+        102: "pending",
+        103: "rejected",
+    }
+
+
+def test_submit_bundle_with_reverting_txs(web3):
+    signed_txs = [
+        MagicMock(rawTransaction=HexBytes("0x01"), hash=HexBytes("0xaa")),
+        MagicMock(rawTransaction=HexBytes("0x02"), hash=HexBytes("0xbb")),
+    ]
+    web3.flashbots.simulate = MagicMock(
+        return_value={"results": [{"txHash": "0xaa", "error": "execution reverted"}]}
+    )
+
+    submission = BundleSubmitter(web3, 2, simulate=True).submit_bundle(
+        signed_txs, reverting_tx_hashes=[HexBytes("0xaa")]
+    )
+
+    assert submission.tx_hashes == [HexBytes("0xaa"), HexBytes("0xbb")]
+    bundle = web3.flashbots.send_bundle.call_args.args[0]
+    assert [tx["signed_transaction"] for tx in bundle] == [
+        HexBytes("0x01"),
+        HexBytes("0x02"),
+    ]
+    assert web3.flashbots.send_bundle.call_args.kwargs["opts"] == {
+        "revertingTxHashes": ["0xaa"]
+    }
+
+
+def test_submit_targets_blocks_after_pinned_head(web3, signed_tx):
+    get_block_context(web3).update({"number": 200})
+
+    submission = BundleSubmitter(web3, 2, simulate=False).submit(signed_tx)
+
+    assert submission.target_blocks == [201, 202]
@@ -0,0 +1,57 @@
+import responses
+from discord import Embed
+
+from src.discord_notifier import DiscordNotifier
+from src.discord_notifier import Message
+from src.discord_notifier import coalesce
+
+URL = "https://discord.com/api/webhooks/1/token"
+
+
+def test_coalesce_merges_embeds_per_webhook_and_username():
+    messages = [
+        Message(URL, "Harvester", embed=Embed(title=str(i))) for i in range(12)
+    ] + [
+        Message(URL, "Tender", embed=Embed(title="tend")),
+        Message(URL, "Rebaser", content="text"),
+    ]
+
+    posts = coalesce(messages)
+
+    assert [
+        (username, len(payload.get("embeds", []))) for _, username, payload in posts
+    ] == [
+        ("Harvester", 10),
+        ("Harvester", 2),
+        ("Tender", 1),
+        ("Rebaser", 0),
+    ]
+    assert posts[-1][2] == {"username": "Rebaser", "content": "text"}
+
+
+@responses.activate
+def test_notifier_delivers_in_background_and_flushes():
+    responses.add(responses.POST, URL, status=204)
+    notifier = DiscordNotifier(coalesce_window=0.05)
+
+    notifier.notify(URL, "Harvester", embed=Embed(title="a"))
+    notifier.notify(URL, "Harvester", embed=Embed(title="b"))
+
+    assert notifier.flush(timeout=5)
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_notifier_honors_rate_limit(mocker):
+    sleep = mocker.patch("src.discord_notifier.time.sleep")
+    responses.add(
+        responses.POST, URL, status=429, json={"retry_after": 0.5}, headers={}
+    )
+    responses.add(responses.POST, URL, status=204)
+    notifier = DiscordNotifier(coalesce_window=0)
+
+    notifier.notify(URL, "Harvester", content="hello")
+
+    assert notifier.flush(timeout=5)
+    assert len(responses.calls) == 2
+    sleep.assert_any_call(0.5)
@@ -40,43 +40,40 @@ def test_send_critical_error_to_discord_send_not_called_invalid_url(mocker):
 
 def test_send_error_to_discord_send_called(mocker):
     secret = mocker.patch("src.discord_utils.get_secret")
-    mocker.patch("src.discord_utils.RequestsWebhookAdapter")
-    webhook = mocker.patch("src.discord_utils.Webhook.from_url")
+    notifier = mocker.patch("src.discord_utils.get_notifier")
     send_error_to_discord(
         sett_name="whatever",
         tx_type="whatever",
         tx_hash=HexBytes("0x123123"),
     )
-    assert webhook.return_value.send.called
+    assert notifier.return_value.notify.called
     assert secret.called
 
 
 def test_send_error_to_discord_send_secret_not_called_url_provided(mocker):
     secret = mocker.patch("src.discord_utils.get_secret")
-    mocker.patch("src.discord_utils.RequestsWebhookAdapter")
-    webhook = mocker.patch("src.discord_utils.Webhook.from_url")
+    notifier = mocker.patch("src.discord_utils.get_notifier")
     send_error_to_discord(
         sett_name="whatever",
         tx_type="whatever",
         tx_hash=HexBytes("0x123123"),
         webhook_url="some_hook",
     )
-    assert webhook.return_value.send.called
+    assert notifier.return_value.notify.call_args.args[0] == "some_hook"
     assert not secret.return_value.called
     assert not secret.called
 
 
 def test_send_success_to_discord_send_called(mocker):
     mocker.patch("src.discord_utils.get_secret")
-    mocker.patch("src.discord_utils.RequestsWebhookAdapter")
-    webhook = mocker.patch("src.discord_utils.Webhook.from_url")
+    notifier = mocker.patch("src.discord_utils.get_notifier")
 
     send_success_to_discord(
         tx_hash=HexBytes("0x123123"),
         tx_type="Harvest",
         gas_cost=Decimal(123),
     )
-    assert webhook.return_value.send.called
+    assert notifier.return_value.notify.called
 
 
 def test_send_rebase_to_discord_send_called(mocker):
@@ -104,3 +101,39 @@ def test_send_oracle_error_to_discord_send_called(mocker):
 
     send_oracle_error_to_discord(tx_type="whatever", error=Exception())
     assert webhook.return_value.send.called
+
+
+def test_send_success_to_discord_digest_mode(mocker):
+    mocker.patch("src.discord_utils.DIGEST_MODE", True)
+    digest = mocker.patch("src.discord_utils.get_run_digest")
+    notifier = mocker.patch("src.discord_utils.get_notifier")
+
+    send_success_to_discord(
+        tx_hash=HexBytes("0x123123"),
+        tx_type="Harvest",
+        gas_cost=Decimal(123),
+        sett_name="whatever",
+        url="some_hook",
+    )
+    url, entry = digest.return_value.add.call_args.args
+    assert url == "some_hook"
+    assert entry.status == "Completed"
+    assert entry.explorer_url == "https://etherscan.io/tx/0x123123"
+    assert not notifier.called
+
+
+def test_send_error_to_discord_digest_mode(mocker):
+    mocker.patch("src.discord_utils.DIGEST_MODE", True)
+    digest = mocker.patch("src.discord_utils.get_run_digest")
+    notifier = mocker.patch("src.discord_utils.get_notifier")
+
+    send_error_to_discord(
+        sett_name="whatever",
+        tx_type="Harvest",
+        error=Exception("reverted"),
+        webhook_url="some_hook",
+    )
+    _, entry = digest.return_value.add.call_args.args
+    assert entry.status == "Failed"
+    assert entry.message == "reverted"
+    assert not notifier.called
@@ -0,0 +1,26 @@
+from config.enums import Network
+from src.harvest_index import HarvestIndex
+
+ACL = "0x711A339c002386f9db409cA55b6A35a604aB6cF6"
+STRATEGY = "0x6D4BA00Fd7BB73b5aa5b3D6180c6f1B0c89f70D1"
+
+
+def test_record_keeps_latest_harvest(tmp_path):
+    index = HarvestIndex(str(tmp_path / "index.sqlite"))
+    assert index.get_scanned_block(Network.Ethereum, ACL) is None
+
+    index.record(Network.Ethereum, ACL, {STRATEGY: (200, 20)}, scanned_block=30)
+    # Rescanned older txs don't overwrite newer harvests
+    index.record(Network.Ethereum, ACL, {STRATEGY: (100, 10)}, scanned_block=25)
+
+    assert index.get_scanned_block(Network.Ethereum, ACL) == 30
+    assert index.get_times(Network.Ethereum, ACL) == {STRATEGY: 200}
+    assert index.get_times(Network.Fantom, ACL) == {}
+
+
+def test_get_times_drops_harvests_before_start_block(tmp_path):
+    index = HarvestIndex(str(tmp_path / "index.sqlite"))
+    index.record(Network.Ethereum, ACL, {STRATEGY: (100, 10)}, scanned_block=30)
+
+    assert index.get_times(Network.Ethereum, ACL, start_block=10) == {STRATEGY: 100}
+    assert index.get_times(Network.Ethereum, ACL, start_block=11) == {}
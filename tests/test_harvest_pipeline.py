@@ -0,0 +1,78 @@
+from unittest.mock import MagicMock
+
+from hexbytes import HexBytes
+
+from src.data_classes.contract import Contract
+from src.harvest_pipeline import HarvestPipeline
+
+
+def make_strategy(address: str) -> Contract:
+    return Contract(address=address, name=f"Strategy {address}", contract=MagicMock())
+
+
+def make_harvester(send_results: list) -> MagicMock:
+    harvester = MagicMock(keeper_address="0xkeeper")
+    harvester.should_harvest.return_value = True
+    harvester.send_harvest_tx.side_effect = send_results
+    return harvester
+
+
+def test_pipeline_harvests_due_strategies():
+    harvester = make_harvester([(HexBytes(1), None), (HexBytes(2), None)])
+    strategies = [make_strategy("0xA"), make_strategy("0xB"), make_strategy("0xC")]
+
+    HarvestPipeline(harvester, concurrency=2).run(
+        strategies, lambda strategy: strategy.address != "0xB"
+    )
+
+    sent = {call.args[0] for call in harvester.send_harvest_tx.call_args_list}
+    assert sent == {strategies[0].contract, strategies[2].contract}
+    confirmed = {call.args[0] for call in harvester.confirm_harvest.call_args_list}
+    assert confirmed == {strategies[0].contract, strategies[2].contract}
+
+
+def test_pipeline_skips_strategies_that_fail_evaluation():
+    harvester = make_harvester([(HexBytes(1), None)])
+    harvester.should_harvest.side_effect = [ValueError("not whitelisted"), True]
+    strategies = [make_strategy("0xA"), make_strategy("0xB")]
+
+    HarvestPipeline(harvester, concurrency=1).run(strategies)
+
+    assert harvester.send_harvest_tx.call_count == 1
+    assert harvester.confirm_harvest.call_count == 1
+
+
+def test_pipeline_continues_after_send_and_confirm_errors():
+    harvester = make_harvester(
+        [ConnectionError("node down"), (HexBytes(2), None), (HexBytes(3), None)]
+    )
+    harvester.confirm_harvest.side_effect = [ValueError("receipt error"), None]
+    strategies = [make_strategy("0xA"), make_strategy("0xB"), make_strategy("0xC")]
+
+    HarvestPipeline(harvester, concurrency=1).run(strategies)
+
+    assert harvester.send_harvest_tx.call_count == 3
+    assert harvester.confirm_harvest.call_count == 2
+
+
+def test_pipeline_bundles_due_strategies():
+    harvester = make_harvester([])
+    harvester.send_harvest_bundle.return_value = [(HexBytes(1), 7), (HexBytes(2), 7)]
+    strategies = [make_strategy("0xA"), make_strategy("0xB"), make_strategy("0xC")]
+
+    HarvestPipeline(harvester, concurrency=2, bundle=True).run(
+        strategies, lambda strategy: strategy.address != "0xB"
+    )
+
+    harvester.send_harvest_tx.assert_not_called()
+    harvester.send_harvest_bundle.assert_called_once_with(
+        [strategies[0].contract, strategies[2].contract]
+    )
+    confirmed = {
+        (call.args[0], call.args[2])
+        for call in harvester.confirm_harvest.call_args_list
+    }
+    assert confirmed == {
+        (strategies[0].contract, HexBytes(1)),
+        (strategies[2].contract, HexBytes(2)),
+    }
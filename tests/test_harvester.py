@@ -1,8 +1,10 @@
 from unittest.mock import MagicMock
 
 import pytest
+from hexbytes import HexBytes
 
 from config.enums import Network
+from src.bundle_submitter import BundleSimulationFailed
 from src.general_harvester import GeneralHarvester
 from src.misc_utils import hours
 
@@ -23,7 +25,11 @@ def test_time_to_harvest_true(mocker, chain: Network):
     harvester = GeneralHarvester(
         chain=chain,
         web3=MagicMock(
-            eth=MagicMock(get_block=MagicMock(return_value={"timestamp": time_now}))
+            eth=MagicMock(
+                get_block=MagicMock(
+                    return_value={"number": 1234, "timestamp": time_now}
+                )
+            )
         ),
         keeper_acl="0x",
         keeper_address="0x",
@@ -48,9 +54,214 @@ def test_time_to_harvest_false(mocker, chain: Network):
     harvester = GeneralHarvester(
         chain=chain,
         web3=MagicMock(
-            eth=MagicMock(get_block=MagicMock(return_value={"timestamp": time_now}))
+            eth=MagicMock(
+                get_block=MagicMock(
+                    return_value={"number": 1234, "timestamp": time_now}
+                )
+            )
         ),
         keeper_acl="0x",
         keeper_address="0x",
     )
     assert harvester.is_time_to_harvest(MagicMock(address=strategy), hours(96)) is False
+
+
+def test_prefetch(mocker):
+    mocker.patch("src.general_harvester.get_last_harvest_times", return_value={})
+    mocker.patch(
+        "src.keeper_roles.multicall",
+        side_effect=[[b"\x01" * 32, b"\x02" * 32], [True, False]],
+    )
+    multicall = mocker.patch(
+        "src.general_harvester.multicall",
+        side_effect=[
+            # Name and want of every strategy
+            ["Strategy A", "0xwantA", "Strategy B", None],
+            # Balance and decimals of every want
+            [100, 18],
+        ],
+    )
+    harvester = GeneralHarvester(
+        web3=MagicMock(
+            eth=MagicMock(get_block=MagicMock(return_value={"number": 1234}))
+        ),
+        keeper_acl="0x",
+        keeper_address="0x",
+    )
+    strategy_a = MagicMock(address="0xA")
+    strategy_b = MagicMock(address="0xB")
+
+    harvester.prefetch([strategy_a, strategy_b])
+
+    assert multicall.call_count == 2
+    assert harvester.keeper_roles.members == {
+        "HARVESTER_ROLE": True,
+        "TENDER_ROLE": False,
+    }
+    state = harvester.get_strategy_state(strategy_a)
+    assert state.name == "Strategy A"
+    assert state.want == "0xwantA"
+    assert state.want_balance == 100
+    assert state.want_decimals == 18
+    assert state.block_number == 1234
+    assert not strategy_a.functions.want.return_value.call.called
+    # Failed reads are left for the live fallback
+    assert "0xB" not in harvester.strategy_states
+
+
+def test_simulations_reused_within_block(mocker):
+    mocker.patch("src.general_harvester.get_last_harvest_times", return_value={})
+    web3 = MagicMock(
+        eth=MagicMock(
+            get_block=MagicMock(return_value={"number": 1}),
+            fee_history=MagicMock(return_value={}),
+        )
+    )
+    harvester = GeneralHarvester(web3=web3, keeper_acl="0x", keeper_address="0x")
+    harvest = harvester.keeper_acl.functions.harvest.return_value
+    harvest.call.return_value = 100
+    harvest.estimateGas.return_value = 21000
+
+    assert harvester.simulate_call("0xA") == 100
+    assert harvester.estimate_gas("0xA") == 21000
+    assert harvester.estimate_gas_fee("0xA") > 0
+    assert harvester.simulate_call("0xA") == 100
+    assert harvest.call.call_count == 1
+    assert harvest.estimateGas.call_count == 1
+
+    # Next block simulates again
+    harvester.block_context.block = {"number": 2}
+    harvester.simulate_call("0xA")
+    assert harvest.call.call_count == 2
+
+
+def test_send_harvest_bundle(mocker):
+    mocker.patch("src.general_harvester.get_last_harvest_times", return_value={})
+    mocker.patch("src.general_harvester.MAX_BUNDLE_TXS", 2)
+    web3 = MagicMock(eth=MagicMock(get_block=MagicMock(return_value={"number": 1})))
+    web3.eth.account.sign_transaction.side_effect = [
+        MagicMock(hash=HexBytes(i)) for i in range(1, 4)
+    ]
+    harvester = GeneralHarvester(web3=web3, keeper_acl="0x", keeper_address="0x")
+    mocker.patch.object(
+        harvester, "_GeneralHarvester__build_transaction", return_value={}
+    )
+    harvester.nonce_manager = MagicMock()
+    harvester.bundle_submitter = MagicMock()
+    harvester.bundle_submitter.submit_bundle.side_effect = [
+        MagicMock(max_target_block=7),
+        ConnectionError("relay unreachable"),
+    ]
+    strategies = [MagicMock(address=address) for address in ["0xA", "0xB", "0xC"]]
+
+    sent = harvester.send_harvest_bundle(strategies)
+
+    assert sent == [(HexBytes(1), 7), (HexBytes(2), 7), (HexBytes(0), None)]
+    first_bundle = harvester.bundle_submitter.submit_bundle.call_args_list[0]
+    assert [tx.hash for tx in first_bundle.args[0]] == [HexBytes(1), HexBytes(2)]
+    assert first_bundle.kwargs["reverting_tx_hashes"] == []
+    assert first_bundle.kwargs["simulate"] is True
+    harvester.nonce_manager.resync.assert_called_once()
+
+
+def test_send_harvest_bundle_drops_reverting_harvests(mocker):
+    mocker.patch("src.general_harvester.get_last_harvest_times", return_value={})
+    web3 = MagicMock(eth=MagicMock(get_block=MagicMock(return_value={"number": 1})))
+    web3.eth.account.sign_transaction.side_effect = [
+        MagicMock(hash=HexBytes(i)) for i in range(1, 6)
+    ]
+    harvester = GeneralHarvester(web3=web3, keeper_acl="0x", keeper_address="0x")
+    build_transaction = mocker.patch.object(
+        harvester, "_GeneralHarvester__build_transaction", return_value={}
+    )
+    harvester.nonce_manager = MagicMock()
+    harvester.nonce_manager.get_nonce.side_effect = [10, 11, 12, 10, 11]
+    harvester.bundle_submitter = MagicMock()
+    harvester.bundle_submitter.submit_bundle.side_effect = [
+        BundleSimulationFailed("reverted", tx_hashes=[HexBytes(2)]),
+        MagicMock(max_target_block=7),
+    ]
+    strategies = [MagicMock(address=address) for address in ["0xA", "0xB", "0xC"]]
+
+    sent = harvester.send_harvest_bundle(strategies)
+
+    assert sent == [(HexBytes(4), 7), (HexBytes(0), None), (HexBytes(5), 7)]
+    harvester.nonce_manager.rewind.assert_called_once_with(10)
+    # Harvests that didn't revert are signed again with sequential nonces
+    assert [call.args[:2] for call in build_transaction.call_args_list[3:]] == [
+        ("0xA", 10),
+        ("0xC", 11),
+    ]
+    retried_bundle = harvester.bundle_submitter.submit_bundle.call_args.args[0]
+    assert [tx.hash for tx in retried_bundle] == [HexBytes(4), HexBytes(5)]
+
+
+def test_send_harvest_tx_connection_error(mocker):
+    mocker.patch("src.general_harvester.get_last_harvest_times", return_value={})
+    web3 = MagicMock(eth=MagicMock(get_block=MagicMock(return_value={"number": 1})))
+    web3.eth.send_raw_transaction.side_effect = ConnectionError("node down")
+    harvester = GeneralHarvester(web3=web3, keeper_acl="0x", keeper_address="0x")
+    mocker.patch.object(
+        harvester, "_GeneralHarvester__build_transaction", return_value={}
+    )
+    harvester.nonce_manager = MagicMock()
+
+    tx_hash, max_target_block = harvester.send_harvest_tx(MagicMock(address="0xA"))
+
+    assert tx_hash == HexBytes(0)
+    assert max_target_block is None
+    harvester.nonce_manager.resync.assert_called_once()
+
+
+def test_send_harvest_tx_failure_recorded_once(mocker):
+    mocker.patch("src.general_harvester.get_last_harvest_times", return_value={})
+    record_tx = mocker.patch("src.general_harvester.record_tx")
+    record_tx_on_notify = mocker.patch("src.discord_utils.record_tx")
+    mocker.patch("src.discord_utils.get_secret")
+    notifier = mocker.patch("src.discord_utils.get_notifier")
+    web3 = MagicMock(eth=MagicMock(get_block=MagicMock(return_value={"number": 1})))
+    web3.eth.send_raw_transaction.side_effect = ValueError(
+        {"code": -32000, "message": "reverted", "data": {"0x01": {}}}
+    )
+    harvester = GeneralHarvester(web3=web3, keeper_acl="0x", keeper_address="0x")
+    mocker.patch.object(
+        harvester, "_GeneralHarvester__build_transaction", return_value={}
+    )
+    harvester.nonce_manager = MagicMock()
+
+    harvester.send_harvest_tx(MagicMock(address="0xA"))
+
+    notifier.return_value.notify.assert_called_once()
+    record_tx.assert_called_once_with("Harvest", "failed", harvester.chain)
+    # Reporting the error doesn't count it again
+    record_tx_on_notify.assert_not_called()
+
+
+def test_confirm_harvest_timed_out(mocker):
+    mocker.patch("src.general_harvester.get_last_harvest_times", return_value={})
+    mocker.patch(
+        "src.general_harvester.confirm_transaction",
+        return_value=(False, "timed out"),
+    )
+    mocker.patch("src.general_harvester.send_success_to_discord")
+    web3 = MagicMock(eth=MagicMock(get_block=MagicMock(return_value={"number": 1})))
+    harvester = GeneralHarvester(
+        web3=web3, keeper_acl="0x", keeper_address="0x", use_flashbots=False
+    )
+    harvester.nonce_manager = MagicMock()
+
+    harvester.confirm_harvest(MagicMock(address="0xA"), "Strategy A", HexBytes(1))
+
+    harvester.nonce_manager.resync.assert_called_once()
+
+
+def test_send_harvest_tx_nonce_read_fails(mocker):
+    mocker.patch("src.general_harvester.get_last_harvest_times", return_value={})
+    web3 = MagicMock(eth=MagicMock(get_block=MagicMock(return_value={"number": 1})))
+    harvester = GeneralHarvester(web3=web3, keeper_acl="0x", keeper_address="0x")
+    harvester.nonce_manager = MagicMock()
+    harvester.nonce_manager.get_nonce.side_effect = ConnectionError("node down")
+
+    assert harvester.send_harvest_tx(MagicMock(address="0xA")) == (HexBytes(0), None)
+    harvester.nonce_manager.resync.assert_called_once()
+    web3.eth.send_raw_transaction.assert_not_called()
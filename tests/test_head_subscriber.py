@@ -0,0 +1,66 @@
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.block_context import get_block_context
+from src.head_subscriber import HeadSubscriber
+from src.head_subscriber import parse_head
+from src.receipt_watcher import get_receipt_watcher
+
+
+def test_parse_head():
+    head = {
+        "number": "0x64",
+        "timestamp": "0x10",
+        "baseFeePerGas": "0x5",
+        "hash": "0x1",
+    }
+    assert parse_head(head) == {
+        "number": 100,
+        "timestamp": 16,
+        "baseFeePerGas": 5,
+        "hash": "0x1",
+    }
+
+
+def test_handle_head_feeds_block_context_and_receipt_watcher():
+    web3 = MagicMock()
+    subscriber = HeadSubscriber("wss://node.url", web3)
+
+    subscriber.handle_head({"number": 100, "timestamp": 16, "baseFeePerGas": 5})
+
+    context = get_block_context(web3)
+    context.max_age = 0
+    assert context.number == 100
+    assert context.base_fee() == 5
+    # Pushed header is used without asking the node
+    assert not web3.eth.get_block.called
+    assert get_receipt_watcher(web3).head == 100
+
+    context.unpin()
+    context.latest()
+    assert web3.eth.get_block.called
+
+
+def test_reconnects_with_backoff_after_any_error(mocker):
+    class Stop(BaseException):
+        pass
+
+    sleep = mocker.patch(
+        "src.head_subscriber.asyncio.sleep",
+        AsyncMock(side_effect=[None, None, None, Stop()]),
+    )
+    subscriber = HeadSubscriber(
+        "wss://node.url", MagicMock(), reconnect_delay=1, max_reconnect_delay=3
+    )
+    mocker.patch.object(
+        subscriber, "subscribe", AsyncMock(side_effect=RuntimeError("bad frame"))
+    )
+
+    with pytest.raises(Stop):
+        asyncio.run(subscriber.run_async())
+
+    assert subscriber.subscribe.call_count == 4
+    assert [call.args[0] for call in sleep.call_args_list] == [1, 2, 3, 3]
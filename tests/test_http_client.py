@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock
+
+import responses
+from requests.adapters import HTTPAdapter
+
+from src import http_client
+
+
+def test_session_is_shared():
+    assert http_client.get_session() is http_client.get_session()
+
+
+def test_default_timeout_applied(mocker):
+    send = mocker.patch.object(HTTPAdapter, "send")
+    adapter = http_client.TimeoutHTTPAdapter()
+
+    adapter.send(MagicMock())
+    adapter.send(MagicMock(), timeout=1)
+
+    assert send.call_args_list[0].kwargs["timeout"] == http_client.DEFAULT_TIMEOUT
+    assert send.call_args_list[1].kwargs["timeout"] == 1
+
+
+@responses.activate
+def test_post():
+    responses.add(
+        responses.POST, "https://api.thegraph.com/subgraphs", json={"data": {}}
+    )
+
+    response = http_client.post("https://api.thegraph.com/subgraphs", json={})
+
+    assert response.json() == {"data": {}}
+
+
+def test_only_queries_retry_posts():
+    def allowed_methods(session):
+        return session.get_adapter("https://").max_retries.allowed_methods
+
+    assert allowed_methods(http_client.get_session()) == ["GET"]
+    assert "POST" in allowed_methods(http_client.get_query_session())
+
+
+@responses.activate
+def test_query():
+    responses.add(
+        responses.POST, "https://api.thegraph.com/subgraphs", json={"data": {}}
+    )
+
+    response = http_client.query("https://api.thegraph.com/subgraphs", json={})
+
+    assert response.json() == {"data": {}}
@@ -0,0 +1,91 @@
+import json
+from unittest.mock import MagicMock
+
+from hexbytes import HexBytes
+
+from config.enums import Network
+from src.keeper_roles import KeeperRoles
+
+ACL = "0x711A339c002386f9db409cA55b6A35a604aB6cF6"
+KEEPER = "0x872213E29C85d7e30F1C8202FC47eD1Ec124BB1D"
+HARVESTER_KEY = b"\x01" * 32
+TENDER_KEY = b"\x02" * 32
+
+
+def test_prefetch_resolves_roles_once(mocker):
+    multicall = mocker.patch(
+        "src.keeper_roles.multicall",
+        side_effect=[[HARVESTER_KEY, TENDER_KEY], [True, False]],
+    )
+    acl = MagicMock(address=ACL)
+    roles = KeeperRoles(MagicMock(), Network.Ethereum, acl, KEEPER, cache_path=None)
+
+    roles.prefetch(["HARVESTER_ROLE", "TENDER_ROLE"])
+
+    assert roles.has_role("HARVESTER_ROLE")
+    assert not roles.has_role("TENDER_ROLE")
+    assert multicall.call_count == 2
+    assert not acl.functions.HARVESTER_ROLE.return_value.call.called
+    assert not acl.functions.hasRole.return_value.call.called
+
+
+def test_has_role_falls_back_to_direct_calls(mocker):
+    mocker.patch("src.keeper_roles.multicall", side_effect=[[None], []])
+    acl = MagicMock(address=ACL)
+    acl.functions.EARNER_ROLE.return_value.call.return_value = HARVESTER_KEY
+    acl.functions.hasRole.return_value.call.return_value = True
+    roles = KeeperRoles(MagicMock(), Network.Ethereum, acl, KEEPER, cache_path=None)
+
+    assert roles.has_role("EARNER_ROLE")
+    acl.functions.hasRole.assert_called_with(HARVESTER_KEY, KEEPER)
+
+
+def test_cache_persists_and_invalidates_on_role_events(mocker, tmp_path):
+    cache_path = str(tmp_path / "roles.json")
+    mocker.patch(
+        "src.keeper_roles.multicall",
+        side_effect=[[HARVESTER_KEY, TENDER_KEY], [True, True]],
+    )
+    web3 = MagicMock(eth=MagicMock(block_number=100))
+    acl = MagicMock(address=ACL)
+    KeeperRoles(web3, Network.Ethereum, acl, KEEPER, cache_path).prefetch(
+        ["HARVESTER_ROLE", "TENDER_ROLE"]
+    )
+    with open(cache_path) as f:
+        assert json.load(f)[f"{Network.Ethereum}:{ACL}:{KEEPER}"]["block_number"] == 100
+
+    # Tender role got revoked since the last run
+    web3.eth.block_number = 110
+    web3.eth.get_logs.return_value = [
+        {"topics": [HexBytes(b"\x00" * 32), HexBytes(TENDER_KEY), HexBytes(KEEPER)]}
+    ]
+    roles = KeeperRoles(web3, Network.Ethereum, acl, KEEPER, cache_path)
+
+    (log_filter,), _ = web3.eth.get_logs.call_args
+    assert log_filter["fromBlock"] == 101
+    assert log_filter["toBlock"] == 110
+    assert roles.members == {"HARVESTER_ROLE": True}
+    assert roles.role_keys["TENDER_ROLE"] == HexBytes(TENDER_KEY)
+    # Scanned blocks aren't scanned again by the next run
+    with open(cache_path) as f:
+        assert json.load(f)[f"{Network.Ethereum}:{ACL}:{KEEPER}"]["block_number"] == 110
+
+
+def test_cache_ignored_when_role_events_unavailable(mocker, tmp_path):
+    cache_path = str(tmp_path / "roles.json")
+    mocker.patch(
+        "src.keeper_roles.multicall",
+        side_effect=[[HARVESTER_KEY], [True], [HARVESTER_KEY], [True]],
+    )
+    web3 = MagicMock(eth=MagicMock(block_number=100))
+    acl = MagicMock(address=ACL)
+    KeeperRoles(web3, Network.Ethereum, acl, KEEPER, cache_path).prefetch(
+        ["HARVESTER_ROLE"]
+    )
+
+    web3.eth.block_number = 110
+    web3.eth.get_logs.side_effect = ValueError("query returned more than 10000 results")
+    roles = KeeperRoles(web3, Network.Ethereum, acl, KEEPER, cache_path)
+
+    assert roles.members == {}
+    assert roles.has_role("HARVESTER_ROLE")
@@ -0,0 +1,70 @@
+from decimal import Decimal
+
+import responses
+
+from src import http_client
+from src import metrics
+from src.rpc_metrics import metrics as rpc_metrics
+from src.rpc_metrics import rpc_context
+
+
+def get_value(name: str, labels: dict) -> float:
+    return metrics.registry.get_sample_value(name, labels) or 0
+
+
+def test_record_tx_strips_strategy_name():
+    labels = {
+        "job": "harvest",
+        "chain": "eth",
+        "tx_type": "Harvest",
+        "status": "confirmed",
+    }
+    before = get_value("keeper_txs_total", labels)
+
+    with rpc_context(job="harvest"):
+        metrics.record_tx("Harvest Strategy A", "confirmed", "eth")
+        metrics.record_gas_cost("Harvest Strategy A", Decimal("1.5"), "eth")
+
+    assert get_value("keeper_txs_total", labels) == before + 1
+    assert (
+        get_value(
+            "keeper_gas_cost_usd_total",
+            {"job": "harvest", "chain": "eth", "tx_type": "Harvest"},
+        )
+        >= 1.5
+    )
+
+
+def test_rpc_calls_exposed():
+    rpc_metrics.reset()
+    with rpc_context(job="earn"):
+        rpc_metrics.record("eth_call", 0.5, 10, 10, False)
+        rpc_metrics.record("eth_call", 0.25, 10, 10, True)
+
+    labels = {"job": "earn", "method": "eth_call"}
+    assert get_value("keeper_rpc_calls_total", {**labels, "status": "ok"}) == 1
+    assert get_value("keeper_rpc_calls_total", {**labels, "status": "error"}) == 1
+    assert get_value("keeper_rpc_latency_seconds_total", labels) == 0.75
+    rpc_metrics.reset()
+
+
+@responses.activate
+def test_http_requests_recorded():
+    responses.add(responses.GET, "https://api.badger.com/v2/prices", json={})
+    labels = {"job": "prices", "host": "api.badger.com", "status": "200"}
+    before = get_value("keeper_http_requests_total", labels)
+
+    with rpc_context(job="prices"):
+        http_client.get("https://api.badger.com/v2/prices")
+
+    assert get_value("keeper_http_requests_total", labels) == before + 1
+
+
+def test_export_writes_textfile(mocker, tmp_path):
+    textfile = tmp_path / "keepers.prom"
+    mocker.patch("src.metrics.METRICS_TEXTFILE", str(textfile))
+    mocker.patch("src.metrics.METRICS_PUSHGATEWAY", None)
+
+    metrics.export()
+
+    assert "keeper_txs" in textfile.read_text()
@@ -0,0 +1,59 @@
+from unittest.mock import MagicMock
+
+from eth_abi import encode_abi
+from web3 import Web3
+
+from config.enums import Network
+from src.multicall import multicall
+from src.utils import get_abi
+
+VAULT = "0xd04c48A53c111300aD41190D63681ed3dAd998eC"
+TOKEN = "0x3472A5A71965499acd81997a54BBA8D852C6E53d"
+
+
+def mock_multicall3(mocker, results: list) -> MagicMock:
+    aggregate3 = MagicMock(
+        side_effect=lambda calls: MagicMock(
+            call=MagicMock(return_value=results[: len(calls)])
+        )
+    )
+    multicall3 = MagicMock(functions=MagicMock(aggregate3=aggregate3))
+    mocker.patch("src.multicall.get_contract", return_value=multicall3)
+    return aggregate3
+
+
+def test_multicall_decodes_results(mocker):
+    web3 = Web3()
+    vault = web3.eth.contract(address=VAULT, abi=get_abi(Network.Ethereum, "vault"))
+    aggregate3 = mock_multicall3(
+        mocker,
+        [
+            (True, encode_abi(["address"], [TOKEN])),
+            (False, b""),
+        ],
+    )
+
+    results = multicall(
+        web3,
+        Network.Ethereum,
+        [vault.functions.token(), vault.functions.controller()],
+    )
+
+    assert results == [TOKEN, None]
+    (calls,), _ = aggregate3.call_args
+    assert calls[0][0] == VAULT
+    assert calls[0][1] is True
+    assert calls[0][2] == vault.functions.token()._encode_transaction_data()
+
+
+def test_multicall_chunks_calls(mocker):
+    web3 = Web3()
+    vault = web3.eth.contract(address=VAULT, abi=get_abi(Network.Ethereum, "vault"))
+    aggregate3 = mock_multicall3(mocker, [(True, encode_abi(["address"], [TOKEN]))] * 2)
+
+    results = multicall(
+        web3, Network.Ethereum, [vault.functions.token()] * 5, chunk_size=2
+    )
+
+    assert results == [TOKEN] * 5
+    assert aggregate3.call_count == 3
@@ -0,0 +1,118 @@
+import json
+import time
+
+import pytest
+import requests
+import responses
+
+from src.node_pool import MAX_FAILURES
+from src.node_pool import NodePool
+
+FAST_NODE = "https://fast.node"
+SLOW_NODE = "https://slow.node"
+STALE_NODE = "https://stale.node"
+PUBLIC_NODE = "https://public.node"
+
+
+def block_number_response(number: int) -> dict:
+    return {"jsonrpc": "2.0", "id": 0, "result": hex(number)}
+
+
+@responses.activate
+def test_check_ranks_nodes_by_latency_and_head():
+    def slow_response(request):
+        time.sleep(0.2)
+        return 200, {}, json.dumps(block_number_response(101))
+
+    responses.add(responses.POST, FAST_NODE, json=block_number_response(100))
+    responses.add_callback(responses.POST, SLOW_NODE, callback=slow_response)
+    responses.add(responses.POST, STALE_NODE, json=block_number_response(50))
+    pool = NodePool([SLOW_NODE, STALE_NODE, FAST_NODE])
+
+    healthy = pool.check()
+
+    assert [node.endpoint_uri for node in healthy] == [FAST_NODE, SLOW_NODE]
+    assert pool.endpoint_uri == FAST_NODE
+
+
+@responses.activate
+def test_make_request_fails_over():
+    responses.add(responses.POST, FAST_NODE, body=requests.ConnectionError())
+    responses.add(responses.POST, SLOW_NODE, json=block_number_response(100))
+    pool = NodePool([FAST_NODE, SLOW_NODE])
+
+    for _ in range(MAX_FAILURES):
+        assert pool.make_request("eth_blockNumber", [])["result"] == hex(100)
+
+    # Circuit of the failing node is open, requests skip it
+    assert pool.endpoint_uri == SLOW_NODE
+    pool.make_request("eth_blockNumber", [])
+    assert len(responses.calls) == 2 * MAX_FAILURES + 1
+
+
+@responses.activate
+def test_make_request_raises_when_all_nodes_fail():
+    responses.add(responses.POST, FAST_NODE, body=requests.ConnectionError())
+    pool = NodePool([FAST_NODE])
+
+    with pytest.raises(requests.ConnectionError):
+        pool.make_request("eth_blockNumber", [])
+
+
+@responses.activate
+def test_public_nodes_are_last_resort_and_never_send():
+    responses.add(responses.POST, PUBLIC_NODE, json=block_number_response(100))
+    responses.add(responses.POST, SLOW_NODE, body=requests.ConnectionError())
+    pool = NodePool([SLOW_NODE], public_uris=[PUBLIC_NODE])
+
+    assert pool.make_request("eth_blockNumber", [])["result"] == hex(100)
+    with pytest.raises(requests.ConnectionError):
+        pool.make_request("eth_sendRawTransaction", ["0x1234"])
+    assert not any(
+        b"eth_sendRawTransaction" in call.request.body
+        for call in responses.calls
+        if call.request.url.startswith(PUBLIC_NODE)
+    )
+
+
+@responses.activate
+def test_public_nodes_ranked_after_private_nodes():
+    def slow_response(request):
+        time.sleep(0.1)
+        return 200, {}, json.dumps(block_number_response(100))
+
+    responses.add(responses.POST, PUBLIC_NODE, json=block_number_response(100))
+    responses.add_callback(responses.POST, SLOW_NODE, callback=slow_response)
+    pool = NodePool([SLOW_NODE], public_uris=[PUBLIC_NODE])
+
+    pool.check()
+
+    assert [node.endpoint_uri for node in pool.nodes] == [SLOW_NODE, PUBLIC_NODE]
+
+
+@responses.activate
+def test_nodes_are_reranked_periodically():
+    responses.add(responses.POST, FAST_NODE, json=block_number_response(100))
+    responses.add(responses.POST, SLOW_NODE, json=block_number_response(100))
+    pool = NodePool([SLOW_NODE, FAST_NODE], recheck_interval=0)
+
+    pool.make_request("eth_blockNumber", [])
+
+    # Check measured both nodes before the request was sent
+    assert len(responses.calls) == 3
+    assert all(node.latency < float("inf") for node in pool.nodes)
+
+
+@responses.activate
+def test_nodes_are_rechecked_after_circuit_cooldown():
+    responses.add(responses.POST, FAST_NODE, json=block_number_response(100))
+    responses.add(responses.POST, SLOW_NODE, json=block_number_response(100))
+    pool = NodePool([FAST_NODE, SLOW_NODE])
+    # Circuit of the fast node opened after the last check and is over now
+    pool.checked_at -= 10
+    pool.nodes[0].open_until = pool.checked_at + 1
+
+    pool.make_request("eth_blockNumber", [])
+
+    assert len(responses.calls) == 3
+    assert pool.nodes[0].is_available()
@@ -0,0 +1,128 @@
+from unittest.mock import MagicMock
+
+from hexbytes import HexBytes
+
+from config.enums import Network
+from src.nonce_manager import NonceManager
+from src.nonce_manager import get_nonce_manager
+from src.tx_utils import sign_and_send_tx
+
+
+def make_web3(nonce: int = 10) -> MagicMock:
+    return MagicMock(eth=MagicMock(get_transaction_count=MagicMock(return_value=nonce)))
+
+
+def test_nonces_are_handed_out_locally():
+    web3 = make_web3()
+    manager = NonceManager(web3, "0x00")
+
+    assert [manager.get_nonce() for _ in range(3)] == [10, 11, 12]
+    web3.eth.get_transaction_count.assert_called_once_with("0x00", "pending")
+
+
+def test_release_last_nonce_reuses_it():
+    web3 = make_web3()
+    manager = NonceManager(web3, "0x00")
+    nonce = manager.get_nonce()
+
+    manager.release(nonce)
+
+    assert manager.get_nonce() == nonce
+    assert web3.eth.get_transaction_count.call_count == 1
+
+
+def test_release_with_gap_resyncs():
+    web3 = make_web3()
+    manager = NonceManager(web3, "0x00")
+    first = manager.get_nonce()
+    manager.get_nonce()
+
+    manager.release(first)
+    web3.eth.get_transaction_count.return_value = 11
+
+    assert manager.get_nonce() == 11
+    assert web3.eth.get_transaction_count.call_count == 2
+
+
+def test_first_of_two_outstanding_nonces_failing_resyncs():
+    web3 = make_web3()
+    manager = NonceManager(web3, "0x00")
+    first = manager.get_nonce()
+    second = manager.get_nonce()
+
+    manager.handle_error(first, ValueError("insufficient funds"))
+
+    # Second tx is still in flight, so the first nonce must not be reused locally
+    assert manager.next_nonce is None
+    assert manager.get_nonce() == 10
+    assert web3.eth.get_transaction_count.call_count == 2
+    # Second tx failing after the resync doesn't roll back past the node's nonce
+    manager.handle_error(second, ValueError("insufficient funds"))
+    assert manager.next_nonce is None
+
+
+def test_outstanding_nonces_failing_last_first_are_reused():
+    web3 = make_web3()
+    manager = NonceManager(web3, "0x00")
+    first = manager.get_nonce()
+    second = manager.get_nonce()
+
+    manager.handle_error(second, ValueError("insufficient funds"))
+    manager.handle_error(first, ValueError("insufficient funds"))
+
+    assert manager.get_nonce() == first
+    assert web3.eth.get_transaction_count.call_count == 1
+
+
+def test_rewind_reuses_all_later_nonces():
+    web3 = make_web3()
+    manager = NonceManager(web3, "0x00")
+    nonces = [manager.get_nonce() for _ in range(3)]
+
+    manager.rewind(nonces[1])
+
+    assert manager.get_nonce() == 11
+    web3.eth.get_transaction_count.assert_called_once()
+
+
+def test_failed_nonce_read_resyncs():
+    manager = NonceManager(make_web3(), "0x00")
+    manager.get_nonce()
+
+    manager.handle_error(None, ConnectionError("node down"))
+
+    assert manager.next_nonce is None
+
+
+def test_nonce_too_low_resyncs():
+    web3 = make_web3()
+    manager = NonceManager(web3, "0x00")
+    nonce = manager.get_nonce()
+    web3.eth.get_transaction_count.return_value = 15
+
+    manager.handle_error(
+        nonce, ValueError({"code": -32000, "message": "nonce too low"})
+    )
+
+    assert manager.get_nonce() == 15
+
+
+def test_get_nonce_manager_per_chain_and_address():
+    web3 = make_web3()
+    manager = get_nonce_manager(web3, Network.Ethereum, "0x00")
+
+    assert get_nonce_manager(web3, Network.Ethereum, "0x00") is manager
+    assert get_nonce_manager(web3, Network.Fantom, "0x00") is not manager
+    assert get_nonce_manager(web3, Network.Ethereum, "0x01") is not manager
+
+
+def test_sign_and_send_tx_releases_nonce_on_failure():
+    web3 = make_web3()
+    web3.eth.send_raw_transaction.side_effect = ValueError("insufficient funds")
+    manager = NonceManager(web3, "0x00")
+    nonce = manager.get_nonce()
+
+    assert sign_and_send_tx(web3, {"nonce": nonce}, "", nonce_manager=manager) == (
+        HexBytes(0)
+    )
+    assert manager.get_nonce() == nonce
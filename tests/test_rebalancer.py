@@ -0,0 +1,60 @@
+from unittest.mock import MagicMock
+
+from hexbytes import HexBytes
+
+from src.eth.rebalancer import NUM_FLASHBOTS_BUNDLES
+from src.eth.rebalancer import Rebalancer
+
+
+def test_send_rebalance_tx_flashbots(mocker):
+    mocker.patch("src.eth.rebalancer.get_contract")
+    mocker.patch(
+        "src.eth.rebalancer.get_gas_quote", return_value=MagicMock(priority_fee=1)
+    )
+    web3 = MagicMock(eth=MagicMock(block_number=1234))
+    web3.eth.account.sign_transaction.return_value = MagicMock(
+        rawTransaction=HexBytes("0x1234"), hash=HexBytes("0xabcd")
+    )
+    rebalancer = Rebalancer(
+        web3=web3,
+        keeper_acl="0x",
+        keeper_address="0x",
+        keeper_key="0x",
+        base_oracle_address="0x",
+        use_flashbots=True,
+    )
+
+    tx_hash, max_target_block = rebalancer._Rebalancer__send_rebalance_tx(
+        MagicMock(address="0xstrategy")
+    )
+
+    assert tx_hash == HexBytes("0xabcd")
+    assert max_target_block == 1234 + NUM_FLASHBOTS_BUNDLES
+    assert web3.flashbots.send_bundle.call_count == NUM_FLASHBOTS_BUNDLES
+    web3.eth.send_raw_transaction.assert_not_called()
+
+
+def test_send_rebalance_tx_uses_shared_nonce_manager(mocker):
+    keeper_acl = MagicMock()
+    mocker.patch("src.eth.rebalancer.get_contract", return_value=keeper_acl)
+    mocker.patch(
+        "src.eth.rebalancer.get_gas_quote", return_value=MagicMock(priority_fee=1)
+    )
+    web3 = MagicMock()
+    web3.eth.get_transaction_count.return_value = 7
+    web3.eth.send_raw_transaction.side_effect = ValueError("insufficient funds")
+    rebalancer = Rebalancer(
+        web3=web3,
+        keeper_acl="0x",
+        keeper_address="0x",
+        keeper_key="0x",
+        base_oracle_address="0x",
+    )
+    build = keeper_acl.functions.rebalance.return_value.buildTransaction
+
+    rebalancer._Rebalancer__send_rebalance_tx(MagicMock(address="0xstrategy"))
+    rebalancer._Rebalancer__send_rebalance_tx(MagicMock(address="0xstrategy"))
+
+    # Nonce of the failed send is released and reused without another read
+    assert [call.args[0]["nonce"] for call in build.call_args_list] == [7, 7]
+    web3.eth.get_transaction_count.assert_called_once()
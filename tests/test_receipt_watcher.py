@@ -0,0 +1,111 @@
+import json
+import time
+from unittest.mock import MagicMock
+
+import responses
+from hexbytes import HexBytes
+from web3 import Web3
+
+from src.batch_provider import BatchingHTTPProvider
+from src.receipt_watcher import ReceiptWatcher
+from src.receipt_watcher import get_receipt_watcher
+from src.rpc_metrics import instrument
+from src.rpc_metrics import metrics
+
+NODE_URL = "https://node.url"
+MINED = HexBytes("0x" + "01" * 32)
+DROPPED = HexBytes("0x" + "02" * 32)
+
+
+def node_callback(request):
+    body = json.loads(request.body)
+    results = {
+        "eth_blockNumber": "0x64",
+        "eth_getTransactionReceipt": {"status": "0x1"},
+    }
+    replies = [
+        {
+            "jsonrpc": "2.0",
+            "id": item["id"],
+            "result": None
+            if item["params"] == [DROPPED.hex()]
+            else results[item["method"]],
+        }
+        for item in (body if isinstance(body, list) else [body])
+    ]
+    return 200, {}, json.dumps(replies if isinstance(body, list) else replies[0])
+
+
+@responses.activate
+def test_receipts_are_batched():
+    responses.add_callback(responses.POST, NODE_URL, callback=node_callback)
+    web3 = instrument(Web3(BatchingHTTPProvider(NODE_URL)))
+    watcher = ReceiptWatcher(web3, poll_interval=0)
+
+    # Hold the watcher back until both txs are tracked
+    with watcher.lock:
+        mined = watcher.watch(MINED)
+        dropped = watcher.watch(DROPPED, max_block=99)
+
+    assert mined.result(timeout=5) == (True, f"Transaction {MINED.hex()} succeeded!")
+    assert dropped.result(timeout=5) == (
+        False,
+        f"Transaction {DROPPED.hex()} was not included in the block.",
+    )
+    receipt_requests = [
+        json.loads(call.request.body)
+        for call in responses.calls
+        if "eth_getTransactionReceipt" in call.request.body.decode()
+    ]
+    assert len(receipt_requests) == 1
+    assert len(receipt_requests[0]) == 2
+    # Batched requests are still recorded per call
+    receipt_calls = [
+        method["calls"]
+        for method in metrics.summary()["methods"]
+        if method["method"] == "eth_getTransactionReceipt"
+    ]
+    assert sum(receipt_calls) >= 2
+
+
+def test_receipt_watcher_shared_per_node():
+    web3 = MagicMock()
+    assert get_receipt_watcher(web3) is get_receipt_watcher(web3)
+    assert get_receipt_watcher(MagicMock()) is not get_receipt_watcher(web3)
+
+
+def test_restarted_watcher_checks_receipts_in_same_block():
+    web3 = MagicMock(eth=MagicMock(block_number=100))
+    watcher = ReceiptWatcher(web3, poll_interval=0)
+
+    assert watcher.watch(MINED).result(timeout=5)[0]
+    while watcher.thread is not None:
+        time.sleep(0.01)
+
+    # Still block 100, but the new tx must not wait for the next block
+    assert watcher.watch(DROPPED).result(timeout=5)[0]
+
+
+def test_receipt_errors_are_retried():
+    web3 = MagicMock(eth=MagicMock(block_number=100))
+    web3.eth.get_transaction_receipt.side_effect = [
+        ConnectionError("node down"),
+        {"status": 1},
+    ]
+    watcher = ReceiptWatcher(web3, poll_interval=0)
+
+    assert watcher.watch(MINED).result(timeout=5) == (
+        True,
+        f"Transaction {MINED.hex()} succeeded!",
+    )
+
+
+def test_receipt_of_mined_tx_is_reused():
+    web3 = MagicMock(eth=MagicMock(block_number=100))
+    web3.eth.get_transaction_receipt.return_value = {"status": 1, "blockNumber": 100}
+    watcher = ReceiptWatcher(web3, poll_interval=0)
+
+    assert watcher.watch(MINED).result(timeout=5)[0]
+
+    assert watcher.receipt(MINED)["blockNumber"] == 100
+    web3.eth.get_transaction_receipt.assert_called_once()
@@ -0,0 +1,122 @@
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.rpc_metrics import RpcMetrics
+from src.rpc_metrics import context_map
+from src.rpc_metrics import current_job
+from src.rpc_metrics import current_strategy
+from src.rpc_metrics import job_context
+from src.rpc_metrics import metrics
+from src.rpc_metrics import rpc_context
+from src.rpc_metrics import rpc_metrics_middleware
+from src.rpc_metrics import set_job
+from src.rpc_metrics import strategy_rpc_context
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_middleware_records_calls_per_context():
+    make_request = MagicMock(return_value={"jsonrpc": "2.0", "result": "0x1"})
+    middleware = rpc_metrics_middleware(make_request, MagicMock())
+
+    with rpc_context(job="eth_harvest"):
+        middleware("eth_blockNumber", [])
+        with rpc_context(strategy="0xA"):
+            middleware("eth_call", [{"to": "0xA"}, "latest"])
+            middleware("eth_call", [{"to": "0xA"}, "latest"])
+
+    summary = metrics.summary()
+    assert summary["calls"] == 3
+    assert summary["errors"] == 0
+    calls = {
+        (method["job"], method["strategy"], method["method"]): method
+        for method in summary["methods"]
+    }
+    assert calls[("eth_harvest", None, "eth_blockNumber")]["calls"] == 1
+    eth_call = calls[("eth_harvest", "0xA", "eth_call")]
+    assert eth_call["calls"] == 2
+    assert eth_call["request_bytes"] > 0
+    assert eth_call["response_bytes"] > 0
+
+
+def test_middleware_records_errors():
+    middleware = rpc_metrics_middleware(
+        MagicMock(side_effect=[{"error": {"message": "reverted"}}, ValueError]),
+        MagicMock(),
+    )
+
+    middleware("eth_call", [])
+    with pytest.raises(ValueError):
+        middleware("eth_call", [])
+
+    assert metrics.summary()["errors"] == 2
+
+
+def test_strategy_rpc_context():
+    class Keeper:
+        @strategy_rpc_context
+        def harvest(self, strategy):
+            metrics.record("eth_call", 0.1, 10, 10, False)
+
+    Keeper().harvest(MagicMock(address="0xB"))
+
+    assert metrics.summary()["methods"][0]["strategy"] == "0xB"
+
+
+def test_summary_sorted_by_calls():
+    rpc_metrics = RpcMetrics()
+    rpc_metrics.record("eth_call", 0.1, 10, 10, False)
+    rpc_metrics.record("eth_getBlockByNumber", 0.1, 10, 10, False)
+    rpc_metrics.record("eth_getBlockByNumber", 0.2, 10, 10, False)
+
+    methods = rpc_metrics.summary()["methods"]
+
+    assert [method["method"] for method in methods] == [
+        "eth_getBlockByNumber",
+        "eth_call",
+    ]
+    assert methods[0]["max_latency"] == 0.2
+
+
+def test_set_job():
+    def run():
+        set_job("eth_harvest")
+        metrics.record("eth_call", 0.1, 10, 10, False)
+
+    # Scripts set the job of their main thread, kept out of the test's context
+    contextvars.copy_context().run(run)
+
+    assert metrics.summary()["methods"][0]["job"] == "eth_harvest"
+
+
+def test_context_map_attributes_workers_like_caller():
+    with rpc_context(job="eth_harvest", strategy="0xA"):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            contexts = context_map(
+                executor, lambda _: (current_job(), current_strategy()), range(3)
+            )
+
+    assert contexts == [("eth_harvest", "0xA")] * 3
+
+
+def test_job_context_drops_strategy():
+    contexts = []
+
+    def run():
+        contexts.append((current_job(), current_strategy()))
+
+    with rpc_context(job="eth_harvest", strategy="0xA"):
+        thread = threading.Thread(target=job_context().run, args=(run,))
+    thread.start()
+    thread.join()
+
+    assert contexts == [("eth_harvest", None)]
@@ -0,0 +1,35 @@
+from decimal import Decimal
+
+from src.run_digest import DigestEntry
+from src.run_digest import RunDigest
+from src.run_digest import build_embeds
+
+
+def test_build_embeds_summarizes_entries():
+    entries = [
+        DigestEntry(title=f"Harvest {i}", status="Completed", gas_cost=Decimal(1))
+        for i in range(30)
+    ] + [DigestEntry(title="Harvest X", status="Failed", message="reverted")]
+
+    embeds = build_embeds(entries)
+
+    assert len(embeds) == 2
+    assert len(embeds[0].fields) == 25
+    assert len(embeds[1].fields) == 6
+    assert embeds[0].description == "30 Completed, 1 Failed"
+    assert embeds[1].fields[-1].name == "Failed: Harvest X"
+    assert embeds[1].fields[-1].value == "reverted"
+
+
+def test_send_posts_one_summary_per_webhook(mocker):
+    notifier = mocker.patch("src.run_digest.get_notifier")
+    digest = RunDigest()
+    digest.add("info", DigestEntry(title="Harvest A", status="Completed"))
+    digest.add("info", DigestEntry(title="Harvest B", status="Pending"))
+    digest.add("alerts", DigestEntry(title="Harvest C", status="Failed"))
+
+    digest.send()
+    digest.send()
+
+    urls = [call.args[0] for call in notifier.return_value.notify.call_args_list]
+    assert urls == ["info", "alerts"]
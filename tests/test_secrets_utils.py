@@ -9,6 +9,7 @@ from config.enums import Network
 from src.utils import NoHealthyNode
 from src.utils import get_healthy_node
 from src.aws import get_secret
+from src.aws import prefetch_secrets
 
 
 def test_get_secret_happy(mocker):
@@ -93,14 +94,13 @@ def test_get_healthy_node(chain, node_key, mocker):
             )
         ),
     )
-    web3_mock = mocker.patch(
-        "src.utils.Web3",
-        return_value=MagicMock(
-            eth=MagicMock(get_block_number=MagicMock(return_value={}))
-        ),
+    pool = mocker.patch(
+        "src.utils.NodePool",
+        return_value=MagicMock(check=MagicMock(return_value=[MagicMock()])),
     )
     assert get_healthy_node(chain) is not None
-    assert web3_mock.return_value.eth.get_block_number.called
+    assert pool.call_args[0][0][0] == "secret_value"
+    assert pool.return_value.check.called
 
 
 @pytest.mark.parametrize("chain", [Network.Ethereum, Network.Polygon, Network.Fantom])
@@ -121,10 +121,55 @@ def test_get_healthy_node_no_healthy_node(chain, mocker):
         ),
     )
     mocker.patch(
-        "src.utils.Web3",
-        return_value=MagicMock(
-            eth=MagicMock(get_block_number=MagicMock(side_effect=ValueError))
-        ),
+        "src.utils.NodePool",
+        return_value=MagicMock(check=MagicMock(return_value=[])),
     )
     with pytest.raises(NoHealthyNode):
         get_healthy_node(chain)
+
+
+def test_get_secret_cached(mocker):
+    session = mocker.patch(
+        "src.aws.boto3.session.Session",
+        return_value=MagicMock(
+            client=MagicMock(
+                return_value=MagicMock(
+                    get_secret_value=MagicMock(
+                        return_value={
+                            "SecretString": '{"some_key": "a", "other_key": "b"}',
+                        }
+                    )
+                )
+            )
+        ),
+    )
+    assert get_secret("some_secret_name", "some_key") == "a"
+    assert get_secret("some_secret_name", "other_key") == "b"
+
+    client = session.return_value.client
+    assert client.call_count == 1
+    assert client.return_value.get_secret_value.call_count == 1
+
+
+def test_prefetch_secrets(mocker):
+    session = mocker.patch(
+        "src.aws.boto3.session.Session",
+        return_value=MagicMock(
+            client=MagicMock(
+                return_value=MagicMock(
+                    get_secret_value=MagicMock(
+                        side_effect=lambda SecretId: {
+                            "SecretString": json.dumps({"key": SecretId})
+                        }
+                    )
+                )
+            )
+        ),
+    )
+    prefetch_secrets(["secret_a", "secret_b", "secret_a"])
+
+    get_secret_value = session.return_value.client.return_value.get_secret_value
+    assert get_secret_value.call_count == 2
+    assert get_secret("secret_a", "key") == "secret_a"
+    assert get_secret("secret_b", "key") == "secret_b"
+    assert get_secret_value.call_count == 2
@@ -5,6 +5,7 @@ from requests import HTTPError
 from config.enums import Network
 from src.token_utils import get_token_price
 from src.token_utils import PriceNotFound
+from src.token_utils import PriceSnapshot
 
 
 @responses.activate
@@ -125,3 +126,65 @@ def test_get_token_price_not_found():
             chain=Network.Ethereum,
             use_staging=False,
         )
+
+
+@responses.activate
+def test_get_token_price_reuses_snapshot():
+    currency = "usd"
+    responses.add(
+        responses.GET,
+        f"https://api.badger.com/v2/prices?currency={currency}"
+        f"&chain={Network.Ethereum}",
+        json={
+            "0x3472a5a71965499acd81997a54bba8d852c6e53d": 8.75,
+            "0x798d1be841a82a273720ce31c822c61a67a601c3": 0,
+        },
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        f"https://staging-api.badger.com/v2/prices?currency={currency}"
+        f"&chain={Network.Ethereum}",
+        json={
+            "0x798d1be841a82a273720ce31c822c61a67a601c3": 2.5,
+        },
+        status=200,
+    )
+
+    for _ in range(3):
+        assert (
+            get_token_price(
+                "0x3472a5a71965499acd81997a54bba8d852c6e53d", currency, Network.Ethereum
+            )
+            == 8.75
+        )
+        assert (
+            get_token_price(
+                "0x798d1be841a82a273720ce31c822c61a67a601c3", currency, Network.Ethereum
+            )
+            == 2.5
+        )
+    # One download per environment
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_price_snapshot_expires():
+    currency = "usd"
+    responses.add(
+        responses.GET,
+        f"https://api.badger.com/v2/prices?currency={currency}"
+        f"&chain={Network.Ethereum}",
+        json={"0x3472a5a71965499acd81997a54bba8d852c6e53d": 8.75},
+        status=200,
+    )
+    snapshot = PriceSnapshot(ttl=0)
+
+    snapshot.get_price(
+        "0x3472a5a71965499acd81997a54bba8d852c6e53d", currency, Network.Ethereum
+    )
+    snapshot.get_price(
+        "0x3472a5a71965499acd81997a54bba8d852c6e53d", currency, Network.Ethereum
+    )
+
+    assert len(responses.calls) == 2
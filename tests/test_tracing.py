@@ -0,0 +1,66 @@
+import json
+
+import pytest
+import responses
+
+from src.rpc_metrics import rpc_context
+from src.tracing import OtlpExporter
+from src.tracing import _current_span
+from src.tracing import span
+
+
+def test_nested_spans_share_trace():
+    with span("harvest", strategy="0xA") as parent:
+        with span("build") as child:
+            pass
+
+    assert child.trace_id == parent.trace_id
+    assert child.parent_id == parent.span_id
+    assert child.attributes["strategy"] == "0xA"
+    assert parent.end_time >= child.end_time
+    assert parent.duration_ms >= 0
+
+
+def test_span_decorator_records_errors():
+    spans = []
+
+    @span("confirm")
+    def confirm():
+        spans.append(_current_span.get())
+        raise ValueError("timed out")
+
+    with pytest.raises(ValueError):
+        confirm()
+    with pytest.raises(ValueError):
+        confirm()
+
+    assert spans[0].error == "timed out"
+    # Every call gets its own span
+    assert spans[0].span_id != spans[1].span_id
+
+
+def test_span_tagged_with_rpc_strategy():
+    with rpc_context(strategy="0xB"):
+        with span("simulate") as current:
+            pass
+
+    assert current.attributes["strategy"] == "0xB"
+
+
+@responses.activate
+def test_otlp_exporter_batches_spans():
+    responses.add(responses.POST, "http://collector:4318/v1/traces", status=200)
+    exporter = OtlpExporter("http://collector:4318/", batch_size=10)
+
+    with span("send") as current:
+        pass
+    exporter.export(current)
+    exporter.flush()
+    exporter.flush()
+
+    assert len(responses.calls) == 1
+    payload = json.loads(responses.calls[0].request.body)
+    exported = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert exported[0]["name"] == "send"
+    assert exported[0]["spanId"] == current.span_id
+    assert exported[0]["status"] == {"code": 1}
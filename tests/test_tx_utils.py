@@ -5,7 +5,9 @@ from unittest.mock import MagicMock
 
 from config.constants import GAS_LIMITS
 from config.enums import Network
+from src.data_classes.gas_quote import GasQuote
 from src.tx_utils import get_gas_price
+from src.tx_utils import get_gas_quote
 from src.tx_utils import get_latest_base_fee
 from src.tx_utils import get_tx_options
 from src.tx_utils import sign_and_send_tx
@@ -34,6 +36,21 @@ def test_get_latest_base_fee_hex_fee():
     assert get_latest_base_fee(web3) == int(hex_gas, 0)
 
 
+def test_get_gas_quote_once_per_block():
+    web3 = MagicMock(
+        eth=MagicMock(
+            get_block=MagicMock(return_value={"number": 1, "baseFeePerGas": 100}),
+            fee_history=MagicMock(return_value={"reward": [[10], [20]]}),
+        )
+    )
+    quote = get_gas_quote(web3)
+    assert quote == GasQuote(block_number=1, base_fee=100, priority_fee=15, max_fee=215)
+
+    assert get_gas_quote(web3) is quote
+    assert web3.eth.get_block.call_count == 1
+    assert web3.eth.fee_history.call_count == 1
+
+
 def test_get_hash_from_failed_tx_error(mocker):
     discord = mocker.patch("src.discord_utils.send_error_to_discord")
     tx_hash = "0x123123"
@@ -135,7 +152,15 @@ def test_get_tx_options(mocker):
         "nonce": 3,
     }
 
-    mocker.patch("src.tx_utils.get_priority_fee", return_value=10000000000000000000)
+    mocker.patch(
+        "src.tx_utils.get_gas_quote",
+        return_value=GasQuote(
+            block_number=1,
+            base_fee=0,
+            priority_fee=10000000000000000000,
+            max_fee=40000000000000000000,
+        ),
+    )
     mocker.patch("src.tx_utils.get_gas_price", return_value=40000000000000000000)
 
     assert get_tx_options(web3, Network.Ethereum, HexBytes(0).hex()) == eth_options
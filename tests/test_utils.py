@@ -0,0 +1,43 @@
+import gc
+from unittest.mock import MagicMock
+
+from web3 import Web3
+
+from config.enums import Network
+from src.utils import get_abi
+from src.utils import get_contract
+
+ERC20 = "0x3472A5A71965499acd81997a54BBA8D852C6E53d"
+
+
+def test_get_abi_cached(mocker):
+    get_abi.cache_clear()
+    json_load = mocker.patch("src.utils.json.load", return_value=[])
+    get_abi(Network.Ethereum, "erc20")
+    get_abi(Network.Ethereum, "erc20")
+    assert json_load.call_count == 1
+    get_abi.cache_clear()
+
+
+def test_get_contract_reuses_factory():
+    web3 = MagicMock()
+    first = get_contract(web3, Network.Ethereum, "erc20", ERC20)
+    second = get_contract(web3, Network.Ethereum, "erc20", ERC20)
+    assert web3.eth.contract.call_count == 1
+    web3.eth.contract.return_value.assert_called_with(address=ERC20)
+    assert first is second
+
+
+def test_get_contract_outlives_callers_web3_reference():
+    web3 = Web3()
+    erc20 = get_contract(web3, Network.Ethereum, "erc20", ERC20)
+    del web3
+    gc.collect()
+    assert erc20.functions.balanceOf(ERC20)._encode_transaction_data()
+
+
+def test_get_contract_binds_address():
+    web3 = Web3()
+    erc20 = get_contract(web3, Network.Ethereum, "erc20", ERC20)
+    assert erc20.address == ERC20
+    assert erc20.abi == get_abi(Network.Ethereum, "erc20")
@@ -7,14 +7,16 @@ from web3 import exceptions
 from web3 import Web3
 
 from config.enums import Network
+from config.enums import VaultVersion
 from src.web3_utils import confirm_transaction
 from src.web3_utils import get_last_harvest_times
+from src.web3_utils import get_strategies_from_vaults_multicall
 
 
 def test_confirm_transaction():
     tx_hash = HexBytes("0x123123")
     success, tx_msg = confirm_transaction(
-        MagicMock(eth=MagicMock(wait_for_transaction_receipt=MagicMock())),
+        MagicMock(eth=MagicMock(get_transaction_receipt=MagicMock())),
         tx_hash=tx_hash,
     )
     assert success
@@ -26,12 +28,13 @@ def test_confirm_transaction_raises():
     success, tx_msg = confirm_transaction(
         MagicMock(
             eth=MagicMock(
-                wait_for_transaction_receipt=MagicMock(
-                    side_effect=exceptions.TimeExhausted
+                get_transaction_receipt=MagicMock(
+                    side_effect=exceptions.TransactionNotFound
                 )
             )
         ),
         tx_hash=tx_hash,
+        timeout=0,
     )
     assert not success
     assert (
@@ -44,8 +47,8 @@ def test_confirm_transaction_raises__max_block():
     success, tx_msg = confirm_transaction(
         MagicMock(
             eth=MagicMock(
-                wait_for_transaction_receipt=MagicMock(
-                    side_effect=exceptions.TimeExhausted
+                get_transaction_receipt=MagicMock(
+                    side_effect=exceptions.TransactionNotFound
                 ),
                 block_number=1234,
             )
@@ -57,16 +60,36 @@ def test_confirm_transaction_raises__max_block():
     assert tx_msg == f"Transaction {tx_hash.hex()} was not included in the block."
 
 
-def test_confirm_transaction_raises_unexpected():
+def test_confirm_transaction_retries_unexpected():
     tx_hash = HexBytes("0x123123")
     success, tx_msg = confirm_transaction(
         MagicMock(
-            eth=MagicMock(wait_for_transaction_receipt=MagicMock(side_effect=Exception))
+            eth=MagicMock(
+                get_transaction_receipt=MagicMock(
+                    side_effect=[Exception("node error"), {"status": 1}]
+                ),
+                block_number=1234,
+            )
+        ),
+        tx_hash=tx_hash,
+    )
+    assert success
+    assert tx_msg == f"Transaction {tx_hash.hex()} succeeded!"
+
+
+def test_confirm_transaction_unexpected_errors_time_out():
+    tx_hash = HexBytes("0x123123")
+    success, tx_msg = confirm_transaction(
+        MagicMock(
+            eth=MagicMock(get_transaction_receipt=MagicMock(side_effect=Exception))
         ),
         tx_hash=tx_hash,
+        timeout=0,
     )
     assert not success
-    assert tx_msg == f"Error waiting for {tx_hash.hex()}. Error: ."
+    assert (
+        tx_msg == f"Transaction {tx_hash.hex()} timed out, not included in block yet."
+    )
 
 
 @responses.activate
@@ -90,6 +113,7 @@ def test_get_last_harvest_times(mocker, chain, mock_scan_url):
                     "to": "0xaffb3b889E48745Ce16E90433A61f4bCb95692Fd",
                     "input": "",
                     "timeStamp": expected_timestamp,
+                    "blockNumber": "1200",
                 }
             ]
         },
@@ -116,6 +140,104 @@ def test_get_last_harvest_times(mocker, chain, mock_scan_url):
     assert times == {some_strategy: int(expected_timestamp)}
 
 
+@responses.activate
+def test_get_last_harvest_times_incremental(mocker, tmp_path):
+    mocker.patch("src.web3_utils.get_secret")
+    acl_address = "0xaffb3b889E48745Ce16E90433A61f4bCb95692Fd"
+    old_strategy = "0x111111"
+    new_strategy = "0x222222"
+    mock_scan_url = "https://api.etherscan.io/api"
+    responses.add(
+        responses.GET,
+        mock_scan_url,
+        json={
+            "result": [
+                {
+                    "to": acl_address,
+                    "input": old_strategy,
+                    "timeStamp": "100",
+                    "blockNumber": "1200",
+                }
+            ]
+        },
+    )
+    responses.add(
+        responses.GET,
+        mock_scan_url,
+        json={
+            "result": [
+                {
+                    "to": acl_address,
+                    "input": new_strategy,
+                    "timeStamp": "200",
+                    "blockNumber": "1300",
+                }
+            ]
+        },
+    )
+    web3 = MagicMock(
+        eth=MagicMock(block_number=1234),
+        toChecksumAddress=Web3.toChecksumAddress,
+    )
+    keeper_acl = MagicMock(
+        address=acl_address,
+        decode_function_input=lambda strategy: (
+            "<Function harvest(address)>",
+            {"strategy": strategy},
+        ),
+    )
+    index_path = str(tmp_path / "harvest_index.sqlite")
+
+    assert get_last_harvest_times(
+        web3, keeper_acl, start_block=1000, index_path=index_path
+    ) == {old_strategy: 100}
+
+    web3.eth.block_number = 1334
+    assert get_last_harvest_times(
+        web3, keeper_acl, start_block=1100, index_path=index_path
+    ) == {old_strategy: 100, new_strategy: 200}
+    # Only blocks since the previous run are fetched again
+    assert "startblock=1214" in responses.calls[1].request.url
+
+
+@responses.activate
+def test_get_last_harvest_times_selectors(mocker):
+    mocker.patch("src.web3_utils.get_secret")
+    acl_address = "0xaffb3b889E48745Ce16E90433A61f4bCb95692Fd"
+    harvested = "0x6D4BA00Fd7BB73b5aa5b3D6180c6f1B0c89f70D1"
+    tended = "0xd04c48A53c111300aD41190D63681ed3dAd998eC"
+    responses.add(
+        responses.GET,
+        "https://api.etherscan.io/api",
+        json={
+            "result": [
+                {
+                    "to": acl_address.lower(),
+                    "input": "0xd6d2dcf9" + "0" * 24 + tended[2:].lower(),
+                    "timeStamp": "200",
+                    "blockNumber": "1201",
+                },
+                {
+                    "to": acl_address.lower(),
+                    "input": "0x0e5c011e" + "0" * 24 + harvested[2:].lower(),
+                    "timeStamp": "100",
+                    "blockNumber": "1200",
+                },
+            ]
+        },
+    )
+    keeper_acl = MagicMock(address=acl_address)
+    times = get_last_harvest_times(
+        MagicMock(
+            eth=MagicMock(block_number=1234),
+            toChecksumAddress=Web3.toChecksumAddress,
+        ),
+        keeper_acl=keeper_acl,
+    )
+    assert times == {harvested: 100}
+    assert not keeper_acl.decode_function_input.called
+
+
 @responses.activate
 @responses.activate
 @pytest.mark.parametrize(
@@ -149,3 +271,32 @@ def test_get_last_harvest_times_empty_response(mocker, chain, mock_scan_url):
         )
         == {}
     )
+
+
+def test_get_strategies_from_vaults_multicall(mocker):
+    vault_v1 = "0xd04c48A53c111300aD41190D63681ed3dAd998eC"
+    vault_v1_5 = "0x96d4dBdc91Bef716eb407e415c9987a9fAfb8906"
+    token = "0x3472A5A71965499acd81997a54BBA8D852C6E53d"
+    controller = "0x63cF44B2548e4493Fd099222A1eC79F3344D9682"
+    strategy_v1 = "0x6D4BA00Fd7BB73b5aa5b3D6180c6f1B0c89f70D1"
+    strategy_v1_5 = "0x0c7E0807011A218d0F1A156D3965875ff233933E"
+    multicall = mocker.patch(
+        "src.web3_utils.multicall",
+        side_effect=[
+            [token, controller, strategy_v1_5],
+            [strategy_v1],
+        ],
+    )
+
+    resolved = get_strategies_from_vaults_multicall(
+        Web3(),
+        Network.Ethereum,
+        [(vault_v1, VaultVersion.v1.value), (vault_v1_5, VaultVersion.v1_5.value)],
+    )
+
+    # One round-trip for vault reads, one for controller reads
+    assert multicall.call_count == 2
+    assert [(s.address, v.address) for s, v in resolved] == [
+        (strategy_v1, vault_v1),
+        (strategy_v1_5, vault_v1_5),
+    ]